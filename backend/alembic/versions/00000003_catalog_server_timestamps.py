@@ -0,0 +1,44 @@
+"""server-side timestamp defaults for catalog tables
+
+Revision ID: 00000003
+Revises: 00000002
+Create Date: 2026-10-17
+
+- Sets a DEFAULT of the current UTC time on created_at/updated_at of the catalog
+  tables so bulk catalog loads no longer send a Python-generated timestamp with
+  every row. The columns have no time zone and previously held naive UTC, so on
+  PostgreSQL the default is now() at UTC rather than in the session TimeZone.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "00000003"
+down_revision: Union[str, Sequence[str], None] = "00000002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("dso_catalog", "asteroid_catalog", "star_catalog", "image_source_stats")
+_COLUMNS = ("created_at", "updated_at")
+
+
+def _utc_now() -> sa.TextClause:
+    """Current UTC time as a naive timestamp (SQLite's CURRENT_TIMESTAMP is already UTC)."""
+    if op.get_bind().dialect.name == "postgresql":
+        return sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    return sa.text("CURRENT_TIMESTAMP")
+
+
+def upgrade() -> None:
+    server_default = _utc_now()
+    for table in _TABLES:
+        for column in _COLUMNS:
+            op.alter_column(table, column, server_default=server_default)
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        for column in _COLUMNS:
+            op.alter_column(table, column, server_default=None)
@@ -0,0 +1,35 @@
+"""composite catalog name/number indexes
+
+Revision ID: 00000004
+Revises: 00000003
+Create Date: 2026-10-17
+
+- Replaces the single-column catalog_name and catalog_number indexes on
+  dso_catalog and star_catalog with one composite index per table, matching
+  the "NGC 224"-style lookup (WHERE catalog_name = ? AND catalog_number = ?).
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "00000004"
+down_revision: Union[str, Sequence[str], None] = "00000003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("dso_catalog", "star_catalog")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.create_index(f"ix_{table}_name_number", table, ["catalog_name", "catalog_number"])
+        op.drop_index(f"ix_{table}_catalog_name", table_name=table)
+        op.drop_index(f"ix_{table}_catalog_number", table_name=table)
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.create_index(f"ix_{table}_catalog_number", table, ["catalog_number"])
+        op.create_index(f"ix_{table}_catalog_name", table, ["catalog_name"])
+        op.drop_index(f"ix_{table}_name_number", table_name=table)
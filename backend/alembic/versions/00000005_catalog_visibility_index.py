@@ -0,0 +1,35 @@
+"""covering indexes for catalog visibility queries
+
+Revision ID: 00000005
+Revises: 00000004
+Create Date: 2026-10-17
+
+- Adds (dec_degrees, magnitude) indexes on dso_catalog and star_catalog for
+  the WHERE dec_degrees BETWEEN ? AND ? AND magnitude <= ? visibility filter.
+- The dso_catalog index INCLUDEs ra_hours, object_type and common_name so the
+  common "what's up tonight" query is answered without heap access.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "00000005"
+down_revision: Union[str, Sequence[str], None] = "00000004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_dso_catalog_dec_mag",
+        "dso_catalog",
+        ["dec_degrees", "magnitude"],
+        postgresql_include=["ra_hours", "object_type", "common_name"],
+    )
+    op.create_index("ix_star_catalog_dec_mag", "star_catalog", ["dec_degrees", "magnitude"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_star_catalog_dec_mag", table_name="star_catalog")
+    op.drop_index("ix_dso_catalog_dec_mag", table_name="dso_catalog")
@@ -0,0 +1,34 @@
+"""orbital element indexes for comet and asteroid catalogs
+
+Revision ID: 00000006
+Revises: 00000005
+Create Date: 2026-10-17
+
+- Indexes comet_catalog.epoch_jd and perihelion_time_jd for the range scans
+  done when selecting comets observable now.
+- Indexes asteroid_catalog.epoch_jd, plus (absolute_magnitude, epoch_jd) for
+  "bright enough with fresh elements" filtering.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "00000006"
+down_revision: Union[str, Sequence[str], None] = "00000005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f("ix_comet_catalog_epoch_jd"), "comet_catalog", ["epoch_jd"], unique=False)
+    op.create_index(op.f("ix_comet_catalog_perihelion_time_jd"), "comet_catalog", ["perihelion_time_jd"], unique=False)
+    op.create_index(op.f("ix_asteroid_catalog_epoch_jd"), "asteroid_catalog", ["epoch_jd"], unique=False)
+    op.create_index("ix_asteroid_catalog_mag_epoch", "asteroid_catalog", ["absolute_magnitude", "epoch_jd"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_asteroid_catalog_mag_epoch", table_name="asteroid_catalog")
+    op.drop_index(op.f("ix_asteroid_catalog_epoch_jd"), table_name="asteroid_catalog")
+    op.drop_index(op.f("ix_comet_catalog_perihelion_time_jd"), table_name="comet_catalog")
+    op.drop_index(op.f("ix_comet_catalog_epoch_jd"), table_name="comet_catalog")
@@ -0,0 +1,39 @@
+"""single-precision positions for DSO and star catalogs
+
+Revision ID: 00000007
+Revises: 00000006
+Create Date: 2026-10-17
+
+- Stores ra_hours, dec_degrees, magnitude (and DSO sizes) as REAL instead of
+  double precision. Between RA 16h and 24h a float32 step is 2^-19 h (~0.1 arcsec
+  of sky), so rounding adds at most ~0.05 arcsec. That is well below catalog
+  accuracy, and the change halves the bytes scanned by visibility queries.
+- Orbital element columns (comet/asteroid JDs) stay double precision.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "00000007"
+down_revision: Union[str, Sequence[str], None] = "00000006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = {
+    "dso_catalog": ("ra_hours", "dec_degrees", "magnitude", "size_major_arcmin", "size_minor_arcmin"),
+    "star_catalog": ("ra_hours", "dec_degrees", "magnitude"),
+}
+
+
+def upgrade() -> None:
+    for table, columns in _COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, type_=sa.REAL(), existing_type=sa.Float())
+
+
+def downgrade() -> None:
+    for table, columns in _COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, type_=sa.Float(), existing_type=sa.REAL())
@@ -0,0 +1,29 @@
+"""composite app_settings category/key index
+
+Revision ID: 00000008
+Revises: 00000007
+Create Date: 2026-10-17
+
+- Replaces the single-column category index on app_settings with a
+  (category, key) composite, so category listings are answered from one
+  index. The unique key index is unchanged.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "00000008"
+down_revision: Union[str, Sequence[str], None] = "00000007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_app_settings_category_key", "app_settings", ["category", "key"])
+    op.drop_index("ix_app_settings_category", table_name="app_settings")
+
+
+def downgrade() -> None:
+    op.create_index("ix_app_settings_category", "app_settings", ["category"])
+    op.drop_index("ix_app_settings_category_key", table_name="app_settings")
@@ -0,0 +1,43 @@
+"""unique catalog name/number indexes
+
+Revision ID: 00000009
+Revises: 00000008
+Create Date: 2026-10-17
+
+- Makes the (catalog_name, catalog_number) indexes on dso_catalog and
+  star_catalog unique, so catalog loaders can rely on
+  INSERT ... ON CONFLICT DO NOTHING instead of checking each row first.
+- Duplicate designations left by earlier loads are removed first, keeping
+  the oldest row (lowest id). No table references these rows by id.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "00000009"
+down_revision: Union[str, Sequence[str], None] = "00000008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("dso_catalog", "star_catalog")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.execute(
+            f"""
+            DELETE FROM {table} a USING {table} b
+            WHERE a.catalog_name = b.catalog_name
+              AND a.catalog_number = b.catalog_number
+              AND a.id > b.id
+            """
+        )
+        op.drop_index(f"ix_{table}_name_number", table_name=table)
+        op.create_index(f"ix_{table}_name_number", table, ["catalog_name", "catalog_number"], unique=True)
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.drop_index(f"ix_{table}_name_number", table_name=table)
+        op.create_index(f"ix_{table}_name_number", table, ["catalog_name", "catalog_number"])
@@ -7,7 +7,8 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models.settings_models import DEFAULT_SETTINGS, AppSetting, ObservingLocation, SeestarDevice
+from app.models.settings_models import AppSetting, ObservingLocation, SeestarDevice
+from app.services.settings_service import seed_default_settings
 
 router = APIRouter(prefix="/settings", tags=["settings"])
 
@@ -193,14 +194,7 @@ async def delete_setting(key: str, db: Session = Depends(get_db)):
 @router.post("/app/init")
 async def initialize_default_settings(db: Session = Depends(get_db)):
     """Initialize default settings if they don't exist."""
-    created = []
-    for setting_data in DEFAULT_SETTINGS:
-        existing = db.query(AppSetting).filter(AppSetting.key == setting_data["key"]).first()
-        if not existing:
-            db_setting = AppSetting(**setting_data)
-            db.add(db_setting)
-            created.append(setting_data["key"])
-
+    created = seed_default_settings(db)
     db.commit()
     return {"message": f"Initialized {len(created)} settings", "created": created}
 
@@ -571,13 +565,7 @@ async def get_planning_settings(db: Session = Depends(get_db)):
     }
     result = dict(defaults)
     for row in rows:
-        short = row.key.split(".", 1)[1]
-        if row.value_type == "bool":
-            result[short] = row.value.lower() == "true"
-        elif row.value_type == "int":
-            result[short] = int(row.value)
-        else:
-            result[short] = row.value
+        result[row.key.split(".", 1)[1]] = row.typed_value
     return result
 
 
@@ -1193,6 +1193,31 @@ async def check_stacking_complete():
         raise HTTPException(status_code=500, detail=f"Failed to check stacking status: {str(e)}")
 
 
+@router.get("/telescope/snapshot")
+async def get_snapshot():
+    """
+    Get coordinates, app state and stacking status in one request.
+
+    The three queries run concurrently, so a dashboard refresh costs one
+    round-trip instead of three.
+    """
+    if seestar_client is None or not seestar_client.connected:
+        raise HTTPException(status_code=400, detail="Telescope not connected")
+
+    try:
+        snapshot = await seestar_client.get_snapshot()
+        coords = snapshot["coords"]
+        return {
+            "ra_hours": coords.get("ra", 0.0),
+            "dec_degrees": coords.get("dec", 0.0),
+            "app_state": snapshot["app"],
+            "is_stacked": snapshot["stacked"],
+            "timestamp": datetime.now().isoformat(),
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get snapshot: {str(e)}")
+
+
 # ==========================================
 # VIEW PLANS (AUTOMATION)
 # ==========================================
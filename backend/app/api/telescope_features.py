@@ -318,11 +318,13 @@ async def control_dc_output(
 
 
 @router.get("/wifi/scan")
-async def scan_wifi_networks(telescope: SeestarClient = Depends(get_current_telescope)) -> Dict[str, Any]:
+async def scan_wifi_networks(
+    force_refresh: bool = False, telescope: SeestarClient = Depends(get_current_telescope)
+) -> Dict[str, Any]:
     """Scan for WiFi networks (Seestar-specific)."""
 
     try:
-        return await telescope.scan_wifi_networks()
+        return await telescope.scan_wifi_networks(force_refresh=force_refresh)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -341,11 +343,13 @@ async def connect_to_wifi(
 
 
 @router.get("/wifi/saved")
-async def list_saved_wifi_networks(telescope: SeestarClient = Depends(get_current_telescope)) -> Dict[str, Any]:
+async def list_saved_wifi_networks(
+    force_refresh: bool = False, telescope: SeestarClient = Depends(get_current_telescope)
+) -> Dict[str, Any]:
     """List saved WiFi networks (Seestar-specific)."""
 
     try:
-        return await telescope.list_saved_wifi_networks()
+        return await telescope.list_saved_wifi_networks(force_refresh=force_refresh)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -356,12 +360,14 @@ async def list_saved_wifi_networks(telescope: SeestarClient = Depends(get_curren
 
 
 @router.get("/system/info")
-async def get_system_info(telescope: SeestarClient = Depends(get_current_telescope)) -> Dict[str, Any]:
+async def get_system_info(
+    force_refresh: bool = False, telescope: SeestarClient = Depends(get_current_telescope)
+) -> Dict[str, Any]:
     """Get system information (Seestar-specific)."""
 
     try:
-        pi_info = await telescope.get_pi_info()
-        station_state = await telescope.get_station_state()
+        pi_info = await telescope.get_pi_info(force_refresh=force_refresh)
+        station_state = await telescope.get_station_state(force_refresh=force_refresh)
         return {
             "pi_info": pi_info,
             "station_state": station_state,
@@ -426,10 +432,12 @@ async def set_pi_time(unix_timestamp: int, telescope: SeestarClient = Depends(ge
 
 
 @router.get("/system/pi-info")
-async def get_pi_info(telescope: SeestarClient = Depends(get_current_telescope)) -> Dict[str, Any]:
+async def get_pi_info(
+    force_refresh: bool = False, telescope: SeestarClient = Depends(get_current_telescope)
+) -> Dict[str, Any]:
     """Get Raspberry Pi system information."""
     try:
-        info = await telescope.get_pi_info()
+        info = await telescope.get_pi_info(force_refresh=force_refresh)
         return info
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -745,10 +753,12 @@ async def remove_wifi_network(ssid: str, telescope: SeestarClient = Depends(get_
 
 
 @router.get("/wifi/station-state")
-async def get_station_state(telescope: SeestarClient = Depends(get_current_telescope)) -> Dict[str, Any]:
+async def get_station_state(
+    force_refresh: bool = False, telescope: SeestarClient = Depends(get_current_telescope)
+) -> Dict[str, Any]:
     """Get WiFi station connection state."""
     try:
-        state = await telescope.get_station_state()
+        state = await telescope.get_station_state(force_refresh=force_refresh)
         return state
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -774,6 +784,8 @@ async def set_wifi_country(
     try:
         success = await telescope.set_wifi_country(country_code)
         return _ok(success)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from typing import Any, Dict, List, Optional
+import contextlib
+import inspect
+import os
+from typing import IO, Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 
-from .types import CommandError, ConnectionError
+import aiofiles
+
+from .transport import _encode_json
+from .types import CommandError, ConnectionError, TimeoutError
 
 
 class SeestarFilesMixin:
@@ -35,52 +40,44 @@ class SeestarFilesMixin:
         # - Stacked images: typically in /mnt/seestar/stack/
         # - Raw frames: typically in /mnt/seestar/raw/
 
-        images = []
-
-        if image_type in ("stacked", "all"):
-            stack_info = await self.get_image_file_info("/mnt/seestar/stack/")
-            if "files" in stack_info:
-                for file_info in stack_info["files"]:
-                    images.append(
-                        {
-                            "filename": file_info.get("name", ""),
-                            "size": file_info.get("size", 0),
-                            "timestamp": file_info.get("timestamp", ""),
-                            "format": file_info.get("format", "fits"),
-                            "type": "stacked",
-                        }
-                    )
-
-        if image_type in ("raw", "all"):
-            raw_info = await self.get_image_file_info("/mnt/seestar/raw/")
-            if "files" in raw_info:
-                for file_info in raw_info["files"]:
-                    images.append(
-                        {
-                            "filename": file_info.get("name", ""),
-                            "size": file_info.get("size", 0),
-                            "timestamp": file_info.get("timestamp", ""),
-                            "format": file_info.get("format", "fits"),
-                            "type": "raw",
-                        }
-                    )
+        # Query the requested directories concurrently
+        directories = [
+            (kind, path)
+            for kind, path in (("stacked", "/mnt/seestar/stack/"), ("raw", "/mnt/seestar/raw/"))
+            if image_type in (kind, "all")
+        ]
+        infos = await asyncio.gather(*(self.get_image_file_info(path) for _, path in directories))
+
+        images = [
+            {
+                "filename": file_info.get("name", ""),
+                "size": file_info.get("size", 0),
+                "timestamp": file_info.get("timestamp", ""),
+                "format": file_info.get("format", "fits"),
+                "type": kind,
+            }
+            for (kind, _), info in zip(directories, infos)
+            for file_info in info.get("files", [])
+        ]
 
         self.logger.info(f"Found {len(images)} images")
         return images
 
-    async def get_stacked_image(self, filename: str) -> bytes:
+    async def get_stacked_image(self, filename: str, timeout: Optional[float] = None) -> bytes:
         """Download stacked FITS/JPEG image from telescope.
 
         Uses file transfer protocol on port 4801.
 
         Args:
             filename: Name of stacked image file to download
+            timeout: Seconds to wait for each chunk of data (default: FILE_READ_TIMEOUT)
 
         Returns:
             Raw image bytes
 
         Raises:
             ConnectionError: If file transfer connection fails
+            TimeoutError: If the transfer stalls for longer than timeout
             CommandError: If download fails
         """
         self.logger.info(f"Downloading stacked image: {filename}")
@@ -89,24 +86,26 @@ class SeestarFilesMixin:
             raise ConnectionError("Not connected to telescope")
 
         # Download file via port 4801
-        image_data = await self._download_file(f"/mnt/seestar/stack/{filename}")
+        image_data = await self._download_file(f"/mnt/seestar/stack/{filename}", timeout)
 
         self.logger.info(f"Downloaded {len(image_data)} bytes")
         return image_data
 
-    async def get_raw_frame(self, filename: str) -> bytes:
+    async def get_raw_frame(self, filename: str, timeout: Optional[float] = None) -> bytes:
         """Download individual raw frame from telescope.
 
         Uses file transfer protocol on port 4801.
 
         Args:
             filename: Name of raw frame file to download
+            timeout: Seconds to wait for each chunk of data (default: FILE_READ_TIMEOUT)
 
         Returns:
             Raw frame bytes
 
         Raises:
             ConnectionError: If file transfer connection fails
+            TimeoutError: If the transfer stalls for longer than timeout
             CommandError: If download fails
         """
         self.logger.info(f"Downloading raw frame: {filename}")
@@ -115,7 +114,7 @@ class SeestarFilesMixin:
             raise ConnectionError("Not connected to telescope")
 
         # Download file via port 4801
-        frame_data = await self._download_file(f"/mnt/seestar/raw/{filename}")
+        frame_data = await self._download_file(f"/mnt/seestar/raw/{filename}", timeout)
 
         self.logger.info(f"Downloaded {len(frame_data)} bytes")
         return frame_data
@@ -138,7 +137,7 @@ class SeestarFilesMixin:
         # Note: This requires appropriate permissions and may not be available in all firmware versions
         response = await self._send_command("pi_execute_cmd", {"cmd": f"rm {filename}"})
 
-        success = response.get("result") == 0
+        success = self._ok(response)
         self.logger.info(f"Delete {'successful' if success else 'failed'}")
         return success
 
@@ -212,19 +211,126 @@ class SeestarFilesMixin:
 
         return frame_bytes
 
-    async def _download_file(self, remote_path: str) -> bytes:
+    async def download_many(self, paths: List[str], concurrency: int = 4) -> AsyncIterator[Tuple[str, bytes]]:
+        """Download several telescope files with up to `concurrency` transfers in flight.
+
+        Each transfer uses its own connection, so per-file round-trips overlap
+        instead of adding up.
+
+        Args:
+            paths: Full paths of files on the telescope
+            concurrency: Maximum number of simultaneous transfers
+
+        Yields:
+            (path, file bytes) tuples in completion order
+
+        Raises:
+            ConnectionError: If a file transfer connection fails
+            CommandError: If a download fails
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def download(path: str) -> Tuple[str, bytes]:
+            async with semaphore:
+                return path, await self._download_file(path)
+
+        tasks = [asyncio.ensure_future(download(path)) for path in paths]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Stop outstanding transfers if the caller stops iterating or a download fails
+            for task in tasks:
+                task.cancel()
+
+    async def download_stacked_image_to(self, filename: str, dest: Union[str, os.PathLike, IO[bytes]]) -> int:
+        """Download stacked FITS/JPEG image straight to a file without buffering it in memory.
+
+        Args:
+            filename: Name of stacked image file to download
+            dest: Destination path, or a binary file object to write into
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            ConnectionError: If file transfer connection fails
+            CommandError: If download fails
+        """
+        self.logger.info(f"Downloading stacked image: {filename} -> {dest}")
+        return await self._download_file_to(f"/mnt/seestar/stack/{filename}", dest)
+
+    async def download_raw_frame_to(self, filename: str, dest: Union[str, os.PathLike, IO[bytes]]) -> int:
+        """Download individual raw frame straight to a file without buffering it in memory.
+
+        Args:
+            filename: Name of raw frame file to download
+            dest: Destination path, or a binary file object to write into
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            ConnectionError: If file transfer connection fails
+            CommandError: If download fails
+        """
+        self.logger.info(f"Downloading raw frame: {filename} -> {dest}")
+        return await self._download_file_to(f"/mnt/seestar/raw/{filename}", dest)
+
+    async def _download_file_to(self, remote_path: str, dest: Union[str, os.PathLike, IO[bytes]]) -> int:
+        """Stream a telescope file to a local path or binary file object.
+
+        A partially written destination path is removed if the transfer fails.
+        """
+        if not isinstance(dest, (str, os.PathLike)):
+            return await self._stream_file(remote_path, dest.write)
+
+        try:
+            async with aiofiles.open(dest, "wb") as f:
+                return await self._stream_file(remote_path, f.write)
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.remove(dest)
+            raise
+
+    async def _download_file(self, remote_path: str, timeout: Optional[float] = None) -> bytes:
         """Download file from telescope via port 4801.
 
         Internal method for file transfer protocol.
 
         Args:
             remote_path: Full path to file on telescope
+            timeout: Seconds to wait for each chunk of data (default: FILE_READ_TIMEOUT)
 
         Returns:
             File contents as bytes
 
         Raises:
             ConnectionError: If connection to file server fails
+            TimeoutError: If the transfer stalls for longer than timeout
+            CommandError: If file not found or transfer fails
+        """
+        chunks: List[bytes] = []
+        await self._stream_file(remote_path, chunks.append, timeout)
+        return b"".join(chunks)
+
+    async def _stream_file(
+        self, remote_path: str, sink: Callable[[bytes], Any], timeout: Optional[float] = None
+    ) -> int:
+        """Stream a file from the telescope via port 4801, passing each chunk to sink as it arrives.
+
+        Args:
+            remote_path: Full path to file on telescope
+            sink: Called with each received chunk; awaited if it returns an awaitable
+                (e.g. an aiofiles handle's write)
+            timeout: Seconds to wait for each chunk of data (default: FILE_READ_TIMEOUT)
+
+        Returns:
+            Total number of bytes received
+
+        Raises:
+            ConnectionError: If connection to file server fails
+            TimeoutError: If no data arrives for longer than timeout
             CommandError: If file not found or transfer fails
         """
         if not self._host:
@@ -233,34 +339,49 @@ class SeestarFilesMixin:
         self.logger.info(f"Opening file transfer connection to {self._host}:{self.FILE_TRANSFER_PORT}")
 
         try:
-            # Open TCP connection to file transfer port
+            # Open TCP connection to file transfer port. The connection is not pooled: the
+            # telescope marks the end of a file by closing the socket (there is no length
+            # header), so each transfer needs its own connection.
             reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(self._host, self.FILE_TRANSFER_PORT), timeout=self.CONNECTION_TIMEOUT
+                # Raise the stream buffer limit (default 64 KiB) so each read can return a full chunk
+                asyncio.open_connection(self._host, self.FILE_TRANSFER_PORT, limit=self.RECEIVE_BUFFER_SIZE),
+                timeout=self.CONNECTION_TIMEOUT,
             )
 
             # Send file request (protocol may vary - this is a basic implementation)
             # Format: JSON request with file path
-            request = json.dumps({"file": remote_path}) + "\n"
-            writer.write(request.encode("utf-8"))
+            writer.write(_encode_json({"file": remote_path}) + b"\n")
             await writer.drain()
 
-            # Read file data
-            file_data = b""
-            while True:
-                chunk = await reader.read(self.RECEIVE_BUFFER_SIZE)
-                if not chunk:
-                    break
-                file_data += chunk
-
-            writer.close()
-            await writer.wait_closed()
-
-            if not file_data:
+            # Hand file data to the sink as it arrives
+            total = 0
+            try:
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            reader.read(self.RECEIVE_BUFFER_SIZE), timeout=timeout or self.FILE_READ_TIMEOUT
+                        )
+                    except asyncio.TimeoutError:
+                        # Report progress so a caller could resume once the protocol supports ranges
+                        raise TimeoutError(f"File transfer of {remote_path} stalled after {total} bytes")
+                    if not chunk:
+                        break
+                    total += len(chunk)
+                    result = sink(chunk)
+                    if inspect.isawaitable(result):
+                        await result
+            finally:
+                writer.close()
+                await writer.wait_closed()
+
+            if not total:
                 raise CommandError(f"File not found or empty: {remote_path}")
 
-            self.logger.info(f"Downloaded {len(file_data)} bytes from {remote_path}")
-            return file_data
+            self.logger.info(f"Downloaded {total} bytes from {remote_path}")
+            return total
 
+        except TimeoutError:
+            raise
         except asyncio.TimeoutError:
             raise ConnectionError(f"Timeout connecting to file server on port {self.FILE_TRANSFER_PORT}")
         except Exception as e:
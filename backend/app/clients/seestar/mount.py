@@ -26,7 +26,7 @@ class SeestarMountMixin:
         Raises:
             CommandError: If goto command fails
         """
-        self.logger.info(f"Scope goto: RA={ra_hours}h, Dec={dec_degrees}°")
+        self.logger.info("Scope goto: RA=%sh, Dec=%s°", ra_hours, dec_degrees)
 
         params = [ra_hours, dec_degrees]
         self._update_status(state=SeestarState.SLEWING)
@@ -82,7 +82,7 @@ class SeestarMountMixin:
                 raise CommandError(error_msg)
 
         except Exception as e:
-            self.logger.error(f"Equatorial initialization failed: {e}")
+            self.logger.error("Equatorial initialization failed: %s", e)
             raise
 
     async def set_mount_mode(self, mode: MountMode) -> bool:
@@ -97,7 +97,7 @@ class SeestarMountMixin:
         Raises:
             CommandError: If mode change fails or equatorial mode not initialized
         """
-        self.logger.info(f"Setting mount mode to {mode.value}")
+        self.logger.info("Setting mount mode to %s", mode.value)
 
         if mode == MountMode.EQUATORIAL:
             if not self.status.equatorial_initialized:
@@ -133,7 +133,11 @@ class SeestarMountMixin:
         import asyncio
 
         self.logger.info(
-            f"Goto target: {target_name} at RA={ra_hours}h, Dec={dec_degrees}° (mode={self.status.mount_mode.value})"
+            "Goto target: %s at RA=%sh, Dec=%s° (mode=%s)",
+            target_name,
+            ra_hours,
+            dec_degrees,
+            self.status.mount_mode.value,
         )
 
         # CRITICAL: Cancel any active operations before movement
@@ -148,15 +152,15 @@ class SeestarMountMixin:
 
             # If actively imaging or viewing, cancel it
             if view_status == "working" or view_stage in ["ContinuousExposure", "Stacking"]:
-                self.logger.warning(f"Canceling active {view_stage} before goto")
+                self.logger.warning("Canceling active %s before goto", view_stage)
                 try:
                     await self._send_command("iscope_cancel_view", {})
                     await asyncio.sleep(1)  # Give it time to cancel
                     self.logger.info("Active operation canceled")
                 except Exception as cancel_error:
-                    self.logger.warning(f"Cancel view failed (may be OK): {cancel_error}")
+                    self.logger.warning("Cancel view failed (may be OK): %s", cancel_error)
         except Exception as e:
-            self.logger.warning(f"Could not check view state: {e}")
+            self.logger.warning("Could not check view state: %s", e)
 
         # CRITICAL: Ensure mount is in correct mode before movement
         # Check actual device state, not just our internal state
@@ -173,7 +177,7 @@ class SeestarMountMixin:
                 await self.clear_polar_alignment()
                 self.logger.info("Successfully switched to alt/az mode")
             except Exception as e:
-                self.logger.error(f"Failed to clear polar alignment: {e}")
+                self.logger.error("Failed to clear polar alignment: %s", e)
                 raise CommandError(f"Failed to switch mount to alt/az mode: {e}")
 
         # If we want equatorial mode but mount not initialized, warn
@@ -211,16 +215,14 @@ class SeestarMountMixin:
                             lat, lon, elevation = _loc.latitude, _loc.longitude, (_loc.elevation or 0)
                     except Exception:
                         pass
-                    self._observer_location = (lat, lon, elevation)
+                    # Site doesn't move, so build the (geocentric) EarthLocation only once
+                    self._observer_location = EarthLocation(lat=lat * u.deg, lon=lon * u.deg, height=elevation * u.m)
                     self.logger.debug("Observer location loaded: lat=%.4f lon=%.4f elev=%.0fm", lat, lon, elevation)
 
-                lat, lon, elevation = self._observer_location
-
                 # Convert RA/Dec to Alt/Az
                 coord = SkyCoord(ra=ra_hours * u.hourangle, dec=dec_degrees * u.deg, frame="icrs")
-                location = EarthLocation(lat=lat * u.deg, lon=lon * u.deg, height=elevation * u.m)
                 obs_time = Time(datetime.utcnow())
-                altaz_frame = AltAz(obstime=obs_time, location=location)
+                altaz_frame = AltAz(obstime=obs_time, location=self._observer_location)
                 altaz_coord = coord.transform_to(altaz_frame)
 
                 azimuth = altaz_coord.az.deg
@@ -230,7 +232,7 @@ class SeestarMountMixin:
 
                 # Check if target is above horizon
                 if altitude < 10:
-                    self.logger.warning(f"Target {target_name} is low (alt={altitude:.1f}°) - may not be visible")
+                    self.logger.warning("Target %s is low (alt=%.1f°) - may not be visible", target_name, altitude)
 
                 self._update_status(state=SeestarState.SLEWING, current_target=target_name)
                 success = await self.move_to_horizon(azimuth=azimuth, altitude=altitude)
@@ -243,7 +245,7 @@ class SeestarMountMixin:
                     return False
 
             except Exception as e:
-                self.logger.error(f"Coordinate conversion failed: {e}")
+                self.logger.error("Coordinate conversion failed: %s", e)
                 raise CommandError(f"Failed to convert coordinates: {e}")
 
         else:
@@ -270,7 +272,7 @@ class SeestarMountMixin:
                 return True
             else:
                 error_msg = f"Goto failed with result={result}, code={code}"
-                self.logger.error(f"[SLEW DIAGNOSTIC] {error_msg}")
+                self.logger.error("[SLEW DIAGNOSTIC] %s", error_msg)
                 # Common error codes from Seestar:
                 # 203 = telescope is moving
                 # 207 = fail to operate (mount not ready - needs homing/init)
@@ -312,7 +314,7 @@ class SeestarMountMixin:
             - StartSunAction.java uses mode="sun"
             RTMP stream will be available on ports 4554 (telephoto) and 4555 (wide angle)
         """
-        self.logger.info(f"Starting preview mode={mode}, brightness={brightness}")
+        self.logger.info("Starting preview mode=%s, brightness=%s", mode, brightness)
 
         # Start view with specified mode (no target required for these modes)
         params = {"mode": mode}
@@ -330,7 +332,7 @@ class SeestarMountMixin:
 
         response = await self._send_command("iscope_start_view", params)
 
-        if response.get("result") == 0:
+        if self._ok(response):
             # Start RTMP stream for live video
             # Based on StartAviRtmpCmd.java
             try:
@@ -339,9 +341,9 @@ class SeestarMountMixin:
                 if rtmp_response.get("code") == 0:
                     self.logger.info("RTMP stream started successfully")
                 else:
-                    self.logger.warning(f"RTMP stream start returned code {rtmp_response.get('code')}")
+                    self.logger.warning("RTMP stream start returned code %s", rtmp_response.get("code"))
             except Exception as e:
-                self.logger.warning(f"Failed to start RTMP stream: {e}")
+                self.logger.warning("Failed to start RTMP stream: %s", e)
                 # Don't fail the whole operation if RTMP fails
 
             # Optionally set auto-exposure brightness
@@ -351,11 +353,11 @@ class SeestarMountMixin:
                     "set_setting", {"exp_ms": None, "target_brightness": brightness, "is_auto": True}
                 )
             except Exception as e:
-                self.logger.warning(f"Failed to set AE brightness: {e}")
+                self.logger.warning("Failed to set AE brightness: %s", e)
                 # Don't fail the whole operation if brightness setting fails
 
-        self.logger.info(f"Start preview response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Start preview response: %s", response)
+        return self._ok(response)
 
     async def start_imaging(self, restart: bool = True) -> bool:
         """Start stacking/imaging.
@@ -369,7 +371,7 @@ class SeestarMountMixin:
         Raises:
             CommandError: If start imaging fails
         """
-        self.logger.info(f"Starting imaging (restart={restart})")
+        self.logger.info("Starting imaging (restart=%s)", restart)
 
         params = {"restart": restart}
 
@@ -377,12 +379,15 @@ class SeestarMountMixin:
 
         response = await self._send_command("iscope_start_stack", params)
 
-        self.logger.info(f"Start imaging response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Start imaging response: %s", response)
+        return self._ok(response)
 
-    async def stop_imaging(self) -> bool:
+    async def stop_imaging(self, wait: bool = True) -> bool:
         """Stop current imaging/stacking.
 
+        Args:
+            wait: Wait for the telescope's response; if False, send and return immediately
+
         Returns:
             True if stop successful
 
@@ -391,14 +396,16 @@ class SeestarMountMixin:
         """
         self.logger.info("Stopping imaging")
 
-        params = {"stage": "Stack"}
-
         self._update_status(state=SeestarState.TRACKING)
 
-        response = await self._send_command("iscope_stop_view", params)
+        if not wait:
+            await self._send_command_nowait("iscope_stop_view", self.STOP_STACK_PARAMS)
+            return True
+
+        response = await self._send_command("iscope_stop_view", self.STOP_STACK_PARAMS)
 
-        self.logger.info(f"Stop imaging response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Stop imaging response: %s", response)
+        return self._ok(response)
 
     async def start_record_avi(self, filename: Optional[str] = None) -> bool:
         """Start AVI video recording.
@@ -419,7 +426,7 @@ class SeestarMountMixin:
         response = await self._send_command("start_record_avi", params)
 
         if response.get("code") == 0:
-            self.logger.info(f"Video recording started: {filename or 'auto'}")
+            self.logger.info("Video recording started: %s", filename or "auto")
             return True
         else:
             error_msg = f"Failed to start video recording: {response}"
@@ -463,7 +470,7 @@ class SeestarMountMixin:
         response = await self._send_command("start_track_object", params)
 
         if response.get("code") == 0:
-            self.logger.info(f"Object tracking started: {object_type} - {object_id}")
+            self.logger.info("Object tracking started: %s - %s", object_type, object_id)
             return True
         else:
             error_msg = f"Failed to start tracking {object_type} '{object_id}': {response}"
@@ -564,7 +571,7 @@ class SeestarMountMixin:
         response = await self._send_command("iscope_start_planet_stack", params)
 
         if response.get("code") == 0:
-            self.logger.info(f"Planet stack started: {planet_name} (exp={exposure}ms, gain={gain})")
+            self.logger.info("Planet stack started: %s (exp=%sms, gain=%s)", planet_name, exposure, gain)
             return True
         else:
             error_msg = f"Failed to start planet stack: {response}"
@@ -590,9 +597,12 @@ class SeestarMountMixin:
             self.logger.error(error_msg)
             raise CommandError(error_msg)
 
-    async def stop_slew(self) -> bool:
+    async def stop_slew(self, wait: bool = True) -> bool:
         """Stop current slew/goto operation.
 
+        Args:
+            wait: Wait for the telescope's response; if False, send and return immediately
+
         Returns:
             True if stop successful
 
@@ -601,12 +611,14 @@ class SeestarMountMixin:
         """
         self.logger.info("Stopping slew")
 
-        params = {"stage": "AutoGoto"}
+        if not wait:
+            await self._send_command_nowait("iscope_stop_view", self.STOP_GOTO_PARAMS)
+            return True
 
-        response = await self._send_command("iscope_stop_view", params)
+        response = await self._send_command("iscope_stop_view", self.STOP_GOTO_PARAMS)
 
-        self.logger.info(f"Stop slew response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Stop slew response: %s", response)
+        return self._ok(response)
 
     async def auto_focus(self) -> bool:
         """Perform automatic focusing.
@@ -623,8 +635,8 @@ class SeestarMountMixin:
 
         response = await self._send_command("start_auto_focuse")
 
-        self.logger.info(f"Auto focus response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Auto focus response: %s", response)
+        return self._ok(response)
 
     async def park(self, equ_mode: bool = True) -> bool:
         """Park telescope at home position.
@@ -643,15 +655,15 @@ class SeestarMountMixin:
             CommandError: If park command fails
         """
         mode_str = "equatorial" if equ_mode else "alt/az"
-        self.logger.info(f"Parking telescope in {mode_str} mode")
+        self.logger.info("Parking telescope in %s mode", mode_str)
 
         self._update_status(state=SeestarState.PARKING)
 
         # Park telescope with specified mode
         response = await self._send_command("scope_park", {"equ_mode": equ_mode})
 
-        self.logger.info(f"Park response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Park response: %s", response)
+        return self._ok(response)
 
     async def is_equatorial_mode(self) -> bool:
         """Check if telescope is in equatorial tracking mode.
@@ -670,10 +682,10 @@ class SeestarMountMixin:
             # The exact field name may vary - checking common possibilities
             is_equ = mount.get("is_equ", mount.get("equ_mode", mount.get("tracking_mode") == "equatorial"))
 
-            self.logger.debug(f"Mount mode check: is_equatorial={is_equ}, mount state={mount}")
+            self.logger.debug("Mount mode check: is_equatorial=%s, mount state=%s", is_equ, mount)
             return bool(is_equ)
         except Exception as e:
-            self.logger.warning(f"Could not determine mount mode, assuming alt/az: {e}")
+            self.logger.warning("Could not determine mount mode, assuming alt/az: %s", e)
             # Default to alt/az mode if we can't determine
             return False
 
@@ -710,12 +722,11 @@ class SeestarMountMixin:
             raise ValueError(f"Invalid action '{action}'. Must be one of: {valid_actions}")
 
         # Handle stop/abort actions directly
-        # Firmware expects a JSON array ["none"], not a string or dict (code 105 otherwise)
         if action in ["stop", "abort"]:
-            self.logger.info(f"Scope move: {action}")
-            response = await self._send_command("scope_move", ["none"])
-            self.logger.info(f"Scope move response: {response}")
-            return response.get("result") == 0
+            self.logger.info("Scope move: %s", action)
+            response = await self._send_command("scope_move", self.SCOPE_MOVE_STOP_PARAMS)
+            self.logger.info("Scope move response: %s", response)
+            return self._ok(response)
 
         # Handle directional movement using scope_speed_move command
         if action in ["up", "down", "left", "right"]:
@@ -742,23 +753,25 @@ class SeestarMountMixin:
                 percent = int(min(100, max(1, percent)))
             effective_dur = dur_sec if dur_sec is not None else 3
 
-            self.logger.info(f"Directional move {action}: angle={angle}°, percent={percent}, dur_sec={effective_dur}")
+            self.logger.info(
+                "Directional move %s: angle=%s°, percent=%s, dur_sec=%s", action, angle, percent, effective_dur
+            )
 
             params = {"angle": angle, "percent": percent, "level": 1, "dur_sec": effective_dur}
 
             response = await self._send_command("scope_speed_move", params)
-            return response.get("result") == 0
+            return self._ok(response)
 
         # Handle explicit slew action with coordinates
         else:
             if ra is None or dec is None:
                 raise ValueError("RA and Dec required for slew action")
             params = {"action": action, "ra": ra, "dec": dec}
-            self.logger.info(f"Scope move: {action} with params {params}")
+            self.logger.info("Scope move: %s with params %s", action, params)
             response = await self._send_command("scope_move", params)
 
-        self.logger.info(f"Scope move response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Scope move response: %s", response)
+        return self._ok(response)
 
     async def get_device_state(self, keys: Optional[list] = None) -> Dict[str, Any]:
         """Get current device state.
@@ -774,7 +787,7 @@ class SeestarMountMixin:
         """
         params = {"keys": keys} if keys else {}
 
-        response = await self._send_command("get_device_state", params)
+        response = await self._send_poll_command("get_device_state", params)
 
         result = response.get("result", {})
 
@@ -806,14 +819,11 @@ class SeestarMountMixin:
         Raises:
             CommandError: If setting fails
         """
-        self.logger.info(f"Setting exposure: stack={stack_exposure_ms}ms, continuous={continuous_exposure_ms}ms")
-
-        params = {"exp_ms": {"stack_l": stack_exposure_ms, "continuous": continuous_exposure_ms}}
-
-        response = await self._send_command("set_setting", params)
+        self.logger.info("Setting exposure: stack=%sms, continuous=%sms", stack_exposure_ms, continuous_exposure_ms)
 
-        self.logger.info(f"Set exposure response: {response}")
-        return response.get("result") == 0
+        return await self.apply_settings(
+            exposure={"stack_exposure_ms": stack_exposure_ms, "continuous_exposure_ms": continuous_exposure_ms}
+        )
 
     async def configure_dither(self, enabled: bool = True, pixels: int = 50, interval: int = 10) -> bool:
         """Configure dithering settings.
@@ -829,11 +839,6 @@ class SeestarMountMixin:
         Raises:
             CommandError: If setting fails
         """
-        self.logger.info(f"Configuring dither: enabled={enabled}, pixels={pixels}, interval={interval}")
-
-        params = {"stack_dither": {"enable": enabled, "pix": pixels, "interval": interval}}
-
-        response = await self._send_command("set_setting", params)
+        self.logger.info("Configuring dither: enabled=%s, pixels=%s, interval=%s", enabled, pixels, interval)
 
-        self.logger.info(f"Configure dither response: {response}")
-        return response.get("result") == 0
+        return await self.apply_settings(dither={"enabled": enabled, "pixels": pixels, "interval": interval})
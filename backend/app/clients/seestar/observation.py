@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import asyncio
+from typing import Any, Dict, Optional
 
 from .types import SeestarState
 
+# Status implied by the app-state stage. stage=None or "Idle" means the telescope is
+# idle/ready (overridden to PARKED by get_device_state if mount.close=True)
+_STAGE_TO_STATE = {
+    "AutoGoto": SeestarState.SLEWING,
+    "AutoFocus": SeestarState.FOCUSING,
+    "Stack": SeestarState.IMAGING,
+    "ScopeHome": SeestarState.PARKING,
+    "Idle": SeestarState.TRACKING,
+    None: SeestarState.TRACKING,
+}
+
 
 class SeestarObservationMixin:
     """Mixin providing real-time observation and sequencing commands."""
@@ -23,7 +35,7 @@ class SeestarObservationMixin:
         Raises:
             CommandError: If query fails
         """
-        response = await self._send_command("scope_get_equ_coord", {})
+        response = await self._send_poll_command("scope_get_equ_coord", {})
 
         result = response.get("result", {})
 
@@ -49,24 +61,14 @@ class SeestarObservationMixin:
         Raises:
             CommandError: If query fails
         """
-        response = await self._send_command("iscope_get_app_state", {})
+        response = await self._send_poll_command("iscope_get_app_state", {})
 
         result = response.get("result", {})
 
         # Update internal status based on stage
-        stage = result.get("stage")
-        if stage == "AutoGoto":
-            self._update_status(state=SeestarState.SLEWING)
-        elif stage == "AutoFocus":
-            self._update_status(state=SeestarState.FOCUSING)
-        elif stage == "Stack":
-            self._update_status(state=SeestarState.IMAGING)
-        elif stage == "ScopeHome":
-            self._update_status(state=SeestarState.PARKING)
-        elif stage == "Idle" or stage is None:
-            # stage=None or "Idle" means telescope is idle/ready
-            # Will be overridden to PARKED by get_device_state if mount.close=True
-            self._update_status(state=SeestarState.TRACKING)
+        state = _STAGE_TO_STATE.get(result.get("stage"))
+        if state is not None:
+            self._update_status(state=state)
 
         return result
 
@@ -79,10 +81,25 @@ class SeestarObservationMixin:
         Raises:
             CommandError: If query fails
         """
-        response = await self._send_command("is_stacked", {})
+        response = await self._send_poll_command("is_stacked", {})
 
         return response.get("result", {}).get("is_stacked", False)
 
+    async def get_snapshot(self) -> Dict[str, Any]:
+        """Get coordinates, app state and stacking status in one concurrent round-trip.
+
+        Returns:
+            Dict with 'coords' (see get_current_coordinates), 'app' (see
+            get_app_state) and 'stacked' (see check_stacking_complete)
+
+        Raises:
+            CommandError: If any query fails
+        """
+        coords, app, stacked = await asyncio.gather(
+            self.get_current_coordinates(), self.get_app_state(), self.check_stacking_complete()
+        )
+        return {"coords": coords, "app": app, "stacked": stacked}
+
     async def get_plate_solve_result(self) -> Dict[str, Any]:
         """Get plate solving result.
 
@@ -138,12 +155,12 @@ class SeestarObservationMixin:
         Raises:
             CommandError: If plan start fails
         """
-        self.logger.info(f"Starting view plan: {plan_config}")
+        self.logger.info("Starting view plan: %s", plan_config)
 
         response = await self._send_command("start_view_plan", plan_config)
 
-        self.logger.info(f"Start view plan response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Start view plan response: %s", response)
+        return self._ok(response)
 
     async def stop_view_plan(self) -> bool:
         """Stop/cancel running observation plan.
@@ -158,8 +175,8 @@ class SeestarObservationMixin:
 
         response = await self._send_command("stop_view_plan", {})
 
-        self.logger.info(f"Stop view plan response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Stop view plan response: %s", response)
+        return self._ok(response)
 
     async def get_view_plan_state(self) -> Dict[str, Any]:
         """Get current view plan execution state.
@@ -179,7 +196,7 @@ class SeestarObservationMixin:
         # Fixed: Use correct command name from MainCameraConstants.java
         # Was using "get_view_plan_state" (doesn't exist)
         # Correct command is "get_view_state" (line 136 in MainCameraConstants.java)
-        response = await self._send_command("get_view_state", {})
+        response = await self._send_poll_command("get_view_state", {})
 
         return response.get("result", {})
 
@@ -203,7 +220,7 @@ class SeestarObservationMixin:
         Raises:
             CommandError: If start fails
         """
-        self.logger.info(f"Starting planet scan: {planet_name}, exp={exposure_ms}ms, gain={gain}")
+        self.logger.info("Starting planet scan: %s, exp=%sms, gain=%s", planet_name, exposure_ms, gain)
 
         params = {
             "planet": planet_name,
@@ -213,8 +230,8 @@ class SeestarObservationMixin:
 
         response = await self._send_command("start_scan_planet", params)
 
-        self.logger.info(f"Start planet scan response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Start planet scan response: %s", response)
+        return self._ok(response)
 
     async def configure_planetary_imaging(
         self,
@@ -235,21 +252,13 @@ class SeestarObservationMixin:
         Raises:
             CommandError: If setting fails
         """
-        self.logger.info(f"Configuring planetary imaging: frames={frame_count}, save={save_frames}, denoise={denoise}")
-
-        params = {
-            "stack": {
-                "capt_type": "planet",
-                "capt_num": frame_count,
-                "save_discrete_frame": save_frames,
-                "wide_denoise": denoise,
-            }
-        }
-
-        response = await self._send_command("set_setting", params)
+        self.logger.info(
+            "Configuring planetary imaging: frames=%s, save=%s, denoise=%s", frame_count, save_frames, denoise
+        )
 
-        self.logger.info(f"Configure planetary imaging response: {response}")
-        return response.get("result") == 0
+        return await self.apply_settings(
+            planetary={"frame_count": frame_count, "save_frames": save_frames, "denoise": denoise}
+        )
 
     # ========================================================================
     # Phase 4: Enhanced Control
@@ -270,7 +279,7 @@ class SeestarObservationMixin:
         Raises:
             CommandError: If slew command fails
         """
-        self.logger.info(f"Slewing to RA={ra_hours}h, Dec={dec_degrees}°")
+        self.logger.info("Slewing to RA=%sh, Dec=%s°", ra_hours, dec_degrees)
 
         params = {"action": "slew", "ra": ra_hours, "dec": dec_degrees}
 
@@ -278,14 +287,17 @@ class SeestarObservationMixin:
 
         response = await self._send_command("scope_move", params)
 
-        self.logger.info(f"Slew response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Slew response: %s", response)
+        return self._ok(response)
 
-    async def stop_telescope_movement(self) -> bool:
+    async def stop_telescope_movement(self, wait: bool = True) -> bool:
         """Stop any telescope movement immediately.
 
         Emergency stop for mount movement.
 
+        Args:
+            wait: Wait for the telescope's response; if False, send and return immediately
+
         Returns:
             True if stop successful
 
@@ -294,11 +306,14 @@ class SeestarObservationMixin:
         """
         self.logger.info("Stopping telescope movement")
 
-        # Firmware expects a JSON array ["none"], not a string or dict (code 105 otherwise)
-        response = await self._send_command("scope_move", ["none"])
+        if not wait:
+            await self._send_command_nowait("scope_move", self.SCOPE_MOVE_STOP_PARAMS)
+            return True
+
+        response = await self._send_command("scope_move", self.SCOPE_MOVE_STOP_PARAMS)
 
-        self.logger.info(f"Stop movement response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Stop movement response: %s", response)
+        return self._ok(response)
 
     async def move_focuser_to_position(self, position: int) -> bool:
         """Move focuser to specific position.
@@ -312,7 +327,7 @@ class SeestarObservationMixin:
         Raises:
             CommandError: If move fails
         """
-        self.logger.info(f"Moving focuser to position {position}")
+        self.logger.info("Moving focuser to position %s", position)
 
         params = {"step": position}
 
@@ -320,8 +335,8 @@ class SeestarObservationMixin:
 
         response = await self._send_command("move_focuser", params)
 
-        self.logger.info(f"Move focuser response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Move focuser response: %s", response)
+        return self._ok(response)
 
     async def move_focuser_relative(self, offset: int) -> bool:
         """Move focuser by relative offset.
@@ -338,7 +353,7 @@ class SeestarObservationMixin:
         Raises:
             CommandError: If move fails
         """
-        self.logger.info(f"Moving focuser by relative offset {offset}")
+        self.logger.info("Moving focuser by relative offset %s", offset)
 
         # Firmware accepts absolute "step" value only; fetch current position first
         pos_response = await self._send_command("get_focuser_position", {})
@@ -347,7 +362,7 @@ class SeestarObservationMixin:
             current_pos = current_pos.get("step", 0)
 
         target = int(current_pos) + offset
-        self.logger.info(f"Focuser: current={current_pos}, target={target}")
+        self.logger.info("Focuser: current=%s, target=%s", current_pos, target)
 
         params = {"step": target, "ret_step": True}
 
@@ -355,12 +370,15 @@ class SeestarObservationMixin:
 
         response = await self._send_command("move_focuser", params)
 
-        self.logger.info(f"Move focuser response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Move focuser response: %s", response)
+        return self._ok(response)
 
-    async def stop_autofocus(self) -> bool:
+    async def stop_autofocus(self, wait: bool = True) -> bool:
         """Stop autofocus operation.
 
+        Args:
+            wait: Wait for the telescope's response; if False, send and return immediately
+
         Returns:
             True if stop successful
 
@@ -369,10 +387,14 @@ class SeestarObservationMixin:
         """
         self.logger.info("Stopping autofocus")
 
+        if not wait:
+            await self._send_command_nowait("stop_auto_focuse", {})
+            return True
+
         response = await self._send_command("stop_auto_focuse", {})
 
-        self.logger.info(f"Stop autofocus response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Stop autofocus response: %s", response)
+        return self._ok(response)
 
     async def configure_advanced_stacking(
         self,
@@ -396,23 +418,21 @@ class SeestarObservationMixin:
             CommandError: If setting fails
         """
         self.logger.info(
-            f"Configuring advanced stacking: dbe={dark_background_extraction}, "
-            f"star_corr={star_correction}, airplane={airplane_removal}, drizzle={drizzle_2x}"
+            "Configuring advanced stacking: dbe=%s, star_corr=%s, airplane=%s, drizzle=%s",
+            dark_background_extraction,
+            star_correction,
+            airplane_removal,
+            drizzle_2x,
         )
 
-        params = {
-            "stack": {
-                "dbe": dark_background_extraction,
+        return await self.apply_settings(
+            advanced={
+                "dark_background_extraction": dark_background_extraction,
                 "star_correction": star_correction,
-                "airplane_line_removal": airplane_removal,
-                "drizzle2x": drizzle_2x,
+                "airplane_removal": airplane_removal,
+                "drizzle_2x": drizzle_2x,
             }
-        }
-
-        response = await self._send_command("set_setting", params)
-
-        self.logger.info(f"Configure advanced stacking response: {response}")
-        return response.get("result") == 0
+        )
 
     async def set_manual_exposure(self, exposure_ms: float, gain: float) -> bool:
         """Set manual exposure and gain.
@@ -427,18 +447,9 @@ class SeestarObservationMixin:
         Raises:
             CommandError: If setting fails
         """
-        self.logger.info(f"Setting manual exposure: {exposure_ms}ms, gain={gain}")
+        self.logger.info("Setting manual exposure: %sms, gain=%s", exposure_ms, gain)
 
-        params = {
-            "manual_exp": True,
-            "isp_exp_ms": exposure_ms,
-            "isp_gain": gain,
-        }
-
-        response = await self._send_command("set_setting", params)
-
-        self.logger.info(f"Set manual exposure response: {response}")
-        return response.get("result") == 0
+        return await self.apply_settings(manual_exp={"exposure_ms": exposure_ms, "gain": gain})
 
     async def set_auto_exposure(self, brightness_target: float = 50.0) -> bool:
         """Enable auto exposure with brightness target.
@@ -452,14 +463,127 @@ class SeestarObservationMixin:
         Raises:
             CommandError: If setting fails
         """
-        self.logger.info(f"Setting auto exposure: brightness={brightness_target}%")
+        self.logger.info("Setting auto exposure: brightness=%s%%", brightness_target)
 
-        params = {
-            "manual_exp": False,
-            "ae_bri_percent": brightness_target,
+        return await self.apply_settings(auto_exp={"brightness_target": brightness_target})
+
+    # ========================================================================
+    # Batched settings
+    # ========================================================================
+
+    @staticmethod
+    def _exposure_settings(stack_exposure_ms: int = 10000, continuous_exposure_ms: int = 500) -> Dict[str, Any]:
+        """Build set_setting params for set_exposure()."""
+        return {"exp_ms": {"stack_l": stack_exposure_ms, "continuous": continuous_exposure_ms}}
+
+    @staticmethod
+    def _dither_settings(enabled: bool = True, pixels: int = 50, interval: int = 10) -> Dict[str, Any]:
+        """Build set_setting params for configure_dither()."""
+        return {"stack_dither": {"enable": enabled, "pix": pixels, "interval": interval}}
+
+    @staticmethod
+    def _planetary_settings(frame_count: int = 1000, save_frames: bool = True, denoise: bool = True) -> Dict[str, Any]:
+        """Build set_setting params for configure_planetary_imaging()."""
+        return {
+            "stack": {
+                "capt_type": "planet",
+                "capt_num": frame_count,
+                "save_discrete_frame": save_frames,
+                "wide_denoise": denoise,
+            }
         }
 
+    @staticmethod
+    def _advanced_stacking_settings(
+        dark_background_extraction: bool = False,
+        star_correction: bool = True,
+        airplane_removal: bool = False,
+        drizzle_2x: bool = False,
+    ) -> Dict[str, Any]:
+        """Build set_setting params for configure_advanced_stacking()."""
+        return {
+            "stack": {
+                "dbe": dark_background_extraction,
+                "star_correction": star_correction,
+                "airplane_line_removal": airplane_removal,
+                "drizzle2x": drizzle_2x,
+            }
+        }
+
+    @staticmethod
+    def _manual_exposure_settings(exposure_ms: float, gain: float) -> Dict[str, Any]:
+        """Build set_setting params for set_manual_exposure()."""
+        return {"manual_exp": True, "isp_exp_ms": exposure_ms, "isp_gain": gain}
+
+    @staticmethod
+    def _auto_exposure_settings(brightness_target: float = 50.0) -> Dict[str, Any]:
+        """Build set_setting params for set_auto_exposure()."""
+        return {"manual_exp": False, "ae_bri_percent": brightness_target}
+
+    async def apply_settings(
+        self,
+        *,
+        exposure: Optional[Dict[str, Any]] = None,
+        dither: Optional[Dict[str, Any]] = None,
+        planetary: Optional[Dict[str, Any]] = None,
+        advanced: Optional[Dict[str, Any]] = None,
+        manual_exp: Optional[Dict[str, Any]] = None,
+        auto_exp: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Apply several camera/stacking settings with a single set_setting command.
+
+        Each argument takes the keyword arguments of the corresponding single-purpose
+        method (set_exposure, configure_dither, configure_planetary_imaging,
+        configure_advanced_stacking, set_manual_exposure, set_auto_exposure).
+        Sections sharing a key (planetary and advanced both set "stack") are merged.
+
+        Args:
+            exposure: set_exposure() arguments
+            dither: configure_dither() arguments
+            planetary: configure_planetary_imaging() arguments
+            advanced: configure_advanced_stacking() arguments
+            manual_exp: set_manual_exposure() arguments
+            auto_exp: set_auto_exposure() arguments
+
+        Returns:
+            True if settings applied successfully
+
+        Raises:
+            ValueError: If no settings are given, or both manual and auto exposure are
+            CommandError: If setting fails
+
+        Example:
+            await client.apply_settings(
+                exposure={"stack_exposure_ms": 10000},
+                dither={"enabled": True, "pixels": 50, "interval": 10},
+            )
+        """
+        if manual_exp is not None and auto_exp is not None:
+            raise ValueError("Cannot apply manual and auto exposure together")
+
+        sections = (
+            (exposure, self._exposure_settings),
+            (dither, self._dither_settings),
+            (planetary, self._planetary_settings),
+            (advanced, self._advanced_stacking_settings),
+            (manual_exp, self._manual_exposure_settings),
+            (auto_exp, self._auto_exposure_settings),
+        )
+
+        params: Dict[str, Any] = {}
+        for section_args, build in sections:
+            if section_args is None:
+                continue
+            for key, value in build(**section_args).items():
+                if isinstance(value, dict) and isinstance(params.get(key), dict):
+                    params[key] = {**params[key], **value}
+                else:
+                    params[key] = value
+
+        if not params:
+            raise ValueError("No settings given")
+
         response = await self._send_command("set_setting", params)
 
-        self.logger.info(f"Set auto exposure response: {response}")
-        return response.get("result") == 0
+        self.logger.info("Apply settings response: %s", response)
+        return self._ok(response)
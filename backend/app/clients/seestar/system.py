@@ -2,10 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from .types import SeestarState
 
+# ISO 3166-1 alpha-2 codes accepted as WiFi regulatory countries; anything else is rejected
+# locally instead of costing a round-trip for the telescope to refuse it
+_WIFI_COUNTRY_CODES = frozenset(
+    (
+        "AD AE AF AG AI AL AM AO AQ AR AS AT AU AW AX AZ BA BB BD BE BF BG BH BI BJ BL BM BN BO BQ BR BS "
+        "BT BV BW BY BZ CA CC CD CF CG CH CI CK CL CM CN CO CR CU CV CW CX CY CZ DE DJ DK DM DO DZ EC EE "
+        "EG EH ER ES ET FI FJ FK FM FO FR GA GB GD GE GF GG GH GI GL GM GN GP GQ GR GS GT GU GW GY HK HM "
+        "HN HR HT HU ID IE IL IM IN IO IQ IR IS IT JE JM JO JP KE KG KH KI KM KN KP KR KW KY KZ LA LB LC "
+        "LI LK LR LS LT LU LV LY MA MC MD ME MF MG MH MK ML MM MN MO MP MQ MR MS MT MU MV MW MX MY MZ NA "
+        "NC NE NF NG NI NL NO NP NR NU NZ OM PA PE PF PG PH PK PL PM PN PR PS PT PW PY QA RE RO RS RU RW "
+        "SA SB SC SD SE SG SH SI SJ SK SL SM SN SO SR SS ST SV SX SY SZ TC TD TF TG TH TJ TK TL TM TN TO "
+        "TR TT TV TW TZ UA UG UM US UY UZ VA VC VE VG VI VN VU WF WS YE YT ZA ZM ZW"
+    ).split()
+)
+
 
 class SeestarSystemMixin:
     """Mixin providing system management and hardware control commands."""
@@ -25,10 +40,7 @@ class SeestarSystemMixin:
         """
         self.logger.info("Initiating telescope shutdown")
 
-        response = await self._send_command("pi_shutdown", {})
-
-        self.logger.info(f"Shutdown response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("pi_shutdown", {}, "Shutdown")
 
     async def reboot_telescope(self) -> bool:
         """Reboot the telescope.
@@ -41,10 +53,7 @@ class SeestarSystemMixin:
         """
         self.logger.info("Initiating telescope reboot")
 
-        response = await self._send_command("pi_reboot", {})
-
-        self.logger.info(f"Reboot response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("pi_reboot", {}, "Reboot")
 
     async def play_notification_sound(self, volume: str = "backyard") -> bool:
         """Play notification sound on telescope.
@@ -58,14 +67,11 @@ class SeestarSystemMixin:
         Raises:
             CommandError: If play fails
         """
-        self.logger.info(f"Playing notification sound at volume: {volume}")
+        self.logger.info("Playing notification sound at volume: %s", volume)
 
         params = {"volume": volume}
 
-        response = await self._send_command("play_sound", params)
-
-        self.logger.info(f"Play sound response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("play_sound", params, "Play sound")
 
     async def get_image_file_info(self, file_path: str = "") -> Dict[str, Any]:
         """Get information about captured image files.
@@ -86,11 +92,14 @@ class SeestarSystemMixin:
 
         return response.get("result", {})
 
-    async def cancel_current_operation(self) -> bool:
+    async def cancel_current_operation(self, wait: bool = True) -> bool:
         """Cancel current view/operation.
 
         Alternative to stop commands.
 
+        Args:
+            wait: Wait for the telescope's response; if False, send and return immediately
+
         Returns:
             True if cancel successful
 
@@ -99,10 +108,11 @@ class SeestarSystemMixin:
         """
         self.logger.info("Canceling current operation")
 
-        response = await self._send_command("iscope_cancel_view", {})
+        if not wait:
+            await self._send_command_nowait("iscope_cancel_view", {})
+            return True
 
-        self.logger.info(f"Cancel operation response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("iscope_cancel_view", {}, "Cancel operation")
 
     async def set_location(self, longitude: float, latitude: float) -> bool:
         """Set user location for telescope calculations.
@@ -117,15 +127,12 @@ class SeestarSystemMixin:
         Raises:
             CommandError: If setting fails
         """
-        self.logger.info(f"Setting location: lon={longitude}, lat={latitude}")
+        self.logger.info("Setting location: lon=%s, lat=%s", longitude, latitude)
 
         # Upstream seestar_alp uses separate lat/lon keys with force=True
         params = {"lat": latitude, "lon": longitude, "force": True}
 
-        response = await self._send_command("set_user_location", params)
-
-        self.logger.info(f"Set location response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("set_user_location", params, "Set location")
 
     async def move_to_horizon(self, azimuth: float, altitude: float) -> bool:
         """Move telescope to horizon coordinates.
@@ -140,7 +147,7 @@ class SeestarSystemMixin:
         Raises:
             CommandError: If move fails
         """
-        self.logger.info(f"Moving to horizon: az={azimuth}°, alt={altitude}°")
+        self.logger.info("Moving to horizon: az=%s°, alt=%s°", azimuth, altitude)
 
         params = {"azimuth": azimuth, "altitude": altitude}
 
@@ -151,7 +158,7 @@ class SeestarSystemMixin:
         self.logger.debug(
             "scope_move_to_horizon response: result=%s code=%s", response.get("result"), response.get("code")
         )
-        success = response.get("result") == 0
+        success = self._ok(response)
         return success
 
     async def reset_focuser_to_factory(self) -> bool:
@@ -165,10 +172,7 @@ class SeestarSystemMixin:
         """
         self.logger.info("Resetting focuser to factory position")
 
-        response = await self._send_command("reset_factory_focal_pos", {})
-
-        self.logger.info(f"Reset focuser response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("reset_factory_focal_pos", {}, "Reset focuser")
 
     async def check_polar_alignment(self) -> Dict[str, Any]:
         """Check polar alignment quality.
@@ -196,10 +200,7 @@ class SeestarSystemMixin:
         """
         self.logger.info("Clearing polar alignment")
 
-        response = await self._send_command("clear_polar_align", {})
-
-        self.logger.info(f"Clear polar alignment response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("clear_polar_align", {}, "Clear polar alignment")
 
     async def start_compass_calibration(self) -> bool:
         """Start compass calibration procedure.
@@ -212,10 +213,7 @@ class SeestarSystemMixin:
         """
         self.logger.info("Starting compass calibration")
 
-        response = await self._send_command("start_compass_calibration", {})
-
-        self.logger.info(f"Start compass calibration response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("start_compass_calibration", {}, "Start compass calibration")
 
     async def stop_compass_calibration(self) -> bool:
         """Stop compass calibration procedure.
@@ -228,10 +226,7 @@ class SeestarSystemMixin:
         """
         self.logger.info("Stopping compass calibration")
 
-        response = await self._send_command("stop_compass_calibration", {})
-
-        self.logger.info(f"Stop compass calibration response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("stop_compass_calibration", {}, "Stop compass calibration")
 
     async def get_compass_state(self) -> Dict[str, Any]:
         """Get compass heading and calibration state.
@@ -242,13 +237,13 @@ class SeestarSystemMixin:
         Returns:
             Dict with at minimum a 'heading' field (degrees 0-360).
         """
-        response = await self._send_command("get_device_state", {})
+        response = await self._send_poll_command("get_device_state", {})
         result = response.get("result", {})
         if "compass_sensor" in result:
             sensor = result["compass_sensor"]
             return sensor.get("data", sensor)
         # Fall back to dedicated command if key is absent
-        response = await self._send_command("get_compass_state", {})
+        response = await self._send_poll_command("get_compass_state", {})
         return response.get("result", {})
 
     async def start_leveling(self) -> bool:
@@ -263,7 +258,7 @@ class SeestarSystemMixin:
         """
         self.logger.info("Activating IMU leveling mode")
         response = await self._send_command("start_gsensor_calibration")
-        self.logger.info(f"start_leveling (start_gsensor_calibration) response: {response}")
+        self.logger.info("start_leveling (start_gsensor_calibration) response: %s", response)
         return response.get("code") == 0
 
     async def get_balance_sensor(self) -> Dict[str, Any]:
@@ -275,7 +270,7 @@ class SeestarSystemMixin:
         Raises:
             CommandError: If query fails
         """
-        response = await self._send_command("get_device_state", {})
+        response = await self._send_poll_command("get_device_state", {})
         result = response.get("result", {})
         for key in ("balance_sensor", "balance", "imu", "gsensor", "accelerometer"):
             if key in result:
@@ -298,7 +293,7 @@ class SeestarSystemMixin:
         """
         self.logger.info("Starting G-sensor calibration")
         response = await self._send_command("start_gsensor_calibration")
-        self.logger.info(f"start_gsensor_calibration response: {response}")
+        self.logger.info("start_gsensor_calibration response: %s", response)
         return response.get("code") == 0
 
     # ========================================================================
@@ -319,14 +314,11 @@ class SeestarSystemMixin:
         Raises:
             CommandError: If join fails
         """
-        self.logger.info(f"Joining remote session: {session_id}")
+        self.logger.info("Joining remote session: %s", session_id)
 
         params = {"session_id": session_id} if session_id else {}
 
-        response = await self._send_command("remote_join", params)
-
-        self.logger.info(f"Join remote session response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("remote_join", params, "Join remote session")
 
     async def leave_remote_session(self) -> bool:
         """Leave current remote session.
@@ -339,10 +331,7 @@ class SeestarSystemMixin:
         """
         self.logger.info("Leaving remote session")
 
-        response = await self._send_command("remote_disjoin", {})
-
-        self.logger.info(f"Leave remote session response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("remote_disjoin", {}, "Leave remote session")
 
     async def disconnect_remote_client(self, client_id: str = "") -> bool:
         """Disconnect a remote client.
@@ -356,14 +345,11 @@ class SeestarSystemMixin:
         Raises:
             CommandError: If disconnect fails
         """
-        self.logger.info(f"Disconnecting remote client: {client_id}")
+        self.logger.info("Disconnecting remote client: %s", client_id)
 
         params = {"client_id": client_id} if client_id else {}
 
-        response = await self._send_command("remote_disconnect", params)
-
-        self.logger.info(f"Disconnect remote client response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("remote_disconnect", params, "Disconnect remote client")
 
     # ========================================================================
     # Phase 7: Network/WiFi Management
@@ -383,35 +369,34 @@ class SeestarSystemMixin:
         Raises:
             CommandError: If configuration fails
         """
-        self.logger.info(f"Configuring AP: {ssid}, 5G={is_5g}")
+        self.logger.info("Configuring AP: %s, 5G=%s", ssid, is_5g)
 
         params = {"ssid": ssid, "passwd": password, "is_5g": is_5g}
 
-        response = await self._send_command("pi_set_ap", params)
-
-        self.logger.info(f"Configure AP response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("pi_set_ap", params, "Configure AP")
 
     async def set_wifi_country(self, country_code: str) -> bool:
         """Set WiFi regulatory country/region.
 
         Args:
-            country_code: Two-letter country code (e.g., "US", "GB", "JP")
+            country_code: Two-letter country code (e.g., "US", "GB", "JP"; case-insensitive)
 
         Returns:
             True if setting successful
 
         Raises:
+            ValueError: If country_code is not an ISO 3166-1 alpha-2 code
             CommandError: If setting fails
         """
-        self.logger.info(f"Setting WiFi country: {country_code}")
+        country_code = country_code.strip().upper()
+        if country_code not in _WIFI_COUNTRY_CODES:
+            raise ValueError(f"Unknown country code: {country_code!r}")
 
-        params = {"country": country_code}
+        self.logger.info("Setting WiFi country: %s", country_code)
 
-        response = await self._send_command("set_wifi_country", params)
+        params = {"country": country_code}
 
-        self.logger.info(f"Set WiFi country response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("set_wifi_country", params, "Set WiFi country")
 
     async def enable_wifi_client_mode(self) -> bool:
         """Enable WiFi client/station mode.
@@ -426,10 +411,7 @@ class SeestarSystemMixin:
         """
         self.logger.info("Enabling WiFi client mode")
 
-        response = await self._send_command("pi_station_open", {})
-
-        self.logger.info(f"Enable WiFi client response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("pi_station_open", {}, "Enable WiFi client")
 
     async def disable_wifi_client_mode(self) -> bool:
         """Disable WiFi client/station mode.
@@ -444,23 +426,25 @@ class SeestarSystemMixin:
         """
         self.logger.info("Disabling WiFi client mode")
 
-        response = await self._send_command("pi_station_close", {})
+        return await self._send_bool_command("pi_station_close", {}, "Disable WiFi client")
 
-        self.logger.info(f"Disable WiFi client response: {response}")
-        return response.get("result") == 0
-
-    async def scan_wifi_networks(self) -> Dict[str, Any]:
+    async def scan_wifi_networks(self, force_refresh: bool = False, timeout: Optional[float] = None) -> Dict[str, Any]:
         """Scan for available WiFi networks.
 
+        Args:
+            force_refresh: Bypass the cached result and query the telescope
+            timeout: Seconds to wait for the scan result (default: COMMAND_TIMEOUT)
+
         Returns:
             Dict with list of available networks
 
         Raises:
+            TimeoutError: If the scan does not finish within timeout
             CommandError: If scan fails
         """
         self.logger.info("Scanning for WiFi networks")
 
-        response = await self._send_command("pi_station_scan", {})
+        response = await self._send_poll_command("pi_station_scan", force_refresh=force_refresh, timeout=timeout)
 
         return response.get("result", {})
 
@@ -478,14 +462,11 @@ class SeestarSystemMixin:
         Raises:
             CommandError: If connection fails
         """
-        self.logger.info(f"Connecting to WiFi: {ssid}")
+        self.logger.info("Connecting to WiFi: %s", ssid)
 
         params = {"ssid": ssid}
 
-        response = await self._send_command("pi_station_select", params)
-
-        self.logger.info(f"Connect to WiFi response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("pi_station_select", params, "Connect to WiFi")
 
     async def save_wifi_network(self, ssid: str, password: str, security: str = "WPA2-PSK") -> bool:
         """Save WiFi network credentials.
@@ -501,25 +482,25 @@ class SeestarSystemMixin:
         Raises:
             CommandError: If save fails
         """
-        self.logger.info(f"Saving WiFi network: {ssid}")
+        self.logger.info("Saving WiFi network: %s", ssid)
 
         params = {"ssid": ssid, "passwd": password, "security": security}
 
-        response = await self._send_command("pi_station_set", params)
-
-        self.logger.info(f"Save WiFi network response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("pi_station_set", params, "Save WiFi network")
 
-    async def list_saved_wifi_networks(self) -> Dict[str, Any]:
+    async def list_saved_wifi_networks(self, force_refresh: bool = False) -> Dict[str, Any]:
         """List saved WiFi networks.
 
+        Args:
+            force_refresh: Bypass the cached result and query the telescope
+
         Returns:
             Dict with list of saved networks
 
         Raises:
             CommandError: If list fails
         """
-        response = await self._send_command("pi_station_list", {})
+        response = await self._send_poll_command("pi_station_list", force_refresh=force_refresh)
 
         return response.get("result", {})
 
@@ -535,31 +516,31 @@ class SeestarSystemMixin:
         Raises:
             CommandError: If remove fails
         """
-        self.logger.info(f"Removing WiFi network: {ssid}")
+        self.logger.info("Removing WiFi network: %s", ssid)
 
         params = {"ssid": ssid}
 
-        response = await self._send_command("pi_station_remove", params)
-
-        self.logger.info(f"Remove WiFi network response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("pi_station_remove", params, "Remove WiFi network")
 
     # ========================================================================
     # Phase 8: Raspberry Pi System Commands
     # ========================================================================
 
-    async def get_pi_info(self) -> Dict[str, Any]:
+    async def get_pi_info(self, force_refresh: bool = False) -> Dict[str, Any]:
         """Get Raspberry Pi system information.
 
         Returns info about CPU, memory, disk, temperature, etc.
 
+        Args:
+            force_refresh: Bypass the cached result and query the telescope
+
         Returns:
             System information dict
 
         Raises:
             CommandError: If query fails
         """
-        response = await self._send_command("pi_get_info", {})
+        response = await self._send_poll_command("pi_get_info", force_refresh=force_refresh)
 
         return response.get("result", {})
 
@@ -588,27 +569,27 @@ class SeestarSystemMixin:
         Raises:
             CommandError: If setting fails
         """
-        self.logger.info(f"Setting Pi time: {unix_timestamp}")
+        self.logger.info("Setting Pi time: %s", unix_timestamp)
 
         params = {"time": unix_timestamp}
 
-        response = await self._send_command("pi_set_time", params)
-
-        self.logger.info(f"Set Pi time response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("pi_set_time", params, "Set Pi time")
 
-    async def get_station_state(self) -> Dict[str, Any]:
+    async def get_station_state(self, force_refresh: bool = False) -> Dict[str, Any]:
         """Get WiFi station state.
 
         Returns connection status, signal strength, IP address, etc.
 
+        Args:
+            force_refresh: Bypass the cached result and query the telescope
+
         Returns:
             Station state dict
 
         Raises:
             CommandError: If query fails
         """
-        response = await self._send_command("pi_station_state", {})
+        response = await self._send_poll_command("pi_station_state", force_refresh=force_refresh)
 
         return response.get("result", {})
 
@@ -635,15 +616,12 @@ class SeestarSystemMixin:
         if not 0 <= power_level <= 100:
             raise ValueError(f"Power level must be 0-100, got {power_level}")
 
-        self.logger.info(f"Setting dew heater: {'ON' if enabled else 'OFF'} at {power_level}% power")
+        self.logger.info("Setting dew heater: %s at %d%% power", "ON" if enabled else "OFF", power_level)
 
         # Correct implementation from APK decompilation
         params = {"heater": {"state": enabled, "value": power_level}}
 
-        response = await self._send_command("pi_output_set2", params)
-
-        self.logger.info(f"Set dew heater response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("pi_output_set2", params, "Set dew heater")
 
     async def set_dc_output(self, output_config: Dict[str, Any]) -> bool:
         """Set DC output configuration for accessories.
@@ -660,12 +638,9 @@ class SeestarSystemMixin:
         Raises:
             CommandError: If setting fails
         """
-        self.logger.info(f"Setting DC output: {output_config}")
-
-        response = await self._send_command("pi_output_set2", output_config)
+        self.logger.info("Setting DC output: %s", output_config)
 
-        self.logger.info(f"Set DC output response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("pi_output_set2", output_config, "Set DC output")
 
     async def get_dc_output(self) -> Dict[str, Any]:
         """Get current DC output configuration.
@@ -697,10 +672,7 @@ class SeestarSystemMixin:
         """
         self.logger.info("Starting demo mode")
 
-        response = await self._send_command("start_demonstrate", {})
-
-        self.logger.info(f"Start demo mode response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("start_demonstrate", {}, "Start demo mode")
 
     async def stop_demo_mode(self) -> bool:
         """Stop demonstration/exhibition mode.
@@ -713,10 +685,7 @@ class SeestarSystemMixin:
         """
         self.logger.info("Stopping demo mode")
 
-        response = await self._send_command("stop_demonstrate", {})
-
-        self.logger.info(f"Stop demo mode response: {response}")
-        return response.get("result") == 0
+        return await self._send_bool_command("stop_demonstrate", {}, "Stop demo mode")
 
     async def start_polar_align(self) -> bool:
         """Start polar alignment process.
@@ -731,7 +700,7 @@ class SeestarSystemMixin:
 
         response = await self._send_command("start_polar_align")
 
-        self.logger.info(f"Start polar align response: {response}")
+        self.logger.info("Start polar align response: %s", response)
         return response.get("code") == 0
 
     async def stop_polar_align(self) -> bool:
@@ -747,7 +716,7 @@ class SeestarSystemMixin:
 
         response = await self._send_command("stop_polar_align")
 
-        self.logger.info(f"Stop polar align response: {response}")
+        self.logger.info("Stop polar align response: %s", response)
         return response.get("code") == 0
 
     async def pause_polar_align(self) -> bool:
@@ -763,7 +732,7 @@ class SeestarSystemMixin:
 
         response = await self._send_command("pause_polar_align")
 
-        self.logger.info(f"Pause polar align response: {response}")
+        self.logger.info("Pause polar align response: %s", response)
         return response.get("code") == 0
 
     async def check_client_verified(self) -> bool:
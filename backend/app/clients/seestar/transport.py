@@ -2,16 +2,24 @@
 
 import asyncio
 import base64
+import contextlib
+import copy
+import dataclasses
+import hashlib
+import itertools
 import json
 import logging
 import socket
+import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 
 from app.core.config import get_settings
 
@@ -25,6 +33,54 @@ from .types import (
     TimeoutError,
 )
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _encode_json(obj: Any) -> bytes:
+    """Serialize a wire message to compact UTF-8 JSON (orjson when installed)."""
+    if HAS_ORJSON:
+        # Coordinates are often numpy scalars, which stdlib json accepts but orjson needs opting into
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Raises a json.JSONDecodeError subclass on invalid input with either codec
+_decode_json = orjson.loads if HAS_ORJSON else json.loads
+
+# Shared stand-in for messages without a dict "result" (never mutated)
+_EMPTY_RESULT: Dict[str, Any] = {}
+
+# UDP discovery datagram, with app version for firmware 6.45 compatibility
+_DISCOVERY_MESSAGE = _encode_json(
+    {
+        "id": 1,
+        "method": "scan_iscope",
+        "params": "",
+        "app_version": "3.0.0",  # Pretend to be latest app version
+        "protocol_version": "6.45",  # Match firmware version exactly
+    }
+)
+
+
+class _DiscoveryProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol that resolves a future with the first UDP discovery reply."""
+
+    def __init__(self, reply: asyncio.Future):
+        self.reply = reply
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        if not self.reply.done():
+            self.reply.set_result((data, addr))
+
+    def error_received(self, exc: Exception) -> None:
+        if not self.reply.done():
+            self.reply.set_exception(exc)
+
 
 class SeestarTransport:
     """TCP transport for Seestar S50 smart telescope.
@@ -48,7 +104,58 @@ class SeestarTransport:
     FILE_TRANSFER_PORT = 4801  # Port 4801 for file downloads
     CONNECTION_TIMEOUT = 10.0
     COMMAND_TIMEOUT = 30.0  # Increased from 10s - telescope can be slow to respond
-    RECEIVE_BUFFER_SIZE = 4096
+    RECEIVE_BUFFER_SIZE = 256 * 1024  # File transfer read size; fewer loop iterations for multi-MB FITS
+    FILE_READ_TIMEOUT = 30.0  # Longest a file transfer may go without receiving data
+    WRITE_BUFFER_HIGH_WATER = 64 * 1024  # Only await drain() once this much output is queued
+    SOCKET_RCVBUF = 256 * 1024  # Kernel receive buffer for bursty event streams over Wi-Fi
+    TCP_NOTSENT_LOWAT = 16 * 1024  # Keep unsent data small so stop/cancel commands aren't queued
+
+    # High-rate polling/keepalive methods whose traffic is logged at DEBUG, not INFO
+    QUIET_METHODS = frozenset({"scope_get_equ_coord", "test_connection"})
+
+    # Read-only state queries and how long (seconds) pollers may share a response: short for
+    # fast-moving mount/app state, longer for slow-changing Pi/WiFi state (a WiFi scan also
+    # degrades the link while it runs). Any command outside QUERY_METHODS (except the heartbeat)
+    # may change state and invalidates the cache.
+    POLL_CACHE_TTLS = {
+        "scope_get_equ_coord": 0.1,
+        "iscope_get_app_state": 0.25,
+        "get_device_state": 0.5,
+        "get_compass_state": 0.5,
+        "get_view_state": 0.5,
+        "is_stacked": 0.5,
+        "pi_station_scan": 120.0,
+        "pi_station_list": 30.0,
+        "pi_get_info": 5.0,
+        "pi_station_state": 2.0,
+    }
+    POLL_METHODS = frozenset(POLL_CACHE_TTLS)
+
+    # Read-only queries: identical concurrent calls share one round-trip, and sending
+    # them leaves the polling cache intact
+    QUERY_METHODS = POLL_METHODS | frozenset(
+        {
+            "get_annotate_result",
+            "get_focuser_position",
+            "get_img_file_info",
+            "get_solve_result",
+            "pi_get_time",
+            "pi_is_verified",
+            "pi_output_get2",
+        }
+    )
+
+    # Pre-serialized params for fixed-payload stop commands (see _send_command)
+    STOP_STACK_PARAMS = b'{"stage":"Stack"}'
+    STOP_GOTO_PARAMS = b'{"stage":"AutoGoto"}'
+    SCOPE_MOVE_STOP_PARAMS = b'["none"]'  # Firmware expects a JSON array, not a string or dict (code 105 otherwise)
+
+    # Reported states that end a goto wait (success / stopped or failed)
+    _GOTO_SUCCESS_STATES = frozenset({SeestarState.TRACKING.value})
+    _GOTO_FAILED_STATES = frozenset({SeestarState.CONNECTED.value, SeestarState.PARKED.value})
+
+    # Fixed SeestarStatus schema, used to filter _update_status keyword arguments
+    _STATUS_FIELDS = frozenset(f.name for f in dataclasses.fields(SeestarStatus))
 
     def __init__(self, logger: Optional[logging.Logger] = None, private_key_path: Optional[str] = None):
         """Initialize Seestar client.
@@ -68,6 +175,7 @@ class SeestarTransport:
             self._private_key_path = Path(__file__).parent.parent.parent.parent / self._private_key_path
 
         self._private_key_pem: Optional[bytes] = None
+        self._private_key: Optional[Any] = None  # Parsed from the PEM on first signature
 
         # Connection state
         self._socket: Optional[socket.socket] = None
@@ -76,10 +184,16 @@ class SeestarTransport:
         self._connected = False
         self._host: Optional[str] = None
         self._port = self.DEFAULT_PORT
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # Loop the connection runs on
 
         # Message handling
-        self._command_id = 10000  # Start at 10000 like seestar_alp
+        self._command_ids = itertools.count(10000)  # Start at 10000 like seestar_alp
         self._pending_responses: Dict[int, asyncio.Future] = {}
+        self._ignore_ids: Set[int] = set()  # ids of fire-and-forget commands whose responses are dropped
+        self._msg_templates: Dict[tuple, bytes] = {}  # (method, params bytes) -> pre-encoded frame
+        self._poll_cache: Dict[tuple, tuple] = {}  # (method, encoded params) -> (monotonic time, response)
+        self._inflight: Dict[tuple, asyncio.Task] = {}  # (method, encoded params) -> running query
+        self._cache_generation = 0  # Bumped whenever cached/in-flight query responses may be stale
         self._receive_task: Optional[asyncio.Task] = None
         self._heartbeat_task: Optional[asyncio.Task] = None
 
@@ -87,8 +201,8 @@ class SeestarTransport:
         self._status = SeestarStatus(connected=False, state=SeestarState.DISCONNECTED)
         self._operation_states: Dict[str, str] = {}
 
-        # Cached observer location (lat, lon, elevation) — populated on first goto
-        self._observer_location: Optional[tuple] = None
+        # Cached observer location (astropy EarthLocation) — built on first alt/az goto
+        self._observer_location: Optional[Any] = None
 
         # Reconnection tracking (Android app style)
         self._miss_time = 0  # Number of consecutive disconnects
@@ -107,6 +221,13 @@ class SeestarTransport:
         self._all_events_callbacks: List[Callable[[SeestarEvent], None]] = []
         self._progress_callbacks: List[Callable[[float, Dict[str, Any]], None]] = []
 
+        # Per-type snapshot of all-events + type-specific callbacks, rebuilt on
+        # (un)subscribe so dispatch iterates a single tuple per event
+        self._flat_callbacks: Dict[EventType, tuple] = {}
+        self._any_subscribers = False  # False lets _handle_message skip event parsing entirely
+        self._rebuild_flat_callbacks()
+        self._callback_tasks: Set[asyncio.Task] = set()  # Strong refs to running coroutine callbacks
+
     @property
     def connected(self) -> bool:
         """Check if connected to telescope."""
@@ -144,6 +265,7 @@ class SeestarTransport:
         """
         if callback not in self._event_callbacks[event_type]:
             self._event_callbacks[event_type].append(callback)
+            self._rebuild_flat_callbacks()
             self.logger.debug(f"Subscribed to {event_type.value} events")
 
     def unsubscribe_event(self, event_type: EventType, callback: Callable[[SeestarEvent], None]) -> None:
@@ -155,6 +277,7 @@ class SeestarTransport:
         """
         if callback in self._event_callbacks[event_type]:
             self._event_callbacks[event_type].remove(callback)
+            self._rebuild_flat_callbacks()
             self.logger.debug(f"Unsubscribed from {event_type.value} events")
 
     def subscribe_all_events(self, callback: Callable[[SeestarEvent], None]) -> None:
@@ -165,6 +288,7 @@ class SeestarTransport:
         """
         if callback not in self._all_events_callbacks:
             self._all_events_callbacks.append(callback)
+            self._rebuild_flat_callbacks()
             self.logger.debug("Subscribed to all events")
 
     def unsubscribe_all_events(self, callback: Callable[[SeestarEvent], None]) -> None:
@@ -175,6 +299,7 @@ class SeestarTransport:
         """
         if callback in self._all_events_callbacks:
             self._all_events_callbacks.remove(callback)
+            self._rebuild_flat_callbacks()
             self.logger.debug("Unsubscribed from all events")
 
     def subscribe_progress(self, callback: Callable[[float, Dict[str, Any]], None]) -> None:
@@ -187,6 +312,7 @@ class SeestarTransport:
         """
         if callback not in self._progress_callbacks:
             self._progress_callbacks.append(callback)
+            self._rebuild_flat_callbacks()
             self.logger.debug("Subscribed to progress updates")
 
     def unsubscribe_progress(self, callback: Callable[[float, Dict[str, Any]], None]) -> None:
@@ -197,25 +323,54 @@ class SeestarTransport:
         """
         if callback in self._progress_callbacks:
             self._progress_callbacks.remove(callback)
+            self._rebuild_flat_callbacks()
             self.logger.debug("Unsubscribed from progress updates")
 
+    @contextlib.contextmanager
+    def _subscribed(self, event_type: EventType, callback: Callable[[SeestarEvent], None]) -> Iterator[None]:
+        """Keep a callback subscribed for the duration of a with-block.
+
+        The callback is unsubscribed on exit, including on timeout or cancellation.
+
+        Args:
+            event_type: Type of event to listen for
+            callback: Function to call when event occurs
+        """
+        self.subscribe_event(event_type, callback)
+        try:
+            yield
+        finally:
+            self.unsubscribe_event(event_type, callback)
+
+    def _rebuild_flat_callbacks(self) -> None:
+        """Rebuild the per-event-type callback tuples used by _dispatch_event."""
+        all_events = tuple(self._all_events_callbacks)
+        self._flat_callbacks = {
+            event_type: all_events + tuple(callbacks) for event_type, callbacks in self._event_callbacks.items()
+        }
+        self._any_subscribers = bool(self._progress_callbacks) or any(self._flat_callbacks.values())
+
     def _update_status(self, **kwargs) -> None:
         """Update internal status and trigger callback."""
-        # Log status changes to console for debugging
-        if kwargs:
-            self.logger.info(f"[TELESCOPE STATUS UPDATE] {kwargs}")
+        # Log status changes to console for debugging (polling updates this several
+        # times a second, so only format the kwargs when INFO is actually emitted)
+        if kwargs and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("[TELESCOPE STATUS UPDATE] %s", kwargs)
 
+        status_fields = self._STATUS_FIELDS
+        status_dict = self._status.__dict__
         for key, value in kwargs.items():
-            if hasattr(self._status, key):
-                setattr(self._status, key, value)
+            if key in status_fields:
+                status_dict[key] = value
 
-        self._status.last_update = datetime.now()
+        if "last_update" not in kwargs:
+            status_dict["last_update"] = datetime.now()
 
         if self._status_callback:
             try:
                 self._status_callback(self._status)
             except Exception as e:
-                self.logger.error(f"Error in status callback: {e}")
+                self.logger.error("Error in status callback: %s", e)
 
     def _load_private_key(self) -> None:
         """Load RSA private key for authentication.
@@ -251,14 +406,17 @@ class SeestarTransport:
         Returns:
             Base64-encoded signature
         """
-        # Load the private key
-        private_key = serialization.load_pem_private_key(
-            self._private_key_pem, password=None, backend=default_backend()
-        )
+        # Parse the private key once; reconnects reuse it
+        if self._private_key is None:
+            self._private_key = serialization.load_pem_private_key(
+                self._private_key_pem, password=None, backend=default_backend()
+            )
 
         # Sign the challenge using RSA-SHA1 (required by Seestar firmware protocol)
-        # SHA1 used for RSA signing (not password hashing), required by hardware
-        signature = private_key.sign(challenge_str.encode("utf-8"), padding.PKCS1v15(), hashes.SHA1())  # nosec B303
+        # SHA1 used for RSA signing (not password hashing), required by hardware.
+        # The digest comes from hashlib (OpenSSL, SHA-NI where available) and is signed as prehashed.
+        digest = hashlib.sha1(challenge_str.encode("utf-8")).digest()  # nosec B303 B324
+        signature = self._private_key.sign(digest, padding.PKCS1v15(), Prehashed(hashes.SHA1()))  # nosec B303
 
         # Return base64-encoded signature
         return base64.b64encode(signature).decode("utf-8")
@@ -304,37 +462,57 @@ class SeestarTransport:
 
     async def _send_udp_discovery(self) -> None:
         """Send UDP discovery broadcast for guest mode."""
+        transport = None
         try:
-            # Create UDP socket
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            sock.settimeout(1.0)
-
-            # Send discovery message with app version for firmware 6.45 compatibility
-            message = {
-                "id": 1,
-                "method": "scan_iscope",
-                "params": "",
-                "app_version": "3.0.0",  # Pretend to be latest app version
-                "protocol_version": "6.45",  # Match firmware version exactly
-            }
-            message_bytes = json.dumps(message).encode()
+            loop = asyncio.get_running_loop()
+            reply = loop.create_future()
 
+            # Create UDP endpoint (non-blocking, hostname resolved by the loop)
             addr = (self._host, self.UDP_DISCOVERY_PORT)
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda: _DiscoveryProtocol(reply),
+                remote_addr=addr,
+                family=socket.AF_INET,
+                allow_broadcast=True,
+            )
+
             self.logger.info(f"Sending UDP discovery to {addr}")
-            sock.sendto(message_bytes, addr)
+            transport.sendto(_DISCOVERY_MESSAGE)
 
             # Try to receive response (optional)
             try:
-                data, addr = sock.recvfrom(1024)
+                data, addr = await asyncio.wait_for(reply, timeout=1.0)
                 self.logger.info(f"Received UDP response from {addr}: {data.decode()}")
-            except socket.timeout:
+            except asyncio.TimeoutError:
                 self.logger.debug("No UDP response (this is normal)")
 
-            sock.close()
-
         except Exception as e:
             self.logger.warning(f"UDP discovery failed (non-critical): {e}")
+        finally:
+            if transport is not None:
+                transport.close()
+
+    def _tune_socket(self, sock: Optional[socket.socket]) -> None:
+        """Apply receive-buffer and send-queue socket options (best effort).
+
+        Args:
+            sock: Connected TCP socket, if the transport exposes one
+        """
+        if sock is None:
+            return
+
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_RCVBUF)
+        except OSError as e:
+            self.logger.debug(f"Could not set SO_RCVBUF: {e}")
+
+        # TCP_NOTSENT_LOWAT is only available on Linux/macOS
+        notsent_lowat = getattr(socket, "TCP_NOTSENT_LOWAT", None)
+        if notsent_lowat is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, notsent_lowat, self.TCP_NOTSENT_LOWAT)
+            except OSError as e:
+                self.logger.debug(f"Could not set TCP_NOTSENT_LOWAT: {e}")
 
     async def connect(self, host: str, port: int = DEFAULT_PORT) -> bool:
         """Connect to Seestar S50 telescope.
@@ -355,6 +533,7 @@ class SeestarTransport:
 
         self._host = host
         self._port = port
+        self._loop = asyncio.get_running_loop()
 
         try:
             # Send UDP discovery first (for guest mode)
@@ -366,6 +545,8 @@ class SeestarTransport:
             self._reader, self._writer = await asyncio.wait_for(
                 asyncio.open_connection(host, port), timeout=self.CONNECTION_TIMEOUT
             )
+            self._writer.transport.set_write_buffer_limits(high=self.WRITE_BUFFER_HIGH_WATER)
+            self._tune_socket(self._writer.get_extra_info("socket"))
 
             self._connected = True
             self._update_status(connected=True, state=SeestarState.CONNECTED)
@@ -431,6 +612,8 @@ class SeestarTransport:
         self._reader = None
         self._writer = None
         self._pending_responses.clear()
+        self._ignore_ids.clear()
+        self._invalidate_query_cache()
 
         self._update_status(connected=False, state=SeestarState.DISCONNECTED)
 
@@ -472,10 +655,13 @@ class SeestarTransport:
                     self.logger.error("Connection closed by telescope")
                     break
 
-                # Parse message
+                # One wall-clock read per message, and only if an event may be built from it
+                received_at = datetime.now() if self._any_subscribers else None
+
+                # Parse message (both codecs accept UTF-8 bytes and ignore the trailing CRLF)
                 try:
-                    message = json.loads(line.decode().strip())
-                    await self._handle_message(message)
+                    message = _decode_json(line)
+                    self._handle_message(message, received_at)
                 except json.JSONDecodeError as e:
                     self.logger.error(f"Invalid JSON received: {line}, error: {e}")
                 except Exception as e:
@@ -499,8 +685,6 @@ class SeestarTransport:
         - 300ms delay between retries
         - Reset counter if > 60 seconds since last disconnect
         """
-        import time
-
         current_time = time.time()
 
         # Check if > 60 seconds since last disconnect (reset counter)
@@ -539,62 +723,83 @@ class SeestarTransport:
             self.logger.error(f"Auto-reconnect failed: {e}")
             # Don't reset miss_time - will retry on next disconnect if < max
 
-    async def _handle_message(self, message: Dict[str, Any]) -> None:
+    def _handle_message(self, message: Dict[str, Any], received_at: Optional[datetime] = None) -> None:
         """Process received message from telescope.
 
         Args:
             message: Parsed JSON message
+            received_at: Time the message was read (default: now, if an event is built)
         """
         # Log message
         method = message.get("method", "unknown")
         msg_id = message.get("id")
 
-        if method == "scope_get_equ_coord":
-            self.logger.debug(f"Received: {message}")
+        # Progress events stream at 1+ Hz during imaging, so they share the quiet level
+        result = message.get("result")
+        if method in self.QUIET_METHODS or (isinstance(result, dict) and ("progress" in result or "percent" in result)):
+            level = logging.DEBUG
         else:
-            self.logger.info(f"Received: {message}")
-
-        # Check if this is a response to a pending command
-        if msg_id is not None and msg_id in self._pending_responses:
-            future = self._pending_responses.pop(msg_id)
-            if not future.done():
-                future.set_result(message)
-            return  # This was a command response, not an event
+            level = logging.INFO
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, "Received: %s", message)
+
+        # Check if this is a response to a pending command; resolve its future in
+        # place rather than scheduling the wake-up through another callback
+        if msg_id is not None:
+            future = self._pending_responses.pop(msg_id, None)
+            if future is not None:
+                if not future.done():
+                    future.set_result(message)
+                return  # This was a command response, not an event
+            if self._ignore_ids and msg_id in self._ignore_ids:
+                self._ignore_ids.discard(msg_id)
+                if "error" in message:
+                    self.logger.warning("Command %s failed: %s", method, message.get("error"))
+                return
+
+        # Nobody is listening - don't build an event just to drop it
+        if not self._any_subscribers:
+            return
 
         # Parse and dispatch as unsolicited event
-        event = self._parse_event(message)
+        event = self._parse_event(message, received_at)
         if event:
-            await self._dispatch_event(event)
+            self._dispatch_event(event)
 
-    def _parse_event(self, message: Dict[str, Any]) -> Optional[SeestarEvent]:
+    def _parse_event(self, message: Dict[str, Any], received_at: Optional[datetime] = None) -> Optional[SeestarEvent]:
         """Parse message as telescope event.
 
         Args:
             message: Raw message dict from telescope
+            received_at: Event timestamp (default: now)
 
         Returns:
             SeestarEvent if recognized, None otherwise
         """
         # Determine event type based on message structure
         method = message.get("method", "")
-        result = message.get("result", {})
+        result = message.get("result")
+        if not isinstance(result, dict):
+            result = _EMPTY_RESULT
 
         event_type = EventType.UNKNOWN
         event_data = {}
 
-        # Parse different event types
-        if "progress" in result or "percent" in result:
+        # Parse different event types, most frequent (imaging progress) first
+        progress = result.get("progress")
+        percent = result.get("percent")
+        if progress is not None or percent is not None:
             event_type = EventType.PROGRESS_UPDATE
             event_data = {
-                "progress": result.get("progress", 0),
-                "percent": result.get("percent", 0),
+                "progress": progress if progress is not None else 0,
+                "percent": percent if percent is not None else 0,
                 "frame": result.get("frame", 0),
                 "total_frames": result.get("total_frames", 0),
             }
 
         elif "state" in result:
             event_type = EventType.STATE_CHANGE
-            event_data = {"state": result.get("state"), "stage": result.get("stage")}
+            event_data = {"state": result["state"], "stage": result.get("stage")}
 
         elif "error" in message or message.get("code", 0) != 0:
             event_type = EventType.ERROR
@@ -612,37 +817,53 @@ class SeestarTransport:
             event_data = {"operation": result.get("operation"), "success": result.get("success", True)}
 
         # Create event
-        return SeestarEvent(event_type=event_type, timestamp=datetime.now(), data=event_data, source_command=method)
+        return SeestarEvent(
+            event_type=event_type, timestamp=received_at or datetime.now(), data=event_data, source_command=method
+        )
+
+    def _dispatch_event(self, event: SeestarEvent) -> None:
+        """Schedule event delivery to registered callbacks.
 
-    async def _dispatch_event(self, event: SeestarEvent) -> None:
-        """Dispatch event to registered callbacks.
+        Callbacks run on the next event-loop iteration so the receive loop can go
+        straight back to reading the socket. call_soon is FIFO, so events are
+        still delivered in the order they were received.
 
         Args:
             event: Event to dispatch
         """
-        # Call all-events callbacks
-        for callback in self._all_events_callbacks:
-            try:
-                callback(event)
-            except Exception as e:
-                self.logger.error(f"Error in all-events callback: {e}")
+        (self._loop or asyncio.get_running_loop()).call_soon(self._deliver_event, event)
+
+    def _deliver_event(self, event: SeestarEvent) -> None:
+        """Invoke registered callbacks for an event.
+
+        Coroutine callbacks are scheduled as tasks rather than awaited.
 
-        # Call event-type-specific callbacks
-        for callback in self._event_callbacks.get(event.event_type, []):
+        Args:
+            event: Event to deliver
+        """
+        event_type = event.event_type
+        log_error = self.logger.error
+
+        # All-events callbacks followed by event-type-specific callbacks
+        for callback in self._flat_callbacks[event_type]:
             try:
-                callback(event)
+                result = callback(event)
+                if asyncio.iscoroutine(result):
+                    task = asyncio.get_running_loop().create_task(result)
+                    self._callback_tasks.add(task)
+                    task.add_done_callback(self._callback_tasks.discard)
             except Exception as e:
-                self.logger.error(f"Error in {event.event_type.value} callback: {e}")
+                log_error(f"Error in {event_type.value} callback: {e}")
 
         # Handle progress events specially for progress callbacks
-        if event.event_type == EventType.PROGRESS_UPDATE:
+        if event_type is EventType.PROGRESS_UPDATE and self._progress_callbacks:
             percent = event.data.get("percent", 0)
             details = event.data
-            for progress_cb in self._progress_callbacks:
+            for progress_cb in tuple(self._progress_callbacks):
                 try:
                     progress_cb(percent, details)
                 except Exception as e:
-                    self.logger.error(f"Error in progress callback: {e}")
+                    log_error(f"Error in progress callback: {e}")
 
     async def wait_for_goto_complete(self, timeout: float = 180.0) -> bool:
         """Wait for slew/goto operation to complete using events (not polling).
@@ -668,26 +889,21 @@ class SeestarTransport:
         def state_callback(event: SeestarEvent):
             nonlocal success
             state = event.data.get("state")
-            if state == SeestarState.TRACKING.value or state == "tracking":
+            if state in self._GOTO_SUCCESS_STATES:
                 success = True
                 completion_event.set()
-            elif state in (SeestarState.CONNECTED.value, "connected", SeestarState.PARKED.value, "parked"):
+            elif state in self._GOTO_FAILED_STATES:
                 # Goto failed or was stopped
                 success = False
                 completion_event.set()
 
-        # Subscribe to state change events
-        self.subscribe_event(EventType.STATE_CHANGE, state_callback)
-
         try:
-            # Wait for completion or timeout
-            await asyncio.wait_for(completion_event.wait(), timeout=timeout)
+            # Wait for completion or timeout while subscribed to state change events
+            with self._subscribed(EventType.STATE_CHANGE, state_callback):
+                await asyncio.wait_for(completion_event.wait(), timeout=timeout)
         except asyncio.TimeoutError:
             self.logger.warning(f"Goto operation timed out after {timeout}s")
             success = False
-        finally:
-            # Clean up subscription
-            self.unsubscribe_event(EventType.STATE_CHANGE, state_callback)
 
         return success
 
@@ -722,18 +938,13 @@ class SeestarTransport:
                 focus_position = event.data.get("position")
                 completion_event.set()
 
-        # Subscribe to operation complete events
-        self.subscribe_event(EventType.OPERATION_COMPLETE, operation_callback)
-
         try:
-            # Wait for completion or timeout
-            await asyncio.wait_for(completion_event.wait(), timeout=timeout)
+            # Wait for completion or timeout while subscribed to operation complete events
+            with self._subscribed(EventType.OPERATION_COMPLETE, operation_callback):
+                await asyncio.wait_for(completion_event.wait(), timeout=timeout)
         except asyncio.TimeoutError:
             self.logger.warning(f"Autofocus operation timed out after {timeout}s")
             success = False
-        finally:
-            # Clean up subscription
-            self.unsubscribe_event(EventType.OPERATION_COMPLETE, operation_callback)
 
         return success, focus_position
 
@@ -792,29 +1003,88 @@ class SeestarTransport:
                 success = True
                 completion_event.set()
 
-        # Subscribe to progress events
-        self.subscribe_event(EventType.PROGRESS_UPDATE, imaging_progress_callback)
-
         try:
-            # Wait for completion or timeout
-            await asyncio.wait_for(completion_event.wait(), timeout=timeout)
+            # Wait for completion or timeout while subscribed to progress events
+            with self._subscribed(EventType.PROGRESS_UPDATE, imaging_progress_callback):
+                await asyncio.wait_for(completion_event.wait(), timeout=timeout)
         except asyncio.TimeoutError:
             self.logger.warning(
                 f"Imaging session timed out after {timeout}s " f"(reached {current_frame}/{expected_frames} frames)"
             )
             success = False
-        finally:
-            # Clean up subscription
-            self.unsubscribe_event(EventType.PROGRESS_UPDATE, imaging_progress_callback)
 
         return success
 
+    @staticmethod
+    def _ok(response: Dict[str, Any]) -> bool:
+        """Return True if a command response reports success (result code 0)."""
+        return response.get("result") == 0
+
+    @staticmethod
+    def _frame_template(method: str, params: Optional[bytes]) -> bytes:
+        """Encode a command frame once, leaving a %d placeholder for the command id."""
+        prefix = _encode_json({"method": method})[:-1]
+        if params is not None:
+            prefix += b',"params":' + params
+        return prefix.replace(b"%", b"%%") + b',"id":%d,"jsonrpc":"2.0"}\r\n'
+
+    def _build_frame(self, method: str, params: Any, cmd_id: int) -> bytes:
+        """Encode a JSON-RPC command frame.
+
+        Args:
+            method: Command method name
+            params: Command parameters (see _send_command)
+            cmd_id: Command ID
+
+        Returns:
+            Newline-terminated frame bytes
+        """
+        # Build message with version info for firmware 6.x compatibility. Commands without
+        # params or with fixed ones (heartbeat, polling, stops) have a constant shape, so
+        # their frame is encoded once and only the id is formatted in. The firmware treats
+        # a missing params key like an empty object, so "params": {} is left off the wire.
+        if type(params) is dict and not params:
+            params = None
+        if params is None or type(params) is bytes:
+            template = self._msg_templates.get((method, params))
+            if template is None:
+                template = self._msg_templates[(method, params)] = self._frame_template(method, params)
+            return template % cmd_id
+        return _encode_json({"method": method, "id": cmd_id, "jsonrpc": "2.0", "params": params}) + b"\r\n"
+
+    def _log_frame(self, frame: bytes, method: str) -> None:
+        """Log an outgoing command frame (polling/keepalive traffic at DEBUG)."""
+        level = logging.DEBUG if method in self.QUIET_METHODS else logging.INFO
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, "Sending: %s", frame.decode().rstrip())
+
+    async def _write_frame(self, frame: bytes, method: str) -> None:
+        """Log and write a command frame to the telescope connection.
+
+        Args:
+            frame: Encoded command frame
+            method: Command method name (selects the log level)
+        """
+        self._log_frame(frame, method)
+
+        writer = self._writer
+        if writer.is_closing():
+            raise OSError("connection is closing")
+        writer.write(frame)
+        # Small command frames sit in the transport buffer; draining them would only
+        # cost an extra event-loop cycle, so yield to drain() under backpressure only
+        if writer.transport.get_write_buffer_size() > self.WRITE_BUFFER_HIGH_WATER:
+            await writer.drain()
+
     async def _send_command(self, method: str, params: Any = None, timeout: Optional[float] = None) -> Dict[str, Any]:
         """Send command to telescope and wait for response.
 
+        Identical concurrent calls to read-only QUERY_METHODS share one request.
+
         Args:
             method: Command method name
-            params: Command parameters (dict, list, or None)
+            params: Command parameters (dict, list, or None), or pre-serialized JSON
+                bytes for fixed payloads
             timeout: Command timeout in seconds (default: COMMAND_TIMEOUT)
 
         Returns:
@@ -825,43 +1095,72 @@ class SeestarTransport:
             TimeoutError: If command times out
             CommandError: If command returns error
         """
+        if method in self.QUERY_METHODS:
+            return await self._send_query(method, params, timeout)
+        return await self._request(method, params, timeout)
+
+    async def _send_query(self, method: str, params: Any, timeout: Optional[float]) -> Dict[str, Any]:
+        """Send a read-only query, sharing one round-trip between identical concurrent calls.
+
+        The request runs in its own task so a cancelled caller doesn't abort it for the
+        others that are waiting on the same response.
+        """
+        key = (method, params if params is None or type(params) is bytes else _encode_json(params))
+        task = self._inflight.get(key)
+        if task is None:
+            task = (self._loop or asyncio.get_running_loop()).create_task(self._request(method, params, timeout))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._query_done, key))
+        return await asyncio.shield(task)
+
+    def _query_done(self, key: tuple, task: asyncio.Task) -> None:
+        """Drop a finished query from the in-flight map and mark its outcome retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Every waiter may have been cancelled; don't log it as unhandled
+
+    def _invalidate_query_cache(self) -> None:
+        """Forget query responses that a state-changing command may have made stale.
+
+        Queries already in flight were sent before the change: later callers start a fresh
+        one instead of joining them, and their responses are not cached (see _send_poll_command).
+        """
+        self._cache_generation += 1
+        self._poll_cache.clear()
+        self._inflight.clear()
+
+    async def _request(self, method: str, params: Any, timeout: Optional[float]) -> Dict[str, Any]:
+        """Send one command and wait for its response (see _send_command)."""
         if not self._connected:
             raise ConnectionError("Not connected to telescope")
 
-        # Generate command ID
-        cmd_id = self._command_id
-        self._command_id += 1
+        if method not in self.QUERY_METHODS and method not in self.QUIET_METHODS:
+            self._invalidate_query_cache()
 
-        # Build message with version info for firmware 6.x compatibility
-        message = {"method": method, "id": cmd_id, "jsonrpc": "2.0"}  # Add JSON-RPC version
-        if params is not None:
-            message["params"] = params
+        # Generate command ID (wraps within 31 bits over very long sessions)
+        cmd_id = next(self._command_ids) & 0x7FFFFFFF
 
         # Create future for response
-        future = asyncio.Future()
+        future = (self._loop or asyncio.get_running_loop()).create_future()
         self._pending_responses[cmd_id] = future
 
-        # Send message
-        message_json = json.dumps(message) + "\r\n"
-
-        if method == "scope_get_equ_coord":
-            self.logger.debug(f"Sending: {message_json.strip()}")
-        else:
-            self.logger.info(f"Sending: {message_json.strip()}")
-
         try:
-            self._writer.write(message_json.encode())
-            await self._writer.drain()
+            await self._write_frame(self._build_frame(method, params, cmd_id), method)
         except Exception as e:
             self._pending_responses.pop(cmd_id, None)
             raise ConnectionError(f"Failed to send command: {e}")
 
         # Wait for response
         try:
-            response = await asyncio.wait_for(future, timeout=timeout or self.COMMAND_TIMEOUT)
+            # asyncio.timeout() (3.11+) bounds the await in place, without wait_for's wrapper task
+            async with asyncio.timeout(timeout or self.COMMAND_TIMEOUT):
+                response = await future
         except asyncio.TimeoutError:
-            self._pending_responses.pop(cmd_id, None)
             raise TimeoutError(f"Command timeout: {method}")
+        finally:
+            # Drop the entry on timeout/cancellation too, so abandoned futures don't accumulate
+            self._pending_responses.pop(cmd_id, None)
 
         # Check for error in response
         if "error" in response:
@@ -870,3 +1169,140 @@ class SeestarTransport:
             raise CommandError(f"Command failed: {error_msg} (code {error_code})")
 
         return response
+
+    async def _send_command_nowait(self, method: str, params: Any = None) -> None:
+        """Send command to telescope without waiting for its response.
+
+        For latency-critical stops where the caller doesn't need the result: the
+        frame is written and the call returns immediately. The eventual response is
+        discarded by the receive loop (errors are logged).
+
+        Args:
+            method: Command method name
+            params: Command parameters (see _send_command)
+
+        Raises:
+            ConnectionError: If not connected or the write fails
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to telescope")
+
+        self._invalidate_query_cache()
+
+        cmd_id = next(self._command_ids) & 0x7FFFFFFF
+        self._ignore_ids.add(cmd_id)
+
+        try:
+            await self._write_frame(self._build_frame(method, params, cmd_id), method)
+        except Exception as e:
+            self._ignore_ids.discard(cmd_id)
+            raise ConnectionError(f"Failed to send command: {e}")
+
+    async def pipeline(self, *commands: Tuple[str, Any], timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Send several commands in a single write and wait for all their responses.
+
+        Useful for setup flows that issue several commands back to back::
+
+            await client.pipeline(("set_wifi_country", {"country": "US"}), ("pi_set_time", {"time": now}))
+
+        Queries sent this way bypass the polling cache and in-flight sharing.
+
+        Args:
+            *commands: (method, params) pairs, with params as for _send_command
+            timeout: Timeout in seconds for all the responses (default: COMMAND_TIMEOUT)
+
+        Returns:
+            Response message dicts in the order the commands were given
+
+        Raises:
+            ConnectionError: If not connected or the write fails
+            TimeoutError: If any response doesn't arrive in time
+            CommandError: If any command returns an error
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to telescope")
+
+        methods = [method for method, _ in commands]
+        if any(method not in self.QUERY_METHODS and method not in self.QUIET_METHODS for method in methods):
+            self._invalidate_query_cache()
+
+        loop = self._loop or asyncio.get_running_loop()
+        futures: Dict[int, asyncio.Future] = {}
+        frames = []
+        for method, params in commands:
+            cmd_id = next(self._command_ids) & 0x7FFFFFFF
+            frame = self._build_frame(method, params, cmd_id)
+            self._log_frame(frame, method)
+            frames.append(frame)
+            futures[cmd_id] = self._pending_responses[cmd_id] = loop.create_future()
+
+        try:
+            try:
+                writer = self._writer
+                if writer is None or writer.is_closing():
+                    raise OSError("connection is closing")
+                writer.write(b"".join(frames))
+                await writer.drain()
+            except Exception as e:
+                raise ConnectionError(f"Failed to send commands: {e}")
+
+            try:
+                async with asyncio.timeout(timeout or self.COMMAND_TIMEOUT):
+                    responses = await asyncio.gather(*futures.values())
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Command timeout: {', '.join(methods)}")
+        finally:
+            for cmd_id in futures:
+                self._pending_responses.pop(cmd_id, None)
+
+        for method, response in zip(methods, responses):
+            if "error" in response:
+                error_msg = response.get("error", "Unknown error")
+                error_code = response.get("code", 0)
+                raise CommandError(f"Command failed: {method}: {error_msg} (code {error_code})")
+        return responses
+
+    async def _send_poll_command(
+        self, method: str, params: Any = None, force_refresh: bool = False, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Send a read-only state query, reusing a response younger than its cache TTL.
+
+        Lets several pollers (status endpoints, UI refresh, execution loop) share one
+        round-trip instead of each issuing their own.
+
+        Args:
+            method: Query method name (one of POLL_METHODS)
+            params: Query parameters
+            force_refresh: Always query the telescope (the response is still cached)
+            timeout: Command timeout in seconds (default: COMMAND_TIMEOUT)
+
+        Returns:
+            Response message dict (callers may modify it; the cache keeps its own copy)
+        """
+        key = (method, _encode_json(params) if params else b"")
+        if not force_refresh:
+            cached = self._poll_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.POLL_CACHE_TTLS[method]:
+                return copy.deepcopy(cached[1])
+
+        # A state change while the query is in flight makes its response stale; don't cache it
+        generation = self._cache_generation
+        response = await self._send_command(method, params, timeout)
+        if self._cache_generation == generation:
+            self._poll_cache[key] = (time.monotonic(), copy.deepcopy(response))
+        return response
+
+    async def _send_bool_command(self, method: str, params: Any, label: str) -> bool:
+        """Send a command that reports success via result code 0, logging its response.
+
+        Args:
+            method: Command method name
+            params: Command parameters
+            label: Human-readable command name for the response log line
+
+        Returns:
+            True if the telescope reported success
+        """
+        response = await self._send_command(method, params)
+        self.logger.info("%s response: %s", label, response)
+        return self._ok(response)
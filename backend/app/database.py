@@ -1,10 +1,15 @@
 """Database configuration and session management."""
 
 import logging
+from itertools import islice
+from typing import Any, Dict, Iterable, List
 
-from sqlalchemy import create_engine
+from sqlalchemy import DateTime, create_engine, event, insert, make_url
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.functions import FunctionElement
 
 from app.core.config import get_settings
 
@@ -16,27 +21,87 @@ settings = get_settings()
 DATABASE_URL = settings.database_url
 logger.info("Database URL configured: %s", DATABASE_URL)
 
+
+def _engine_options(url: str) -> Dict[str, Any]:
+    """Connection pool and statement cache options for create_engine().
+
+    The pool is bounded so the RTMP preview thread, Celery tasks and FastAPI
+    handlers queue for connections instead of exhausting the server; pre-ping
+    drops connections the server closed while idle. SQLite keeps its default
+    pool and only needs cross-thread access enabled. psycopg2 engines also use
+    the driver's fast execution helpers for executemany.
+    """
+    options: Dict[str, Any] = {"query_cache_size": settings.db_query_cache_size}
+    if "sqlite" in url:
+        options["connect_args"] = {"check_same_thread": False}
+    else:
+        options.update(pool_size=settings.db_pool_size, max_overflow=settings.db_max_overflow, pool_pre_ping=True)
+    if make_url(url).get_driver_name() == "psycopg2":
+        # INSERT executemany is already folded into multi-VALUES pages; batch UPDATE/DELETE too
+        options.update(
+            executemany_mode="values_plus_batch", insertmanyvalues_page_size=1000, executemany_batch_page_size=500
+        )
+    return options
+
+
 # Create engine
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
     echo=False,  # Set to True for SQL logging during development
+    **_engine_options(DATABASE_URL),
 )
 
+
+def _enable_sqlite_wal(engine):
+    """Use WAL journaling on SQLite so commits don't fsync the whole database file."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
+_enable_sqlite_wal(engine)
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create test engine for test database
 TEST_DATABASE_URL = settings.test_database_url
-test_engine = create_engine(
-    TEST_DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in TEST_DATABASE_URL else {}, echo=False
-)
+test_engine = create_engine(TEST_DATABASE_URL, echo=False, **_engine_options(TEST_DATABASE_URL))
+_enable_sqlite_wal(test_engine)
 TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
 # Create declarative base
 Base = declarative_base()
 
 
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, for server-side defaults on DateTime (no time zone) columns.
+
+    now() on PostgreSQL is converted to the session TimeZone when stored in a column
+    without a time zone, so it is taken at UTC explicitly; SQLite's CURRENT_TIMESTAMP is
+    already UTC.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
 def get_db():
     """Get database session."""
     db = SessionLocal()
@@ -61,3 +126,55 @@ def get_test_db():
 def init_db():
     """Initialize database (create all tables)."""
     Base.metadata.create_all(bind=engine)
+
+
+def bulk_insert(db, model, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000) -> int:
+    """Insert rows (dicts of column values) as multi-row INSERTs, committing once per chunk.
+
+    Much faster than session.add() per row for catalog loads: no ORM objects are built
+    and each chunk goes to the database as a few batched statements.
+
+    Args:
+        db: Database session
+        model: Mapped model class to insert into
+        rows: Column-value dicts, consumed lazily
+        chunk_size: Rows per INSERT batch and transaction
+
+    Returns:
+        Number of rows inserted
+    """
+    rows = iter(rows)
+    inserted = 0
+    while chunk := list(islice(rows, chunk_size)):
+        db.execute(insert(model), chunk)
+        db.commit()
+        inserted += len(chunk)
+    return inserted
+
+
+def insert_ignoring_duplicates(
+    db, model, rows: Iterable[Dict[str, Any]], index_elements: List[str], chunk_size: int = 1000
+) -> int:
+    """Insert rows as multi-VALUES INSERT ... ON CONFLICT DO NOTHING, committing once per chunk.
+
+    Rows that collide with an existing row on the unique index over index_elements are
+    skipped by the database, so callers need no per-row existence check.
+
+    Args:
+        db: Database session (PostgreSQL or SQLite)
+        model: Mapped model class to insert into
+        rows: Column-value dicts, consumed lazily
+        index_elements: Columns of the unique index that defines a duplicate
+        chunk_size: Rows per INSERT statement and transaction
+
+    Returns:
+        Number of rows actually inserted
+    """
+    dialect_insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    rows = iter(rows)
+    inserted = 0
+    while chunk := list(islice(rows, chunk_size)):
+        result = db.execute(dialect_insert(model).values(chunk).on_conflict_do_nothing(index_elements=index_elements))
+        db.commit()
+        inserted += result.rowcount
+    return inserted
@@ -1,34 +1,43 @@
 """SQLAlchemy models for catalog tables (DSO and comets)."""
 
-from datetime import datetime
+from sqlalchemy import REAL, Column, Date, DateTime, Float, Index, Integer, String, Text
 
-from sqlalchemy import Column, Date, DateTime, Float, Integer, String, Text
-
-from app.database import Base
+from app.database import Base, utcnow
 
 
 class DSOCatalog(Base):
     """Deep Sky Object catalog table."""
 
     __tablename__ = "dso_catalog"
+    # "NGC 224"-style lookups filter on both columns; one composite B-tree serves them
+    __table_args__ = (
+        Index("ix_dso_catalog_name_number", "catalog_name", "catalog_number", unique=True),
+        # Visibility queries (dec range + magnitude limit) become index-only scans on PostgreSQL
+        Index(
+            "ix_dso_catalog_dec_mag",
+            "dec_degrees",
+            "magnitude",
+            postgresql_include=["ra_hours", "object_type", "common_name"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    catalog_name = Column(String(10), nullable=False, index=True)  # NGC, IC - indexed for search
-    catalog_number = Column(Integer, nullable=False, index=True)  # Indexed for search
+    catalog_name = Column(String(10), nullable=False)  # NGC, IC - searched via ix_dso_catalog_name_number
+    catalog_number = Column(Integer, nullable=False)
     common_name = Column(String(100), nullable=True, index=True)  # M31, Andromeda Galaxy, etc. - indexed for search
     caldwell_number = Column(Integer, nullable=True)  # Caldwell catalog number (1-109)
-    ra_hours = Column(Float, nullable=False)  # Right ascension in hours
-    dec_degrees = Column(Float, nullable=False, index=True)  # Declination in degrees - indexed for visibility queries
+    ra_hours = Column(REAL, nullable=False)  # Right ascension in hours
+    dec_degrees = Column(REAL, nullable=False, index=True)  # Declination in degrees - indexed for visibility queries
     object_type = Column(
         String(50), nullable=False, index=True
     )  # galaxy, nebula, cluster, etc. - indexed for filtering
-    magnitude = Column(Float, nullable=True, index=True)  # Indexed for brightness filtering
+    magnitude = Column(REAL, nullable=True, index=True)  # Indexed for brightness filtering
     surface_brightness = Column(Float, nullable=True)
-    size_major_arcmin = Column(Float, nullable=True)  # Major axis in arcminutes
-    size_minor_arcmin = Column(Float, nullable=True)  # Minor axis in arcminutes
+    size_major_arcmin = Column(REAL, nullable=True)  # Major axis in arcminutes
+    size_minor_arcmin = Column(REAL, nullable=True)  # Minor axis in arcminutes
     constellation = Column(String(3), nullable=True, index=True)  # Constellation abbreviation - indexed for filtering
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
 
 class CometCatalog(Base):
@@ -42,13 +51,13 @@ class CometCatalog(Base):
     discovery_date = Column(Date, nullable=True)
 
     # Orbital elements
-    epoch_jd = Column(Float, nullable=False)  # Julian date of epoch
+    epoch_jd = Column(Float, nullable=False, index=True)  # Julian date of epoch
     perihelion_distance_au = Column(Float, nullable=False)  # Distance at perihelion in AU
     eccentricity = Column(Float, nullable=False)  # Orbital eccentricity
     inclination_deg = Column(Float, nullable=False)  # Inclination in degrees
     arg_perihelion_deg = Column(Float, nullable=False)  # Argument of perihelion in degrees
     ascending_node_deg = Column(Float, nullable=False)  # Longitude of ascending node in degrees
-    perihelion_time_jd = Column(Float, nullable=False)  # Time of perihelion passage (JD)
+    perihelion_time_jd = Column(Float, nullable=False, index=True)  # Time of perihelion passage (JD)
 
     # Magnitude parameters
     absolute_magnitude = Column(Float, nullable=False)  # H0 or M1
@@ -66,6 +75,8 @@ class AsteroidCatalog(Base):
     """Asteroid catalog table."""
 
     __tablename__ = "asteroid_catalog"
+    # "Bright enough with fresh elements" filtering
+    __table_args__ = (Index("ix_asteroid_catalog_mag_epoch", "absolute_magnitude", "epoch_jd"),)
 
     id = Column(Integer, primary_key=True, index=True)
     designation = Column(String(50), nullable=False, unique=True)  # Official designation
@@ -74,7 +85,7 @@ class AsteroidCatalog(Base):
     discovery_date = Column(Date, nullable=True)
 
     # Orbital elements
-    epoch_jd = Column(Float, nullable=False)  # Julian date of epoch
+    epoch_jd = Column(Float, nullable=False, index=True)  # Julian date of epoch
     perihelion_distance_au = Column(Float, nullable=False)  # Distance at perihelion in AU
     eccentricity = Column(Float, nullable=False)  # Orbital eccentricity
     inclination_deg = Column(Float, nullable=False)  # Inclination in degrees
@@ -97,29 +108,33 @@ class AsteroidCatalog(Base):
     data_source = Column(String(50), nullable=True)  # Source of orbital elements
     notes = Column(Text, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
 
 class StarCatalog(Base):
     """Star catalog table."""
 
     __tablename__ = "star_catalog"
+    __table_args__ = (
+        Index("ix_star_catalog_name_number", "catalog_name", "catalog_number", unique=True),
+        Index("ix_star_catalog_dec_mag", "dec_degrees", "magnitude"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    catalog_name = Column(String(10), nullable=False, index=True)  # HIP, HD, HR, Bayer, Flamsteed
-    catalog_number = Column(String(20), nullable=False, index=True)  # Catalog identifier
+    catalog_name = Column(String(10), nullable=False)  # HIP, HD, HR, Bayer, Flamsteed
+    catalog_number = Column(String(20), nullable=False)  # Catalog identifier
     common_name = Column(String(100), nullable=True, index=True)  # Polaris, Betelgeuse, etc.
     bayer_designation = Column(String(20), nullable=True)  # α Umi, α Ori, etc.
     flamsteed_number = Column(Integer, nullable=True)  # Flamsteed number
-    ra_hours = Column(Float, nullable=False)  # Right ascension in hours
-    dec_degrees = Column(Float, nullable=False, index=True)  # Declination in degrees
-    magnitude = Column(Float, nullable=True, index=True)  # Visual magnitude
+    ra_hours = Column(REAL, nullable=False)  # Right ascension in hours
+    dec_degrees = Column(REAL, nullable=False, index=True)  # Declination in degrees
+    magnitude = Column(REAL, nullable=True, index=True)  # Visual magnitude
     spectral_type = Column(String(20), nullable=True)  # O5V, G2V, M1III, etc.
     distance_ly = Column(Float, nullable=True)  # Distance in light years
     constellation = Column(String(3), nullable=True, index=True)  # Constellation abbreviation
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
 
 class ConstellationName(Base):
@@ -147,5 +162,5 @@ class ImageSourceStats(Base):
     avg_quality_score = Column(Float, nullable=True)
     priority_score = Column(Float, nullable=True)
     last_used = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
@@ -1,6 +1,10 @@
 """Settings models for global application configuration."""
 
-from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+from sqlalchemy import Boolean, Column, DateTime, Float, Index, Integer, String
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -81,146 +85,174 @@ class AppSetting(Base):
     """
 
     __tablename__ = "app_settings"
+    __table_args__ = (
+        # Category listings ("all planning.* settings") filter on category and read key;
+        # the leading category column also serves plain category lookups.
+        Index("ix_app_settings_category_key", "category", "key"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     key = Column(String, unique=True, nullable=False, index=True)
     value = Column(String, nullable=False)
     value_type = Column(String, nullable=False, default="string")  # string, int, bool, path
     description = Column(String, nullable=True)
-    category = Column(String, nullable=True, index=True)  # telescope, processing, storage, etc.
+    category = Column(String, nullable=True)  # telescope, processing, storage, etc.
     is_secret = Column(Boolean, default=False)  # For sensitive values like API keys
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    @property
+    def typed_value(self):
+        """Value converted according to value_type (bool, int, or the raw string)."""
+        if self.value_type == "bool":
+            return self.value.lower() == "true"
+        if self.value_type == "int":
+            return int(self.value)
+        return self.value
+
     def __repr__(self):
         return f"<AppSetting key={self.key} value={self.value}>"
 
 
+@dataclass(frozen=True, slots=True)
+class DefaultSetting:
+    """An AppSetting row created on first startup."""
+
+    key: str
+    value: str
+    value_type: str
+    description: str
+    category: str
+    is_secret: bool = False
+
+
 # Default settings to be created on first startup
-DEFAULT_SETTINGS = [
+DEFAULT_SETTINGS: Tuple[DefaultSetting, ...] = (
     # Telescope settings
-    {
-        "key": "telescope.image_source_dir",
-        "value": "/fits",
-        "value_type": "path",
-        "description": "Directory where telescope images are stored (mounted volume)",
-        "category": "telescope",
-    },
-    {
-        "key": "telescope.image_dest_dir",
-        "value": "./data/telescope_images",
-        "value_type": "path",
-        "description": "Local directory to copy telescope images after observation",
-        "category": "telescope",
-    },
-    {
-        "key": "telescope.default_port",
-        "value": "4700",
-        "value_type": "int",
-        "description": "Default port for Seestar telescope control API",
-        "category": "telescope",
-    },
+    DefaultSetting(
+        key="telescope.image_source_dir",
+        value="/fits",
+        value_type="path",
+        description="Directory where telescope images are stored (mounted volume)",
+        category="telescope",
+    ),
+    DefaultSetting(
+        key="telescope.image_dest_dir",
+        value="./data/telescope_images",
+        value_type="path",
+        description="Local directory to copy telescope images after observation",
+        category="telescope",
+    ),
+    DefaultSetting(
+        key="telescope.default_port",
+        value="4700",
+        value_type="int",
+        description="Default port for Seestar telescope control API",
+        category="telescope",
+    ),
     # Processing settings
-    {
-        "key": "processing.working_dir",
-        "value": "./data/processing",
-        "value_type": "path",
-        "description": "Working directory for image processing operations",
-        "category": "processing",
-    },
-    {
-        "key": "processing.output_dir",
-        "value": "./data/output",
-        "value_type": "path",
-        "description": "Directory for final processed images",
-        "category": "processing",
-    },
-    {
-        "key": "processing.auto_copy_after_plan",
-        "value": "true",
-        "value_type": "bool",
-        "description": "Automatically copy images from telescope after plan completion",
-        "category": "processing",
-    },
-    {
-        "key": "processing.default_format",
-        "value": "jpeg",
-        "value_type": "string",
-        "description": "Default output format for processed images (jpeg, png, tiff)",
-        "category": "processing",
-    },
-    {
-        "key": "processing.default_quality",
-        "value": "95",
-        "value_type": "int",
-        "description": "Default JPEG quality for processed images (1-100)",
-        "category": "processing",
-    },
+    DefaultSetting(
+        key="processing.working_dir",
+        value="./data/processing",
+        value_type="path",
+        description="Working directory for image processing operations",
+        category="processing",
+    ),
+    DefaultSetting(
+        key="processing.output_dir",
+        value="./data/output",
+        value_type="path",
+        description="Directory for final processed images",
+        category="processing",
+    ),
+    DefaultSetting(
+        key="processing.auto_copy_after_plan",
+        value="true",
+        value_type="bool",
+        description="Automatically copy images from telescope after plan completion",
+        category="processing",
+    ),
+    DefaultSetting(
+        key="processing.default_format",
+        value="jpeg",
+        value_type="string",
+        description="Default output format for processed images (jpeg, png, tiff)",
+        category="processing",
+    ),
+    DefaultSetting(
+        key="processing.default_quality",
+        value="95",
+        value_type="int",
+        description="Default JPEG quality for processed images (1-100)",
+        category="processing",
+    ),
     # Storage settings
-    {
-        "key": "storage.max_job_history",
-        "value": "100",
-        "value_type": "int",
-        "description": "Maximum number of processing jobs to keep in history",
-        "category": "storage",
-    },
-    {
-        "key": "storage.auto_cleanup_days",
-        "value": "30",
-        "value_type": "int",
-        "description": "Automatically cleanup processing files older than this many days (0=disabled)",
-        "category": "storage",
-    },
+    DefaultSetting(
+        key="storage.max_job_history",
+        value="100",
+        value_type="int",
+        description="Maximum number of processing jobs to keep in history",
+        category="storage",
+    ),
+    DefaultSetting(
+        key="storage.auto_cleanup_days",
+        value="30",
+        value_type="int",
+        description="Automatically cleanup processing files older than this many days (0=disabled)",
+        category="storage",
+    ),
     # UI settings
-    {
-        "key": "ui.theme",
-        "value": "dark",
-        "value_type": "string",
-        "description": "UI theme (dark or light)",
-        "category": "ui",
-    },
-    {
-        "key": "ui.date_format",
-        "value": "YYYY-MM-DD",
-        "value_type": "string",
-        "description": "Date display format",
-        "category": "ui",
-    },
-    {
-        "key": "ui.time_format",
-        "value": "24h",
-        "value_type": "string",
-        "description": "Time display format (12h or 24h)",
-        "category": "ui",
-    },
+    DefaultSetting(
+        key="ui.theme",
+        value="dark",
+        value_type="string",
+        description="UI theme (dark or light)",
+        category="ui",
+    ),
+    DefaultSetting(
+        key="ui.date_format",
+        value="YYYY-MM-DD",
+        value_type="string",
+        description="Date display format",
+        category="ui",
+    ),
+    DefaultSetting(
+        key="ui.time_format",
+        value="24h",
+        value_type="string",
+        description="Time display format (12h or 24h)",
+        category="ui",
+    ),
     # Daily Planning settings
-    {
-        "key": "planning.daily_enabled",
-        "value": "true",
-        "value_type": "bool",
-        "description": "Enable automatic daily plan generation at noon",
-        "category": "planning",
-    },
-    {
-        "key": "planning.daily_time_hour",
-        "value": "12",
-        "value_type": "int",
-        "description": "Hour of day to generate daily plan (0-23, in local timezone)",
-        "category": "planning",
-    },
-    {
-        "key": "planning.daily_target_count",
-        "value": "5",
-        "value_type": "int",
-        "description": "Number of targets to include in daily plan",
-        "category": "planning",
-    },
-    {
-        "key": "planning.webhook_url",
-        "value": "",
-        "value_type": "string",
-        "description": "Optional webhook URL for plan creation notifications",
-        "category": "planning",
-        "is_secret": False,  # nosec B105 - This is a boolean flag, not a password
-    },
-]
+    DefaultSetting(
+        key="planning.daily_enabled",
+        value="true",
+        value_type="bool",
+        description="Enable automatic daily plan generation at noon",
+        category="planning",
+    ),
+    DefaultSetting(
+        key="planning.daily_time_hour",
+        value="12",
+        value_type="int",
+        description="Hour of day to generate daily plan (0-23, in local timezone)",
+        category="planning",
+    ),
+    DefaultSetting(
+        key="planning.daily_target_count",
+        value="5",
+        value_type="int",
+        description="Number of targets to include in daily plan",
+        category="planning",
+    ),
+    DefaultSetting(
+        key="planning.webhook_url",
+        value="",
+        value_type="string",
+        description="Optional webhook URL for plan creation notifications",
+        category="planning",
+        is_secret=False,  # nosec B105 - This is a boolean flag, not a password
+    ),
+)
+
+DEFAULT_SETTINGS_BY_KEY: Mapping[str, DefaultSetting] = MappingProxyType({s.key: s for s in DEFAULT_SETTINGS})
@@ -73,12 +73,14 @@ async def stream_preview(
         while True:
             # Block in a thread-pool worker until the capture thread signals
             # a new frame (or 1 s timeout so we don't hang forever if idle)
-            frame_bytes, last_seq = await loop.run_in_executor(
+            frame_bytes, seq = await loop.run_in_executor(
                 None,
                 lambda seq=last_seq: service.wait_for_new_frame(seq, timeout=1.0),
             )
 
-            if frame_bytes:
+            # A timeout hands back the frame already sent; only new frames go out
+            if frame_bytes and seq != last_seq:
+                last_seq = seq
                 yield (b"--frame\r\n" b"Content-Type: image/jpeg\r\n\r\n" + frame_bytes + b"\r\n")
 
     return StreamingResponse(
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +15,74 @@ from sqlalchemy.orm import Session
 from app.models import AsteroidEphemeris, AsteroidOrbitalElements, AsteroidTarget, AsteroidVisibility, Location
 from app.models.catalog_models import AsteroidCatalog
 
+GAUSSIAN_GRAVITATIONAL_CONSTANT = 0.01720209895  # k, radians per day
+OBLIQUITY_J2000 = np.radians(23.4393)  # Obliquity of the ecliptic
+ORBITAL_ELEMENT_FIELDS = (
+    "epoch_jd",
+    "semi_major_axis_au",
+    "eccentricity",
+    "inclination_deg",
+    "arg_perihelion_deg",
+    "ascending_node_deg",
+    "mean_anomaly_deg",
+)
+
+
+def compute_positions(elements: Dict[str, np.ndarray], jd: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute equatorial positions for many asteroids at once from Keplerian elements.
+
+    Every step is a NumPy ufunc over whole arrays, so a catalog is propagated in
+    one pass instead of one Python-level solve per asteroid. Scalars work too.
+
+    Args:
+        elements: Orbital element arrays keyed by ORBITAL_ELEMENT_FIELDS
+        jd: Julian date to compute positions at
+
+    Returns:
+        Tuple of (ra_hours, dec_degrees, helio_distance_au) arrays
+    """
+    a = np.asarray(elements["semi_major_axis_au"], dtype=float)
+    e = np.asarray(elements["eccentricity"], dtype=float)
+
+    # Mean anomaly at observation time from mean motion n = k / sqrt(a^3)
+    mean_motion = GAUSSIAN_GRAVITATIONAL_CONSTANT / np.sqrt(a**3)
+    mean_anomaly = np.radians(elements["mean_anomaly_deg"]) + mean_motion * (jd - np.asarray(elements["epoch_jd"]))
+
+    # Solve Kepler's equation for eccentric anomaly (Newton-Raphson, all rows together)
+    E = mean_anomaly
+    for _ in range(10):
+        E = E - (E - e * np.sin(E) - mean_anomaly) / (1 - e * np.cos(E))
+
+    # True anomaly and heliocentric distance
+    true_anomaly = 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))
+    r = a * (1 - e * np.cos(E))
+
+    # Position in orbital plane, measured from the ascending node (argument of latitude ω + ν)
+    arg_latitude = np.radians(elements["arg_perihelion_deg"]) + true_anomaly
+    x_orb = r * np.cos(arg_latitude)
+    y_orb = r * np.sin(arg_latitude)
+
+    # Transform to ecliptic frame
+    incl = np.radians(elements["inclination_deg"])
+    omega = np.radians(elements["ascending_node_deg"])
+    x_ecl = np.cos(omega) * x_orb - np.sin(omega) * y_orb * np.cos(incl)
+    y_ecl = np.sin(omega) * x_orb + np.cos(omega) * y_orb * np.cos(incl)
+    z_ecl = y_orb * np.sin(incl)
+
+    # Convert ecliptic to equatorial (J2000)
+    x_eq = x_ecl
+    y_eq = y_ecl * np.cos(OBLIQUITY_J2000) - z_ecl * np.sin(OBLIQUITY_J2000)
+    z_eq = y_ecl * np.sin(OBLIQUITY_J2000) + z_ecl * np.cos(OBLIQUITY_J2000)
+
+    ra_hours = np.degrees(np.mod(np.arctan2(y_eq, x_eq), 2 * np.pi)) / 15.0
+
+    # Declination (clamped to valid range)
+    r_eq = np.sqrt(x_eq**2 + y_eq**2 + z_eq**2)
+    dec_degrees = np.degrees(np.arcsin(np.clip(z_eq / r_eq, -1.0, 1.0)))
+
+    return ra_hours, dec_degrees, r
+
 
 class AsteroidService:
     """Service for managing asteroid catalog and computing ephemerides."""
@@ -154,69 +222,15 @@ class AsteroidService:
         jd = t.jd
 
         oe = asteroid.orbital_elements
-
-        # Compute mean motion in radians per day
-        # n = sqrt(GM_sun / a^3) where k = Gaussian gravitational constant
-        k = 0.01720209895  # Gaussian gravitational constant
-        mean_motion = k / np.sqrt(oe.semi_major_axis_au**3)
-
-        # Time since epoch in days
-        dt = jd - oe.epoch_jd
-
-        # Mean anomaly at observation time
-        mean_anomaly = np.radians(oe.mean_anomaly_deg) + mean_motion * dt
-
-        # Solve Kepler's equation for eccentric anomaly (Newton-Raphson)
-        E = mean_anomaly  # Initial guess
-        for _ in range(10):  # Iterate
-            E = E - (E - oe.eccentricity * np.sin(E) - mean_anomaly) / (1 - oe.eccentricity * np.cos(E))
-
-        # True anomaly
-        true_anomaly = 2 * np.arctan2(
-            np.sqrt(1 + oe.eccentricity) * np.sin(E / 2), np.sqrt(1 - oe.eccentricity) * np.cos(E / 2)
+        ra_hours, dec_degrees, r = compute_positions(
+            {field: getattr(oe, field) for field in ORBITAL_ELEMENT_FIELDS}, jd
         )
+        return self._build_ephemeris(asteroid, time_utc, jd, ra_hours, dec_degrees, r)
 
-        # Heliocentric distance
-        r = oe.semi_major_axis_au * (1 - oe.eccentricity * np.cos(E))
-
-        # Convert orbital elements to ecliptic coordinates
-        # Argument of latitude (ω + ν)
-        arg_latitude = np.radians(oe.arg_perihelion_deg) + true_anomaly
-
-        # Position in orbital plane
-        x_orb = r * np.cos(arg_latitude)
-        y_orb = r * np.sin(arg_latitude)
-
-        # Transform to ecliptic frame
-        incl = np.radians(oe.inclination_deg)
-        omega = np.radians(oe.ascending_node_deg)
-
-        # Ecliptic coordinates
-        x_ecl = np.cos(omega) * x_orb - np.sin(omega) * y_orb * np.cos(incl)
-        y_ecl = np.sin(omega) * x_orb + np.cos(omega) * y_orb * np.cos(incl)
-        z_ecl = y_orb * np.sin(incl)
-
-        # Convert ecliptic to equatorial (J2000)
-        # Obliquity of ecliptic (23.4393 degrees)
-        epsilon = np.radians(23.4393)
-
-        x_eq = x_ecl
-        y_eq = y_ecl * np.cos(epsilon) - z_ecl * np.sin(epsilon)
-        z_eq = y_ecl * np.sin(epsilon) + z_ecl * np.cos(epsilon)
-
-        # Calculate RA and Dec
-        ra_rad = np.arctan2(y_eq, x_eq)
-        if ra_rad < 0:
-            ra_rad += 2 * np.pi
-        ra_hours = np.degrees(ra_rad) / 15.0
-
-        # Declination (clamped to valid range)
-        r_eq = np.sqrt(x_eq**2 + y_eq**2 + z_eq**2)
-        dec_degrees = np.degrees(np.arcsin(np.clip(z_eq / r_eq, -1.0, 1.0)))
-
-        # Get Sun position for elongation calculation
-        get_sun(t)
-
+    def _build_ephemeris(
+        self, asteroid: AsteroidTarget, time_utc: datetime, jd: float, ra_hours: float, dec_degrees: float, r: float
+    ) -> AsteroidEphemeris:
+        """Build an AsteroidEphemeris from a computed position."""
         # Estimate geocentric distance (simplified - doesn't account for Earth's position properly)
         # For better accuracy, should compute Earth's position and vector difference
         geo_distance_au = r  # Approximation
@@ -320,23 +334,61 @@ class AsteroidService:
         Returns:
             List of visible asteroids with visibility info
         """
-        all_asteroids = self.get_all_asteroids()
-        visible = []
-
-        for asteroid in all_asteroids:
+        candidates = [
+            asteroid
+            for asteroid in self.get_all_asteroids()
             # Skip if too faint
-            if asteroid.current_magnitude and asteroid.current_magnitude > max_magnitude:
-                continue
-
-            try:
-                visibility = self.compute_visibility(asteroid, location, time_utc)
-
-                if visibility.is_visible and visibility.altitude_deg >= min_altitude and visibility.is_dark_enough:
-                    visible.append(visibility)
-            except Exception as e:
-                # Skip asteroids that fail computation
-                logger.warning("Failed to compute visibility for %s: %s", asteroid.designation, e)
-                continue
+            if not (asteroid.current_magnitude and asteroid.current_magnitude > max_magnitude)
+        ]
+        if not candidates:
+            return []
+
+        t = Time(time_utc)
+        obs_location = EarthLocation(
+            lat=location.latitude * u.deg, lon=location.longitude * u.deg, height=location.elevation * u.m
+        )
+        altaz_frame = AltAz(obstime=t, location=obs_location)
+
+        # Nothing qualifies unless it's dark enough (Sun below -18 degrees)
+        if get_sun(t).transform_to(altaz_frame).alt.degree >= -18:
+            return []
+
+        # Propagate every candidate and transform to AltAz in one vectorized pass
+        elements = {
+            field: np.array([getattr(asteroid.orbital_elements, field) for asteroid in candidates], dtype=float)
+            for field in ORBITAL_ELEMENT_FIELDS
+        }
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ra_hours, dec_degrees, r = compute_positions(elements, t.jd)
+        valid = np.isfinite(ra_hours) & np.isfinite(dec_degrees) & np.isfinite(r)
+        for i in np.flatnonzero(~valid):
+            # Skip asteroids whose elements give no solution (e.g. e >= 1)
+            logger.warning("Failed to compute visibility for %s: invalid orbital elements", candidates[i].designation)
+
+        coords = SkyCoord(
+            ra=np.where(valid, ra_hours, 0.0) * u.hourangle, dec=np.where(valid, dec_degrees, 0.0) * u.deg, frame="icrs"
+        )
+        altaz = coords.transform_to(altaz_frame)
+        altitudes = altaz.alt.degree
+        azimuths = altaz.az.degree
+
+        visible = []
+        for i in np.flatnonzero(valid & (altitudes > 0) & (altitudes >= min_altitude)):
+            asteroid = candidates[i]
+            ephemeris = self._build_ephemeris(asteroid, time_utc, t.jd, ra_hours[i], dec_degrees[i], r[i])
+            elongation_ok = bool(ephemeris.elongation_deg and ephemeris.elongation_deg > 30)
+            visible.append(
+                AsteroidVisibility(
+                    asteroid=asteroid,
+                    ephemeris=ephemeris,
+                    altitude_deg=altitudes[i],
+                    azimuth_deg=azimuths[i],
+                    is_visible=True,
+                    is_dark_enough=True,
+                    elongation_ok=elongation_ok,
+                    recommended=elongation_ok,
+                )
+            )
 
         # Sort by magnitude (brightest first)
         visible.sort(key=lambda v: v.ephemeris.magnitude if v.ephemeris.magnitude else 99.0)
@@ -110,11 +110,19 @@ class EphemerisService:
         """Find times when sun reaches a specific angle below horizon."""
 
         def sun_altitude_below(t):
-            """Return True when sun is below the specified angle."""
+            """Return True when sun is below the specified angle.
+
+            find_discrete passes every sample time as one array-valued Time, so this
+            evaluates the whole grid in a single vectorized observe/altaz and returns
+            a boolean array.
+            """
             sun_apparent = observer.at(t).observe(self.sun).apparent()
             alt, _, _ = sun_apparent.altaz()
             return alt.degrees < angle
 
+        # Hourly samples; find_discrete then refines each crossing
+        sun_altitude_below.step_days = 1 / 24
+
         times, events = almanac.find_discrete(t0, t1, sun_altitude_below)
 
         # First True event is evening (sun going below angle)
@@ -1,23 +1,46 @@
 """Planetary ephemeris service for calculating real-time positions of planets and moons."""
 
 import logging
+import threading
+import time as _time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
+from skyfield import almanac
 from skyfield.api import Topos, load
-from skyfield.searchlib import find_discrete
-from skyfield.timelib import Time
 
 logger = logging.getLogger(__name__)
 
+# DE421 kernel and timescale are shared by every PlanetaryEphemeris; loading them is the expensive part
+_EPH = None
+_TS = None
+_LOAD_LOCK = threading.Lock()
+
+# "Now" positions are reused for this long; polling clients at the same site share one computation
+POSITION_CACHE_TTL = 30.0
+POSITION_CACHE_MAXSIZE = 512
+
+_MOON_PHASE_NAMES = ("New Moon", "Waxing Crescent", "Full Moon", "Waning Crescent")
+
+
+def _load_ephemeris_data():
+    """Load the DE421 kernel and timescale once per process."""
+    global _EPH, _TS
+    with _LOAD_LOCK:
+        if _EPH is None:
+            _EPH = load("de421.bsp")
+            _TS = load.timescale()
+    return _EPH, _TS
+
 
 class PlanetaryEphemeris:
     """Calculate positions of planets, moons, and the Sun using Skyfield."""
 
     def __init__(self):
         """Initialize ephemeris with DE421 planetary data."""
-        self.eph = load("de421.bsp")
-        self.ts = load.timescale()
+        self.eph, self.ts = _load_ephemeris_data()
+        self._earth = self.eph["earth"]
 
         # Define celestial bodies
         self.bodies = {
@@ -45,6 +68,29 @@ class PlanetaryEphemeris:
             "neptune": "Neptune",
         }
 
+        # Observers (earth + Topos) keyed by site, shared across bodies and requests
+        self._site_observer = lru_cache(maxsize=128)(self._build_observer)
+
+        # Current-time positions keyed by (body, *site) and observer positions keyed by site,
+        # both for the current TTL bucket only
+        self._position_cache: Dict[tuple, Dict[str, float]] = {}
+        self._obs_at_cache: Dict[tuple, Any] = {}
+        self._position_cache_bucket: Optional[int] = None
+        self._position_cache_lock = threading.Lock()
+
+    def _build_observer(self, latitude: float, longitude: float, elevation: float) -> Any:
+        """Build the Skyfield observer vector for a site."""
+        return self._earth + Topos(latitude_degrees=latitude, longitude_degrees=longitude, elevation_m=elevation)
+
+    @staticmethod
+    def _site_key(latitude: float, longitude: float, elevation: float) -> tuple:
+        """Round site coordinates (6 decimals is ~0.1 m) so repeat requests from the same site share cache entries."""
+        return round(latitude, 6), round(longitude, 6), round(elevation, 1)
+
+    def _observer(self, latitude: float, longitude: float, elevation: float) -> Any:
+        """Get the cached observer for a site."""
+        return self._site_observer(*self._site_key(latitude, longitude, elevation))
+
     def get_position(
         self, body_name: str, latitude: float, longitude: float, elevation: float = 0.0, time: Optional[datetime] = None
     ) -> Dict[str, float]:
@@ -71,25 +117,64 @@ class PlanetaryEphemeris:
         if body_name not in self.bodies:
             raise ValueError(f"Unknown body: {body_name}. Valid: {list(self.bodies.keys())}")
 
-        # Create observer location
-        observer = self.eph["earth"] + Topos(
-            latitude_degrees=latitude, longitude_degrees=longitude, elevation_m=elevation
-        )
-
-        # Get current time or use provided
         if time is None:
-            time = datetime.now(timezone.utc)
+            return self._get_current_position(body_name, latitude, longitude, elevation)
+
         t = self.ts.from_datetime(time)
+        return self._position_from_obs_at(self._observer(latitude, longitude, elevation).at(t), body_name)
+
+    def _get_current_position(
+        self, body_name: str, latitude: float, longitude: float, elevation: float
+    ) -> Dict[str, float]:
+        """Get a body's position now, reusing results computed within the last POSITION_CACHE_TTL seconds.
+
+        Positions are only cached for "now" requests; an explicit time always recomputes.
+        Bodies requested for the same site within a bucket share one observer position,
+        so a get_all_visible sweep is consistent and computes it once.
+        """
+        bucket = int(_time.time() // POSITION_CACHE_TTL)
+        site = self._site_key(latitude, longitude, elevation)
+        key = (body_name, *site)
+
+        with self._position_cache_lock:
+            if bucket != self._position_cache_bucket or len(self._position_cache) >= POSITION_CACHE_MAXSIZE:
+                self._position_cache.clear()
+                self._obs_at_cache.clear()
+                self._position_cache_bucket = bucket
+            cached = self._position_cache.get(key)
+            obs_at = self._obs_at_cache.get(site)
+        if cached is not None:
+            return dict(cached)
+
+        if obs_at is None:
+            obs_at = self._site_observer(*site).at(self.ts.from_datetime(datetime.now(timezone.utc)))
+        position = self._position_from_obs_at(obs_at, body_name)
+
+        with self._position_cache_lock:
+            if self._position_cache_bucket == bucket:
+                self._obs_at_cache.setdefault(site, obs_at)
+                self._position_cache[key] = position
+        return dict(position)
+
+    def _position_from_obs_at(self, obs_at: Any, body_name: str) -> Dict[str, float]:
+        """Compute a body's position dict from the observer's position at the observation time.
 
-        # Calculate position
+        Args:
+            obs_at: Observer position at the observation time (observer.at(t))
+            body_name: Name of body
+
+        Returns:
+            Position dict as described in get_position
+        """
         body = self.bodies[body_name]
-        astrometric = observer.at(t).observe(body)
+        astrometric = obs_at.observe(body)
 
         # Get RA/Dec
         ra, dec, distance = astrometric.radec()
 
-        # Get Alt/Az
-        alt, az, distance = astrometric.apparent().altaz()
+        # Get Alt/Az (apparent position is reused for magnitude and moon phase)
+        apparent = astrometric.apparent()
+        alt, az, distance = apparent.altaz()
 
         result = {
             "name": self.display_names[body_name],
@@ -103,37 +188,28 @@ class PlanetaryEphemeris:
 
         # Add magnitude if available
         try:
-            result["magnitude"] = astrometric.apparent().magnitude()
+            result["magnitude"] = apparent.magnitude()
         except Exception:
             result["magnitude"] = None
 
         # Add moon-specific data
         if body_name == "moon":
-            sun = self.bodies["sun"]
-            moon_phase_data = self._calculate_moon_phase(observer, t, body, sun)
+            moon_phase_data = self._calculate_moon_phase(obs_at, apparent)
             result.update(moon_phase_data)
 
         return result
 
-    def _calculate_moon_phase(self, observer: any, time: Time, moon: any, sun: any) -> Dict[str, float]:
+    def _calculate_moon_phase(self, obs_at: Any, moon_apparent: Any) -> Dict[str, float]:
         """Calculate moon phase and illumination.
 
         Args:
-            observer: Observer location
-            time: Observation time
-            moon: Moon body
-            sun: Sun body
+            obs_at: Observer position at the observation time
+            moon_apparent: Apparent position of the moon, already computed by the caller
 
         Returns:
             Dict with phase, illumination percentage, and phase name
         """
-        # Get positions
-        moon_pos = observer.at(time).observe(moon)
-        sun_pos = observer.at(time).observe(sun)
-
-        # Calculate phase angle
-        moon_apparent = moon_pos.apparent()
-        sun_apparent = sun_pos.apparent()
+        sun_apparent = obs_at.observe(self.bodies["sun"]).apparent()
 
         # Get elongation (angle between moon and sun)
         elongation = moon_apparent.separation_from(sun_apparent).degrees
@@ -142,17 +218,10 @@ class PlanetaryEphemeris:
         phase = elongation / 180.0
 
         # Illumination percentage
-        illumination = (1 - abs(phase - 0.5) * 2) * 100
-
-        # Phase name
-        if phase < 0.125 or phase >= 0.875:
-            phase_name = "New Moon"
-        elif phase < 0.375:
-            phase_name = "Waxing Crescent"
-        elif phase < 0.625:
-            phase_name = "Full Moon"
-        else:
-            phase_name = "Waning Crescent"
+        illumination = (1 - abs(2 * phase - 1)) * 100
+
+        # Phase name: quarter-wide buckets centred on 0, 0.25, 0.5 and 0.75 (1.0 wraps to New Moon)
+        phase_name = _MOON_PHASE_NAMES[int(phase * 4 + 0.5) & 3]
 
         return {
             "phase": phase,
@@ -180,11 +249,19 @@ class PlanetaryEphemeris:
         Returns:
             List of position dicts for visible bodies
         """
+        # The observer's position at t is the same for every body, so compute it once; "now"
+        # sweeps go through the TTL cache instead, which shares it the same way
+        obs_at = None
+        if time is not None:
+            obs_at = self._observer(latitude, longitude, elevation).at(self.ts.from_datetime(time))
         visible = []
 
         for body_name in self.bodies.keys():
             try:
-                position = self.get_position(body_name, latitude, longitude, elevation, time)
+                if obs_at is None:
+                    position = self._get_current_position(body_name, latitude, longitude, elevation)
+                else:
+                    position = self._position_from_obs_at(obs_at, body_name)
 
                 if position["altitude"] >= min_altitude:
                     visible.append(position)
@@ -214,10 +291,7 @@ class PlanetaryEphemeris:
         if body_name not in self.bodies:
             raise ValueError(f"Unknown body: {body_name}")
 
-        # Create observer
-        observer = self.eph["earth"] + Topos(
-            latitude_degrees=latitude, longitude_degrees=longitude, elevation_m=elevation
-        )
+        observer = self._observer(latitude, longitude, elevation)
 
         # Set time range (24 hours from date)
         if date is None:
@@ -226,27 +300,16 @@ class PlanetaryEphemeris:
         t0 = self.ts.from_datetime(date.replace(hour=0, minute=0, second=0))
         t1 = self.ts.from_datetime(date.replace(hour=23, minute=59, second=59))
 
-        # Find rise/set events
+        # Skyfield's rising/setting search solves for each horizon crossing directly rather
+        # than sampling altitude across the day; it also applies standard refraction and,
+        # for the Sun and Moon, the disc radius
         body = self.bodies[body_name]
-        f = (observer + body).at
-
-        def is_above_horizon(t):
-            """Check if body is above horizon."""
-            alt, _, _ = f(t).apparent().altaz()
-            return alt.degrees > 0
-
-        times, events = find_discrete(t0, t1, is_above_horizon)
-
-        # Parse events: True = rise, False = set
-        rise_time = None
-        set_time = None
+        rise_times, rose = almanac.find_risings(observer, body, t0, t1)
+        set_times, did_set = almanac.find_settings(observer, body, t0, t1)
 
-        for t, event in zip(times, events):
-            dt = t.utc_datetime()
-            if event:  # Rising
-                rise_time = dt
-            else:  # Setting
-                set_time = dt
+        # Keep the last event of each kind; none if the body stays up or down all day
+        rise_time = rise_times[rose][-1].utc_datetime() if rose.any() else None
+        set_time = set_times[did_set][-1].utc_datetime() if did_set.any() else None
 
         return {
             "rise": rise_time,
@@ -5,36 +5,59 @@ Captures frames from the RTSP video stream and serves them as preview images.
 
 import logging
 import threading
-from datetime import datetime
-from typing import Optional, Tuple
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
 
 import cv2
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+try:
+    import av
+
+    HAS_PYAV = True
+except ImportError:
+    HAS_PYAV = False
+    logger.info("PyAV not available - RTSP preview falls back to OpenCV VideoCapture")
+
 
 class RTMPPreviewService:
     """Service to capture and serve preview frames from RTSP stream."""
 
+    # Frames arriving faster than this are decoded and dropped rather than converted and encoded
+    PUBLISH_INTERVAL = 1 / 15
+    # Longest side of the published JPEG; the stream is 1080x1920, far more than a preview needs
+    PREVIEW_MAX_DIM = 960
+    # Quality the capture thread encodes every published frame at
+    JPEG_QUALITY = 80
+    # Demuxer options for PyAV: TCP transport (no UDP packet loss) and no input buffering
+    PYAV_OPTIONS = {"rtsp_transport": "tcp", "fflags": "nobuffer", "flags": "low_delay", "max_delay": "200000"}
+
     def __init__(self, host: str = "192.168.2.47", port: int = 4554):
         self.host = host
         self.port = port
         self.rtmp_url = f"rtsp://{host}:{port}/stream"
 
         self.latest_frame: Optional[np.ndarray] = None
-        self.latest_frame_time: Optional[datetime] = None
+        self.latest_frame_time: Optional[float] = None  # epoch seconds; converted to datetime only for get_frame_info
+        self.latest_frame_size: Optional[Tuple[int, int]] = None  # (width, height) of the source stream
         self.latest_frame_jpeg: Optional[bytes] = None  # cached, encoded once per capture
+        self._latest_preview: Optional[np.ndarray] = None  # downscaled frame, re-encoded for other qualities
+        self._jpeg_by_quality: Dict[int, bytes] = {}  # per-frame encodes, reset on every new frame
         self._frame_seq: int = 0  # increments with every new frame
 
         self.is_running: bool = False
         self.capture_thread: Optional[threading.Thread] = None
         self.cap: Optional[cv2.VideoCapture] = None
-        self._first_frame_logged: bool = False
 
         # Condition variable: capture thread notifies when a new frame arrives
         self._frame_cond = threading.Condition(threading.Lock())
 
+        # Set by stop() so retry back-offs in the capture thread end immediately
+        self._stop_event = threading.Event()
+
         logger.info(f"RTSPPreviewService initialized for {self.rtmp_url}")
 
     def start(self):
@@ -44,6 +67,7 @@ class RTMPPreviewService:
             return
 
         self.is_running = True
+        self._stop_event.clear()
         self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
         self.capture_thread.start()
         logger.info("RTSP preview service started")
@@ -51,6 +75,7 @@ class RTMPPreviewService:
     def stop(self):
         """Stop capturing frames."""
         self.is_running = False
+        self._stop_event.set()
         with self._frame_cond:
             self._frame_cond.notify_all()  # wake any waiting callers
 
@@ -72,13 +97,9 @@ class RTMPPreviewService:
         while self.is_running:
             try:
                 logger.info(f"Connecting to RTSP stream: {self.rtmp_url}")
-                self.cap = cv2.VideoCapture(self.rtmp_url, cv2.CAP_FFMPEG)
-
-                # Minimize internal buffer so we always get the freshest frame
-                self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                connected = self._stream_pyav() if HAS_PYAV else self._stream_opencv()
 
-                if not self.cap.isOpened():
-                    logger.error("Failed to open RTSP stream")
+                if not connected:
                     retry_count += 1
                     if retry_count >= max_retries:
                         logger.error(f"Max retries ({max_retries}) reached, stopping")
@@ -87,45 +108,11 @@ class RTMPPreviewService:
 
                     delay = min(5 * retry_count, 30)
                     logger.info(f"Retrying in {delay}s...")
-                    for _ in range(delay * 10):
-                        if not self.is_running:
-                            break
-                        threading.Event().wait(0.1)
+                    self._stop_event.wait(delay)
                     continue
 
-                logger.info("RTSP stream connected")
                 retry_count = 0
 
-                while self.is_running:
-                    ret, frame = self.cap.read()
-
-                    if not ret:
-                        logger.warning("Failed to read frame — reconnecting")
-                        break
-
-                    # Encode JPEG once here; use cv2 (faster than PIL round-trip)
-                    ok, jpeg_buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-                    if not ok:
-                        continue
-
-                    now = datetime.utcnow()
-
-                    with self._frame_cond:
-                        self.latest_frame = frame
-                        self.latest_frame_jpeg = jpeg_buf.tobytes()
-                        self.latest_frame_time = now
-                        self._frame_seq += 1
-                        self._frame_cond.notify_all()
-
-                    if not self._first_frame_logged:
-                        h, w = frame.shape[:2]
-                        logger.info(f"First RTSP frame: {w}x{h}")
-                        self._first_frame_logged = True
-
-                    # cap.read() already blocks until the next frame arrives from
-                    # the RTSP stream, so no additional sleep is needed here.
-                    # This keeps us at the stream's native frame rate with minimal lag.
-
             except Exception as e:
                 logger.error(f"Error in RTSP capture loop: {e}", exc_info=True)
                 retry_count += 1
@@ -133,24 +120,156 @@ class RTMPPreviewService:
                     self.is_running = False
                     break
                 delay = min(5 * retry_count, 30)
-                for _ in range(delay * 10):
-                    if not self.is_running:
-                        break
-                    threading.Event().wait(0.1)
+                self._stop_event.wait(delay)
 
             finally:
                 if self.cap:
                     self.cap.release()
                     self.cap = None
 
-    def get_latest_frame_jpeg(self, quality: int = 80) -> Optional[bytes]:
-        """Return the cached JPEG of the most recently captured frame.
+    def _stream_pyav(self) -> bool:
+        """Read the stream with PyAV until it ends or the service stops.
+
+        Every packet is decoded to keep up with the live edge, but only published
+        frames are converted: one swscale pass downscales and converts YUV to BGR.
+
+        Returns:
+            False if the stream could not be opened, True once it was read (even if it
+            later failed mid-stream, which is a dropped connection rather than a failed connect)
+        """
+        try:
+            container = av.open(self.rtmp_url, options=self.PYAV_OPTIONS, timeout=10.0)
+        except av.FFmpegError as e:
+            logger.error(f"Failed to open RTSP stream: {e}")
+            return False
+
+        with container:
+            logger.info("RTSP stream connected")
+            next_publish = 0.0
+
+            try:
+                for av_frame in container.decode(video=0):
+                    if not self.is_running:
+                        break
+
+                    decoded_at = time.monotonic()
+                    if decoded_at < next_publish:
+                        continue
+                    next_publish = decoded_at + self.PUBLISH_INTERVAL
+
+                    width, height = self._preview_size(av_frame.width, av_frame.height)
+                    preview = av_frame.reformat(width=width, height=height, format="bgr24").to_ndarray()
+                    self._publish(preview, preview, (av_frame.width, av_frame.height))
+            except av.FFmpegError as e:
+                logger.warning(f"RTSP stream error: {e} — reconnecting")
+                return True
 
-        The ``quality`` parameter is ignored — quality is fixed at encode time
-        in the capture loop. It is kept for API compatibility.
+        logger.warning("RTSP stream ended — reconnecting")
+        return True
+
+    def _stream_opencv(self) -> bool:
+        """Read the stream with OpenCV VideoCapture until it fails or the service stops.
+
+        Returns:
+            False if the stream could not be opened, True once it was read
         """
+        self.cap = cv2.VideoCapture(self.rtmp_url, cv2.CAP_FFMPEG)
+
+        # Minimize internal buffer so we always get the freshest frame
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        if not self.cap.isOpened():
+            logger.error("Failed to open RTSP stream")
+            return False
+
+        logger.info("RTSP stream connected")
+        next_publish = 0.0
+
+        while self.is_running:
+            # grab() decodes without colour conversion; every frame is grabbed so the
+            # stream stays at the live edge, but only published ones are retrieved and encoded
+            if not self.cap.grab():
+                logger.warning("Failed to read frame — reconnecting")
+                break
+
+            grabbed_at = time.monotonic()
+            if grabbed_at < next_publish:
+                continue
+            next_publish = grabbed_at + self.PUBLISH_INTERVAL
+
+            ret, frame = self.cap.retrieve()
+            if not ret:
+                logger.warning("Failed to retrieve frame — reconnecting")
+                break
+
+            # Downscale before encoding: encoder work and payload scale with pixel count
+            h, w = frame.shape[:2]
+            preview = frame
+            if (w, h) != self._preview_size(w, h):
+                preview = cv2.resize(frame, self._preview_size(w, h), interpolation=cv2.INTER_AREA)
+
+            self._publish(frame, preview, (w, h))
+
+            # cap.grab() already blocks until the next frame arrives from
+            # the RTSP stream, so no additional sleep is needed here.
+
+        return True
+
+    def _preview_size(self, width: int, height: int) -> Tuple[int, int]:
+        """(width, height) scaled so the longest side is at most PREVIEW_MAX_DIM."""
+        longest = max(width, height)
+        if longest <= self.PREVIEW_MAX_DIM:
+            return width, height
+        scale = self.PREVIEW_MAX_DIM / longest
+        return round(width * scale), round(height * scale)
+
+    def _publish(self, frame: np.ndarray, preview: np.ndarray, source_size: Tuple[int, int]):
+        """Encode the preview once and make it the latest frame for readers."""
+        # Encode JPEG once here; use cv2 (faster than PIL round-trip)
+        ok, jpeg_buf = cv2.imencode(".jpg", preview, [cv2.IMWRITE_JPEG_QUALITY, self.JPEG_QUALITY])
+        if not ok:
+            return
+
+        now = time.time()
+        jpeg = jpeg_buf.tobytes()
+
+        with self._frame_cond:
+            self.latest_frame = frame
+            self.latest_frame_size = source_size
+            self.latest_frame_jpeg = jpeg
+            self._latest_preview = preview
+            self._jpeg_by_quality = {self.JPEG_QUALITY: jpeg}
+            self.latest_frame_time = now
+            self._frame_seq += 1
+            seq = self._frame_seq
+            self._frame_cond.notify_all()
+
+        # The sequence number doubles as the "first frame" marker; no separate flag to check and clear
+        if seq == 1:
+            logger.info("First RTSP frame: %sx%s", *source_size)
+
+    def get_latest_frame_jpeg(self, quality: int = JPEG_QUALITY) -> Optional[bytes]:
+        """Return a JPEG of the most recently captured frame.
+
+        The capture thread's JPEG_QUALITY encode is returned as-is. Other qualities
+        are encoded from the downscaled frame on first request and memoized until
+        the next frame, so concurrent callers share a single encode.
+        """
+        with self._frame_cond:
+            cached = self._jpeg_by_quality.get(quality)
+            preview, seq = self._latest_preview, self._frame_seq
+        if cached is not None or preview is None:
+            return cached
+
+        ok, jpeg_buf = cv2.imencode(".jpg", preview, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not ok:
+            return None
+        jpeg = jpeg_buf.tobytes()
+
         with self._frame_cond:
-            return self.latest_frame_jpeg
+            if self._frame_seq == seq:
+                self._jpeg_by_quality[quality] = jpeg
+        return jpeg
 
     def wait_for_new_frame(self, after_seq: int, timeout: float = 1.0) -> Tuple[Optional[bytes], int]:
         """Block until a frame newer than *after_seq* is available, or timeout.
@@ -169,10 +288,14 @@ class RTMPPreviewService:
         with self._frame_cond:
             if self.latest_frame is None:
                 return {"available": False, "message": "No frame available"}
-            h, w = self.latest_frame.shape[:2]
+            w, h = self.latest_frame_size
             return {
                 "available": True,
-                "timestamp": self.latest_frame_time.isoformat() if self.latest_frame_time else None,
+                "timestamp": (
+                    datetime.fromtimestamp(self.latest_frame_time, tz=timezone.utc).isoformat()
+                    if self.latest_frame_time
+                    else None
+                ),
                 "width": w,
                 "height": h,
                 "is_running": self.is_running,
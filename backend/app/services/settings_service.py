@@ -1,11 +1,29 @@
 """Settings service for retrieving configuration."""
 
-from typing import Optional
+from dataclasses import asdict
+from typing import List, Optional
 
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from app.models import Location
-from app.models.settings_models import ObservingLocation
+from app.models.settings_models import DEFAULT_SETTINGS, AppSetting, ObservingLocation
+
+
+def seed_default_settings(db: Session) -> List[str]:
+    """Insert any DEFAULT_SETTINGS rows whose key is not yet present.
+
+    Existing keys are fetched in one query and the missing rows go to the
+    database as a single batched INSERT. The caller owns the commit.
+
+    Returns:
+        Keys of the settings that were created
+    """
+    existing = set(db.scalars(select(AppSetting.key)))
+    rows = [asdict(setting) for setting in DEFAULT_SETTINGS if setting.key not in existing]
+    if rows:
+        db.execute(insert(AppSetting), rows)
+    return [row["key"] for row in rows]
 
 
 class SettingsService:
@@ -16,6 +16,13 @@ from app.tasks.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
 
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 
 class TelescopeExecutionTask(Task):
     """Base task for telescope execution with state tracking."""
@@ -96,8 +103,8 @@ def execute_observation_plan_task(
             },
         )
 
-        # Connect to telescope
-        loop = asyncio.new_event_loop()
+        # Connect to telescope (uvloop when available, matching uvicorn's loop="auto")
+        loop = uvloop.new_event_loop() if HAS_UVLOOP else asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
         try:
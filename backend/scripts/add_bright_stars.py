@@ -2,6 +2,7 @@
 """Add bright named stars catalog."""
 
 import sys
+import warnings
 from pathlib import Path
 
 # Add parent directory to path
@@ -9,13 +10,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import func
 
-from app.database import SessionLocal
+from app.database import SessionLocal, insert_ignoring_duplicates
 from app.models.catalog_models import StarCatalog
 
 # Bright named stars data
 # Format: (common_name, catalog_name, catalog_number, ra_hours, dec_degrees, magnitude,
 #          spectral_type, bayer_designation, constellation, distance_ly)
-BRIGHT_STARS = [
+BRIGHT_STARS = (
     # Brightest stars in the sky
     ("Sirius", "HIP", "32349", 6.752, -16.716, -1.46, "A1V", "α CMa", "CMa", 8.6),
     ("Canopus", "HIP", "30438", 6.399, -52.696, -0.72, "A9II", "α Car", "Car", 310),
@@ -107,7 +108,7 @@ BRIGHT_STARS = [
     ("Kaus Australis", "HIP", "90185", 18.403, -34.385, 1.85, "B9.5III", "ε Sgr", "Sgr", 143),
     ("Nunki", "HIP", "92855", 18.921, -26.297, 2.02, "B2.5V", "σ Sgr", "Sgr", 224),
     # Libra
-    ("Zubenelgenubi", "HIP", "74785", 15.284, -16.042, 2.75, "A3IV", "α Lib", "Lib", 77),
+    ("Zubenelgenubi", "HIP", "72622", 14.848, -16.042, 2.75, "A3IV", "α Lib", "Lib", 77),
     ("Zubeneschamali", "HIP", "74785", 15.284, -9.383, 2.61, "B8V", "β Lib", "Lib", 185),
     # Corona Borealis
     ("Alphecca", "HIP", "76267", 15.578, 26.715, 2.23, "A0V", "α CrB", "CrB", 75),
@@ -116,7 +117,7 @@ BRIGHT_STARS = [
     ("Kornephoros", "HIP", "80816", 16.503, 21.490, 2.77, "G7III", "β Her", "Her", 139),
     # Bootes
     ("Izar", "HIP", "72105", 14.750, 27.074, 2.37, "K0II", "ε Boo", "Boo", 202),
-    ("Nekkar", "HIP", "68702", 14.064, 40.391, 3.50, "G8III", "β Boo", "Boo", 219),
+    ("Nekkar", "HIP", "73555", 15.032, 40.391, 3.50, "G8III", "β Boo", "Boo", 219),
     # Draco
     ("Eltanin", "HIP", "87833", 17.943, 51.489, 2.23, "K5III", "γ Dra", "Dra", 154),
     ("Rastaban", "HIP", "85670", 17.507, 52.301, 2.79, "G2Ib", "β Dra", "Dra", 380),
@@ -152,7 +153,45 @@ BRIGHT_STARS = [
     ("Al Dhanab", "HIP", "110130", 22.309, -60.260, 2.86, "K3III", "α Tuc", "Tuc", 200),
     # Pavo
     ("Peacock", "HIP", "100751", 20.428, -56.735, 1.94, "B2IV", "α Pav", "Pav", 183),
-]
+)
+
+
+def _star_rows():
+    """Yield a StarCatalog column-value dict per BRIGHT_STARS entry.
+
+    Entries repeating an earlier (catalog_name, catalog_number) are dropped with a
+    warning, so the table gets fixed rather than silently losing a star to the insert.
+    """
+    seen = {}
+    for (
+        common_name,
+        catalog_name,
+        catalog_number,
+        ra_hours,
+        dec_degrees,
+        magnitude,
+        spectral_type,
+        bayer_designation,
+        constellation,
+        distance_ly,
+    ) in BRIGHT_STARS:
+        first = seen.setdefault((catalog_name, catalog_number), common_name)
+        if first != common_name:
+            warnings.warn(f"{common_name} repeats {catalog_name} {catalog_number} already used by {first}; skipped")
+            continue
+
+        yield {
+            "catalog_name": catalog_name,
+            "catalog_number": catalog_number,
+            "common_name": common_name,
+            "bayer_designation": bayer_designation,
+            "ra_hours": ra_hours,
+            "dec_degrees": dec_degrees,
+            "magnitude": magnitude,
+            "spectral_type": spectral_type,
+            "constellation": constellation,
+            "distance_ly": distance_ly,
+        }
 
 
 def add_bright_stars():
@@ -162,57 +201,9 @@ def add_bright_stars():
     try:
         print(f"Adding {len(BRIGHT_STARS)} bright named stars...")
 
-        added = 0
-        skipped = 0
-
-        for star_data in BRIGHT_STARS:
-            (
-                common_name,
-                catalog_name,
-                catalog_number,
-                ra_hours,
-                dec_degrees,
-                magnitude,
-                spectral_type,
-                bayer_designation,
-                constellation,
-                distance_ly,
-            ) = star_data
-
-            # Check if star already exists
-            existing = (
-                db.query(StarCatalog)
-                .filter(StarCatalog.catalog_name == catalog_name, StarCatalog.catalog_number == catalog_number)
-                .first()
-            )
-
-            if existing:
-                print(f"  Skipping {common_name} ({bayer_designation}) - already exists")
-                skipped += 1
-                continue
-
-            # Create new star entry
-            star = StarCatalog(
-                catalog_name=catalog_name,
-                catalog_number=catalog_number,
-                common_name=common_name,
-                bayer_designation=bayer_designation,
-                ra_hours=ra_hours,
-                dec_degrees=dec_degrees,
-                magnitude=magnitude,
-                spectral_type=spectral_type,
-                constellation=constellation,
-                distance_ly=distance_ly,
-            )
-
-            db.add(star)
-            added += 1
-
-            if added % 20 == 0:
-                db.commit()
-                print(f"  Added {added} stars...")
-
-        db.commit()
+        # Stars already in the catalog are skipped by the database (unique catalog name/number)
+        added = insert_ignoring_duplicates(db, StarCatalog, _star_rows(), ["catalog_name", "catalog_number"])
+        skipped = len(BRIGHT_STARS) - added
 
         # Print statistics
         print("\n" + "=" * 60)
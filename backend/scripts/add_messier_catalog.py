@@ -7,22 +7,34 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import func
+from sqlalchemy import func, select
 
-from app.database import SessionLocal
+from app.database import SessionLocal, insert_ignoring_duplicates
 from app.models.catalog_models import DSOCatalog
 
+# Columns a Messier entry copies from its NGC object
+COPIED_COLUMNS = (
+    "common_name",
+    "ra_hours",
+    "dec_degrees",
+    "object_type",
+    "magnitude",
+    "surface_brightness",
+    "size_major_arcmin",
+    "size_minor_arcmin",
+    "constellation",
+)
+
 
 def extract_messier_number(common_name: str) -> str:
     """Extract Messier number from common name like 'M031' -> '31'."""
-    if not common_name or not common_name.startswith("M"):
+    if not common_name or common_name[0] != "M":
         return None
 
-    # Remove 'M' prefix and leading zeros
+    # int() strips the leading zeros and rejects anything that isn't a number
     try:
-        num = common_name[1:].lstrip("0")
-        return num if num else "0"
-    except:
+        return str(int(common_name[1:]))
+    except ValueError:
         return None
 
 
@@ -31,59 +43,34 @@ def add_messier_catalog():
     db = SessionLocal()
 
     try:
-        # Find all NGC objects with Messier common names
-        ngc_messier_objects = (
-            db.query(DSOCatalog).filter(DSOCatalog.catalog_name == "NGC", DSOCatalog.common_name.like("M0%")).all()
-        )
-
-        print(f"Found {len(ngc_messier_objects)} NGC objects with Messier designations")
-
-        added = 0
-        skipped = 0
-
-        for ngc_obj in ngc_messier_objects:
-            messier_num = extract_messier_number(ngc_obj.common_name)
-
-            if not messier_num:
-                print(f"  Skipping {ngc_obj.common_name} - couldn't extract number")
-                skipped += 1
-                continue
-
-            # Check if Messier entry already exists
-            existing = (
-                db.query(DSOCatalog)
-                .filter(DSOCatalog.catalog_name == "Messier", DSOCatalog.catalog_number == messier_num)
-                .first()
-            )
-
-            if existing:
-                print(f"  Skipping M{messier_num} - already exists")
-                skipped += 1
-                continue
-
-            # Create new Messier entry
-            messier_obj = DSOCatalog(
-                catalog_name="Messier",
-                catalog_number=messier_num,
-                common_name=ngc_obj.common_name,  # Keep M031 format
-                ra_hours=ngc_obj.ra_hours,
-                dec_degrees=ngc_obj.dec_degrees,
-                object_type=ngc_obj.object_type,
-                magnitude=ngc_obj.magnitude,
-                surface_brightness=ngc_obj.surface_brightness,
-                size_major_arcmin=ngc_obj.size_major_arcmin,
-                size_minor_arcmin=ngc_obj.size_minor_arcmin,
-                constellation=ngc_obj.constellation,
-            )
-
-            db.add(messier_obj)
-            added += 1
-
-            if added % 10 == 0:
-                db.commit()
-                print(f"  Added {added} Messier objects...")
-
-        db.commit()
+        # One query for the Messier numbers already present instead of a lookup per object
+        existing = {
+            str(number)
+            for number in db.scalars(select(DSOCatalog.catalog_number).where(DSOCatalog.catalog_name == "Messier"))
+        }
+
+        # Stream just the copied columns from NGC objects with Messier common names, 200 rows
+        # per fetch, instead of loading every match as an ORM object up front
+        ngc_messier_rows = db.execute(
+            select(*(DSOCatalog.__table__.c[column] for column in COPIED_COLUMNS))
+            .where(DSOCatalog.catalog_name == "NGC", DSOCatalog.common_name.like("M0%"))
+            .execution_options(yield_per=200)
+        ).mappings()
+
+        found = 0
+        rows = []
+        for ngc_row in ngc_messier_rows:
+            found += 1
+            messier_num = extract_messier_number(ngc_row["common_name"])  # common_name keeps the M031 format
+            if messier_num and messier_num not in existing:
+                rows.append({"catalog_name": "Messier", "catalog_number": messier_num, **ngc_row})
+
+        print(f"Found {found} NGC objects with Messier designations")
+
+        # ON CONFLICT still guards against rows added concurrently since the existence query,
+        # and against the same Messier number appearing on two NGC objects
+        added = insert_ignoring_duplicates(db, DSOCatalog, rows, ["catalog_name", "catalog_number"])
+        skipped = found - added
 
         # Print statistics
         print("\n" + "=" * 60)
@@ -20,22 +20,25 @@ async def check_state():
         await client.connect("192.168.2.47", 4700)
         print("Connected.\n")
 
-        # Check app state
+        # Independent reads: send them together so the wait is one round-trip, not four
+        response, mode_response, track_response, view_response = await asyncio.gather(
+            client._send_command("iscope_get_app_state", {}),
+            client._send_command("scope_get_mode", {}),
+            client._send_command("scope_get_track_state", {}),
+            client._send_command("get_view_state", {}),
+        )
+
         print("=== APP STATE ===")
-        response = await client._send_command("iscope_get_app_state", {})
         app_state = response.get("result", {})
         print(json.dumps(app_state, indent=2))
 
         print("\n=== MOUNT MODE ===")
-        mode_response = await client._send_command("scope_get_mode", {})
         print(f"Mount mode: {mode_response.get('result', 'unknown')}")
 
         print("\n=== TRACKING ===")
-        track_response = await client._send_command("scope_get_track_state", {})
         print(f"Tracking: {track_response.get('result', False)}")
 
         print("\n=== VIEW STATE ===")
-        view_response = await client._send_command("get_view_state", {})
         view_state = view_response.get("result", {}).get("View", {})
         print(f"View state: {view_state.get('state', 'unknown')}")
         print(f"View stage: {view_state.get('stage', 'none')}")
@@ -23,13 +23,37 @@ async def check_requirements():
         await client.connect("192.168.2.47", 4700)
         print("   ✓ Connected")
 
+        async def mount_state_or_error():
+            """scope_get_mount_state is missing on some firmware; report that instead of failing."""
+            try:
+                return await client._send_command("scope_get_mount_state", {})
+            except Exception as e:
+                return e
+
+        # Independent reads: send them together so the wait is one round-trip, not seven
+        (
+            mode_response,
+            track_response,
+            cap_response,
+            moving_response,
+            view_response,
+            mount_response,
+            axle_response,
+        ) = await asyncio.gather(
+            client._send_command("scope_get_mode", {}),
+            client._send_command("scope_get_track_state", {}),
+            client._send_command("scope_get_cap", {}),
+            client._send_command("scope_is_moving", {}),
+            client._send_command("get_view_state", {}),
+            mount_state_or_error(),
+            client._send_command("scope_get_axle_coord", {}),
+        )
+
         print("\n2. Checking mount mode...")
-        mode_response = await client._send_command("scope_get_mode", {})
         mount_mode = mode_response.get("result", "unknown")
         print(f"   Mount mode: {mount_mode}")
 
         print("\n3. Checking tracking state...")
-        track_response = await client._send_command("scope_get_track_state", {})
         is_tracking = track_response.get("result", False)
         track_code = track_response.get("track_code")
         track_error = track_response.get("track_error")
@@ -40,17 +64,14 @@ async def check_requirements():
             print(f"   Track error: {track_error}")
 
         print("\n4. Checking mount capabilities...")
-        cap_response = await client._send_command("scope_get_cap", {})
         capabilities = cap_response.get("result", {})
         print(f"   Capabilities: {capabilities}")
 
         print("\n5. Checking if scope is moving...")
-        moving_response = await client._send_command("scope_is_moving", {})
         is_moving = moving_response.get("result", "unknown")
         print(f"   Is moving: {is_moving}")
 
         print("\n6. Checking view state...")
-        view_response = await client._send_command("get_view_state", {})
         view_state = view_response.get("result", {}).get("View", {})
         view_state_str = view_state.get("state", "unknown")
         view_stage = view_state.get("stage", "none")
@@ -58,15 +79,13 @@ async def check_requirements():
         print(f"   View stage: {view_stage}")
 
         print("\n7. Checking mount state...")
-        try:
-            mount_response = await client._send_command("scope_get_mount_state", {})
+        if isinstance(mount_response, Exception):
+            print(f"   (scope_get_mount_state not available: {mount_response})")
+        else:
             mount_state = mount_response.get("result", {})
             print(f"   Mount state: {mount_state}")
-        except Exception as e:
-            print(f"   (scope_get_mount_state not available: {e})")
 
         print("\n8. Checking axis coordinates...")
-        axle_response = await client._send_command("scope_get_axle_coord", {})
         axle_coords = axle_response.get("result", [])
         print(f"   Axis coords: {axle_coords}")
 
@@ -10,7 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy.orm import Session
 
-from app.database import SessionLocal
+from app.database import SessionLocal, bulk_insert
 from app.models.catalog_models import CometCatalog, ConstellationName, DSOCatalog
 
 
@@ -32,33 +32,24 @@ def migrate_dso_catalog(sqlite_conn, pg_session: Session):
     rows = cursor.fetchall()
     print(f"Found {len(rows)} DSO records in SQLite")
 
-    # Insert into PostgreSQL
-    count = 0
-    for row in rows:
-        dso = DSOCatalog(
-            id=row[0],
-            catalog_name=row[1],
-            catalog_number=row[2],
-            common_name=row[3],
-            ra_hours=row[4],
-            dec_degrees=row[5],
-            object_type=row[6],
-            magnitude=row[7],
-            surface_brightness=row[8],
-            size_major_arcmin=row[9],
-            size_minor_arcmin=row[10],
-            constellation=row[11],
-            created_at=row[12],
-            updated_at=row[13],
-        )
-        pg_session.add(dso)
-        count += 1
-
-        if count % 1000 == 0:
-            print(f"  Migrated {count} DSO records...")
-            pg_session.commit()
-
-    pg_session.commit()
+    # Insert into PostgreSQL as multi-row INSERTs
+    columns = (
+        "id",
+        "catalog_name",
+        "catalog_number",
+        "common_name",
+        "ra_hours",
+        "dec_degrees",
+        "object_type",
+        "magnitude",
+        "surface_brightness",
+        "size_major_arcmin",
+        "size_minor_arcmin",
+        "constellation",
+        "created_at",
+        "updated_at",
+    )
+    count = bulk_insert(pg_session, DSOCatalog, (dict(zip(columns, row)) for row in rows))
     print(f"✓ Migrated {count} DSO records")
 
     return count
@@ -1,8 +1,11 @@
 """Tests for Seestar S50 client."""
 
 import asyncio
+import itertools
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
+import numpy as np
 import pytest
 
 from app.clients.seestar_client import (
@@ -23,6 +26,16 @@ class TestSeestarClient:
         """Create test client instance."""
         return SeestarClient()
 
+    @pytest.fixture
+    def connected_client(self, client):
+        """Create a client wired to a fake open connection that records written frames."""
+        client._connected = True
+        client._writer = Mock()
+        client._writer.is_closing = Mock(return_value=False)
+        client._writer.drain = AsyncMock()
+        client._writer.transport.get_write_buffer_size = Mock(return_value=0)
+        return client
+
     def test_init(self, client):
         """Test client initialization."""
         assert not client.connected
@@ -118,6 +131,371 @@ class TestSeestarClient:
         assert len(callback_called) == 1
         assert callback_called[0].connected is True
 
+    @pytest.mark.asyncio
+    async def test_send_command_frames(self, connected_client):
+        """Test templated (fixed-param) and encoded command frames are valid JSON-RPC."""
+
+        calls = (
+            ("test_connection", None),
+            ("test_connection", None),
+            ("set_setting", {"exp_ms": 1}),
+            ("scope_goto", [np.float64(1.5), 45.0]),
+            ("stop_view_plan", {}),
+            ("scope_move", connected_client.SCOPE_MOVE_STOP_PARAMS),
+        )
+        for method, params in calls:
+            with pytest.raises(TimeoutError):
+                await connected_client._send_command(method, params, timeout=0.01)
+
+        frames = [call.args[0] for call in connected_client._writer.write.call_args_list]
+        assert all(frame.endswith(b"\r\n") for frame in frames)
+        messages = [json.loads(frame) for frame in frames]
+        assert messages[0] == {"method": "test_connection", "id": 10000, "jsonrpc": "2.0"}
+        assert messages[1] == {"method": "test_connection", "id": 10001, "jsonrpc": "2.0"}
+        assert messages[2] == {"method": "set_setting", "id": 10002, "jsonrpc": "2.0", "params": {"exp_ms": 1}}
+        assert messages[3]["params"] == [1.5, 45.0]
+        assert messages[4] == {"method": "stop_view_plan", "id": 10004, "jsonrpc": "2.0"}
+        assert messages[5] == {"method": "scope_move", "id": 10005, "jsonrpc": "2.0", "params": ["none"]}
+        assert ("scope_move", b'["none"]') in connected_client._msg_templates
+        assert connected_client._pending_responses == {}
+
+    @pytest.mark.asyncio
+    async def test_send_command_cancel_clears_pending(self, connected_client):
+        """Test a cancelled command does not leave its future in _pending_responses."""
+        connected_client._command_ids = itertools.count(0x7FFFFFFF)
+
+        task = asyncio.create_task(connected_client._send_command("iscope_cancel_view"))
+        await asyncio.sleep(0)
+        assert 0x7FFFFFFF in connected_client._pending_responses
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert connected_client._pending_responses == {}
+        assert next(connected_client._command_ids) & 0x7FFFFFFF == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_commands_overlap_on_one_connection(self, connected_client):
+        """Test in-flight commands are matched by id, so responses may arrive out of order."""
+
+        goto = asyncio.create_task(connected_client._send_command("iscope_start_view", {"mode": "star"}))
+        state = asyncio.create_task(connected_client._send_command("get_device_state"))
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert len(connected_client._pending_responses) == 2
+
+        goto_id, state_id = sorted(connected_client._pending_responses)
+        connected_client._handle_message({"id": state_id, "method": "get_device_state", "result": {"device": {}}})
+        assert (await state)["result"] == {"device": {}}
+        assert not goto.done()
+
+        connected_client._handle_message({"id": goto_id, "method": "iscope_start_view", "result": 0})
+        assert (await goto)["result"] == 0
+        assert connected_client._pending_responses == {}
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_queries_share_one_request(self, connected_client):
+        """Test concurrent identical read-only queries are coalesced into one RPC."""
+
+        first = asyncio.create_task(connected_client.check_stacking_complete())
+        second = asyncio.create_task(connected_client.check_stacking_complete())
+        cancelled = asyncio.create_task(connected_client.check_stacking_complete())
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert connected_client._writer.write.call_count == 1
+
+        cancelled.cancel()
+        (cmd_id,) = connected_client._pending_responses
+        connected_client._handle_message({"id": cmd_id, "method": "is_stacked", "result": {"is_stacked": True}})
+
+        assert await first is True
+        assert await second is True
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert connected_client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_pipeline_flushes_frames_in_one_write(self, connected_client):
+        """Test pipelined commands, queries included, share a single write and each gets its own response."""
+        pipeline = asyncio.create_task(
+            connected_client.pipeline(("iscope_get_app_state", None), ("pi_set_time", {"time": 1700000000}))
+        )
+        await asyncio.sleep(0)
+
+        connected_client._writer.write.assert_called_once()
+        frames = [json.loads(frame) for frame in connected_client._writer.write.call_args.args[0].splitlines()]
+        assert [frame["method"] for frame in frames] == ["iscope_get_app_state", "pi_set_time"]
+
+        for frame in reversed(frames):
+            connected_client._handle_message({"id": frame["id"], "result": frame["method"], "code": 0})
+
+        responses = await pipeline
+        assert [response["result"] for response in responses] == ["iscope_get_app_state", "pi_set_time"]
+        assert connected_client._pending_responses == {}
+
+    @pytest.mark.asyncio
+    async def test_pipeline_failed_write_clears_pending(self, connected_client):
+        """Test a failed pipelined write raises ConnectionError without leaving futures behind."""
+        connected_client._writer.is_closing = Mock(return_value=True)
+
+        with pytest.raises(ConnectionError, match="Failed to send commands"):
+            await connected_client.pipeline(("iscope_get_app_state", None), ("pi_set_time", {"time": 1700000000}))
+
+        connected_client._writer.write.assert_not_called()
+        assert connected_client._pending_responses == {}
+
+    @pytest.mark.asyncio
+    async def test_set_wifi_country_rejects_unknown_code(self, client):
+        """Test invalid country codes fail locally without a round-trip."""
+        client._send_command = AsyncMock()
+
+        with pytest.raises(ValueError, match="Unknown country code"):
+            await client.set_wifi_country("XX")
+
+        client._send_command.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_set_wifi_country_normalizes_code(self, client):
+        """Test lowercase or padded country codes are accepted and sent upper-case."""
+        client._send_command = AsyncMock(return_value={"result": 0})
+
+        assert await client.set_wifi_country(" us ") is True
+
+        client._send_command.assert_awaited_once_with("set_wifi_country", {"country": "US"})
+
+    @pytest.mark.asyncio
+    async def test_send_command_nowait_drops_response(self, connected_client):
+        """Test fire-and-forget commands don't wait and their responses aren't dispatched."""
+
+        assert await connected_client.stop_telescope_movement(wait=False) is True
+
+        message = json.loads(connected_client._writer.write.call_args.args[0])
+        assert message["method"] == "scope_move"
+        assert message["params"] == ["none"]
+        assert connected_client._pending_responses == {}
+        assert connected_client._ignore_ids == {message["id"]}
+
+        events = []
+        connected_client.subscribe_all_events(events.append)
+        connected_client._handle_message({"id": message["id"], "method": "scope_move", "result": 0, "code": 0})
+        assert connected_client._ignore_ids == set()
+        assert events == []
+
+    def test_sign_challenge_verifies_as_rsa_sha1(self, client):
+        """Test the challenge signature is a standard PKCS#1 v1.5 RSA-SHA1 signature."""
+        import base64
+
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        client._private_key_pem = key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.TraditionalOpenSSL,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+
+        signature = base64.b64decode(client._sign_challenge("challenge-123"))
+
+        # Raises InvalidSignature on mismatch
+        key.public_key().verify(signature, b"challenge-123", padding.PKCS1v15(), hashes.SHA1())
+        assert client._private_key is not None
+
+    @pytest.mark.asyncio
+    async def test_apply_settings_sends_single_merged_command(self, client):
+        """Test apply_settings merges sections into one set_setting call."""
+        client._send_command = AsyncMock(return_value={"result": 0})
+
+        result = await client.apply_settings(
+            exposure={"stack_exposure_ms": 5000},
+            planetary={"frame_count": 500},
+            advanced={"drizzle_2x": True},
+        )
+
+        assert result is True
+        client._send_command.assert_awaited_once()
+        method, params = client._send_command.await_args.args
+        assert method == "set_setting"
+        assert params["exp_ms"] == {"stack_l": 5000, "continuous": 500}
+        assert params["stack"]["capt_num"] == 500
+        assert params["stack"]["drizzle2x"] is True
+
+    @pytest.mark.asyncio
+    async def test_single_setting_methods_keep_payloads(self, client):
+        """Test the single-purpose setters still send their original payloads."""
+        client._send_command = AsyncMock(return_value={"result": 0})
+
+        assert await client.configure_dither(enabled=True, pixels=30, interval=5) is True
+        assert await client.set_auto_exposure(brightness_target=40.0) is True
+
+        assert client._send_command.await_args_list[0].args == (
+            "set_setting",
+            {"stack_dither": {"enable": True, "pix": 30, "interval": 5}},
+        )
+        assert client._send_command.await_args_list[1].args == (
+            "set_setting",
+            {"manual_exp": False, "ae_bri_percent": 40.0},
+        )
+
+    @pytest.mark.asyncio
+    async def test_apply_settings_rejects_conflicting_exposure_modes(self, client):
+        """Test manual and auto exposure cannot be combined."""
+        with pytest.raises(ValueError):
+            await client.apply_settings(manual_exp={"exposure_ms": 100, "gain": 80}, auto_exp={})
+
+    @pytest.mark.asyncio
+    async def test_poll_queries_share_recent_response(self, client):
+        """Test polling queries reuse a response younger than their POLL_CACHE_TTLS entry."""
+        client._send_command = AsyncMock(return_value={"result": {"ra": 1.5, "dec": 20.0}})
+
+        first = await client.get_current_coordinates()
+        second = await client.get_current_coordinates()
+
+        assert first == second == {"ra": 1.5, "dec": 20.0}
+        client._send_command.assert_awaited_once()
+
+        client.POLL_CACHE_TTLS = {**client.POLL_CACHE_TTLS, "scope_get_equ_coord": 0}
+        await client.get_current_coordinates()
+        assert client._send_command.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_poll_response_is_a_copy(self, client):
+        """Test a caller modifying a cached response doesn't change what later callers get."""
+        client._send_command = AsyncMock(return_value={"result": {"stage": "Stack"}})
+
+        (await client.get_app_state())["stage"] = "AutoGoto"
+
+        assert await client.get_app_state() == {"stage": "Stack"}
+        client._send_command.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_state_change_during_query_skips_caching(self, connected_client):
+        """Test a query answered across a state change is neither cached nor joined by later callers."""
+        before = asyncio.create_task(connected_client.get_app_state())
+        for _ in range(3):
+            await asyncio.sleep(0)
+        (query_id,) = connected_client._pending_responses
+
+        stop = asyncio.create_task(connected_client._send_command("iscope_stop_view", {"stage": "Stack"}))
+        after = asyncio.create_task(connected_client.get_app_state())
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert len(connected_client._pending_responses) == 3
+
+        connected_client._handle_message({"id": query_id, "result": {"stage": "Stack"}})
+        assert await before == {"stage": "Stack"}
+        assert connected_client._poll_cache == {}
+        assert not after.done()
+
+        for cmd_id in list(connected_client._pending_responses):
+            connected_client._handle_message({"id": cmd_id, "result": {"stage": "Idle"}, "code": 0})
+        await stop
+        assert await after == {"stage": "Idle"}
+        assert connected_client._poll_cache
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "stage,expected",
+        [
+            ("AutoGoto", SeestarState.SLEWING),
+            ("Stack", SeestarState.IMAGING),
+            (None, SeestarState.TRACKING),
+            ("Unrecognized", SeestarState.DISCONNECTED),
+        ],
+    )
+    async def test_app_state_stage_updates_status(self, client, stage, expected):
+        """Test the app-state stage maps onto the client status (unknown stages leave it alone)."""
+        client._send_command = AsyncMock(return_value={"result": {"stage": stage}})
+
+        await client.get_app_state()
+
+        assert client.status.state == expected
+
+    @pytest.mark.asyncio
+    async def test_get_snapshot_overlaps_queries(self, connected_client):
+        """Test get_snapshot issues its three queries concurrently."""
+
+        snapshot = asyncio.create_task(connected_client.get_snapshot())
+        for _ in range(3):
+            await asyncio.sleep(0)
+        sent = {
+            json.loads(call.args[0])["method"]: json.loads(call.args[0])["id"]
+            for call in connected_client._writer.write.call_args_list
+        }
+        assert set(sent) == {"scope_get_equ_coord", "iscope_get_app_state", "is_stacked"}
+
+        results = {
+            "scope_get_equ_coord": {"ra": 1.5, "dec": 20.0},
+            "iscope_get_app_state": {"stage": "Stack"},
+            "is_stacked": {"is_stacked": True},
+        }
+        for method, cmd_id in sent.items():
+            connected_client._handle_message({"id": cmd_id, "method": method, "result": results[method]})
+
+        assert await snapshot == {"coords": {"ra": 1.5, "dec": 20.0}, "app": {"stage": "Stack"}, "stacked": True}
+
+    @pytest.mark.asyncio
+    async def test_wifi_queries_cached_until_changed(self, connected_client):
+        """Test slow-changing WiFi state is cached, and refreshed on force or after a change."""
+        writer = connected_client._writer
+
+        async def answer(call, result):
+            task = asyncio.create_task(call)
+            for _ in range(3):
+                await asyncio.sleep(0)
+            for cmd_id in list(connected_client._pending_responses):
+                connected_client._handle_message({"id": cmd_id, "result": result, "code": 0})
+            return await task
+
+        assert await answer(connected_client.list_saved_wifi_networks(), {"networks": ["home"]}) == {
+            "networks": ["home"]
+        }
+        assert await connected_client.list_saved_wifi_networks() == {"networks": ["home"]}
+        assert writer.write.call_count == 1
+
+        await answer(connected_client.list_saved_wifi_networks(force_refresh=True), {"networks": ["home"]})
+        assert writer.write.call_count == 2
+
+        assert await answer(connected_client.save_wifi_network("cabin", "secret"), 0) is True
+        assert await answer(connected_client.list_saved_wifi_networks(), {"networks": ["home", "cabin"]}) == {
+            "networks": ["home", "cabin"]
+        }
+        assert writer.write.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_wifi_list_in_flight_during_change_is_not_cached(self, connected_client):
+        """Test a network list answered around pi_station_set isn't cached as the current list."""
+        listing = asyncio.create_task(connected_client.list_saved_wifi_networks())
+        for _ in range(3):
+            await asyncio.sleep(0)
+        (list_id,) = connected_client._pending_responses
+
+        save = asyncio.create_task(connected_client.save_wifi_network("cabin", "secret"))
+        for _ in range(3):
+            await asyncio.sleep(0)
+        (save_id,) = set(connected_client._pending_responses) - {list_id}
+
+        connected_client._handle_message({"id": list_id, "result": {"networks": ["home"]}, "code": 0})
+        assert await listing == {"networks": ["home"]}
+        connected_client._handle_message({"id": save_id, "result": 0, "code": 0})
+        assert await save is True
+
+        assert connected_client._poll_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_state_changing_command_invalidates_poll_cache(self, connected_client):
+        """Test non-polling commands clear cached polling responses."""
+        connected_client._poll_cache[("iscope_get_app_state", b"")] = (0.0, {"result": {}})
+
+        with pytest.raises(TimeoutError):
+            await connected_client._send_command("test_connection", timeout=0.01)
+        assert connected_client._poll_cache
+
+        with pytest.raises(TimeoutError):
+            await connected_client._send_command("iscope_stop_view", {"stage": "Stack"}, timeout=0.01)
+        assert connected_client._poll_cache == {}
+
 
 # Note: Full integration tests would require either:
 # 1. A real Seestar S50 telescope
@@ -190,6 +568,96 @@ async def test_get_latest_preview_frame_no_timestamps():
         assert frame is None
 
 
+@pytest.mark.asyncio
+async def test_list_all_images_queries_both_directories():
+    """Test listing all images merges stacked and raw results in order."""
+    client = SeestarClient()
+    listings = {
+        "/mnt/seestar/stack/": {"files": [{"name": "m31.fits", "size": 100}]},
+        "/mnt/seestar/raw/": {"files": [{"name": "raw_001.fits"}]},
+    }
+
+    with patch.object(client, "get_image_file_info", new=AsyncMock(side_effect=listings.get)):
+        images = await client.list_images("all")
+
+    assert [(i["filename"], i["type"]) for i in images] == [("m31.fits", "stacked"), ("raw_001.fits", "raw")]
+    assert images[0]["size"] == 100
+    assert images[1]["format"] == "fits"
+
+
+@pytest.mark.asyncio
+async def test_download_stacked_image_to_streams_chunks():
+    """Test stacked images are written to the destination chunk by chunk."""
+    import io
+
+    client = SeestarClient()
+    client._host = "192.168.1.100"
+
+    reader = Mock()
+    reader.read = AsyncMock(side_effect=[b"SIMPLE", b"  =  T", b""])
+    writer = Mock()
+    writer.drain = AsyncMock()
+    writer.wait_closed = AsyncMock()
+    dest = io.BytesIO()
+
+    with patch("asyncio.open_connection", new=AsyncMock(return_value=(reader, writer))):
+        written = await client.download_stacked_image_to("m31.fits", dest)
+
+    assert written == 12
+    assert dest.getvalue() == b"SIMPLE  =  T"
+    assert json.loads(writer.write.call_args[0][0]) == {"file": "/mnt/seestar/stack/m31.fits"}
+    writer.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_download_stalled_transfer_times_out():
+    """Test a file transfer that stops sending data raises TimeoutError with progress."""
+    client = SeestarClient()
+    client._host = "192.168.1.100"
+
+    chunks = iter([b"SIMPLE"])
+
+    async def read(_):
+        for chunk in chunks:
+            return chunk
+        await asyncio.sleep(10)  # Telescope stops sending
+
+    reader = Mock()
+    reader.read = read
+    writer = Mock()
+    writer.drain = AsyncMock()
+    writer.wait_closed = AsyncMock()
+
+    with patch("asyncio.open_connection", new=AsyncMock(return_value=(reader, writer))):
+        with pytest.raises(TimeoutError, match="stalled after 6 bytes"):
+            await client.get_stacked_image("m31.fits", timeout=0.01)
+
+    writer.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_download_many_bounds_concurrency():
+    """Test download_many overlaps transfers up to the concurrency limit."""
+    client = SeestarClient()
+    in_flight = 0
+    peak = 0
+
+    async def fake_download(path):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return path.encode()
+
+    paths = [f"/mnt/seestar/stack/img_{i}.fits" for i in range(6)]
+    with patch.object(client, "_download_file", new=fake_download):
+        results = dict([item async for item in client.download_many(paths, concurrency=2)])
+
+    assert results == {path: path.encode() for path in paths}
+    assert peak == 2
+
+
 @pytest.mark.asyncio
 async def test_start_stop_video_recording():
     """Test starting and stopping video recording."""
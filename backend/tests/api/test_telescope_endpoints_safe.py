@@ -101,6 +101,13 @@ def mock_seestar_client(real_hardware, telescope_host, telescope_port):
             return_value={"stage": "imaging", "progress": 45.5, "frame": 150, "total_frames": 330, "state": "stacking"}
         )
         client.check_stacking_complete = AsyncMock(return_value={"is_complete": False, "total_frames": 330})
+        client.get_snapshot = AsyncMock(
+            return_value={
+                "coords": {"ra": 10.684, "dec": 41.269},
+                "app": {"stage": "imaging", "progress": 45.5},
+                "stacked": False,
+            }
+        )
         client.get_view_plan_state = AsyncMock(
             return_value={"current_target": "M31", "progress": 35.5, "state": "imaging"}
         )
@@ -164,6 +171,17 @@ class TestRealTimeTrackingEndpoints:
         assert "is_complete" in data["is_stacked"]
         assert isinstance(data["is_stacked"]["is_complete"], bool)
 
+    def test_get_snapshot_when_connected(self, test_client):
+        """Test GET /api/telescope/snapshot combines coordinates, app state and stacking status."""
+        response = test_client.get("/api/telescope/snapshot")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "ra_hours" in data
+        assert "dec_degrees" in data
+        assert isinstance(data["app_state"], dict)
+        assert "is_stacked" in data
+
 
 class TestViewPlanEndpoints:
     """Test view plan query endpoints (SAFE - read only)."""
@@ -211,6 +229,7 @@ class TestEndpointAvailability:
             "/api/telescope/coordinates",
             "/api/telescope/app-state",
             "/api/telescope/stacking-status",
+            "/api/telescope/snapshot",
             "/api/telescope/plan/state",
             "/api/telescope/solve-result",
             "/api/telescope/field-annotations",
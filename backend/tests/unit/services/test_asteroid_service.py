@@ -3,12 +3,13 @@
 from datetime import datetime
 from unittest.mock import MagicMock, Mock
 
+import numpy as np
 import pytest
 from sqlalchemy.orm import Session
 
 from app.models import AsteroidOrbitalElements, AsteroidTarget, Location
 from app.models.catalog_models import AsteroidCatalog
-from app.services.asteroid_service import AsteroidService
+from app.services.asteroid_service import ORBITAL_ELEMENT_FIELDS, AsteroidService, compute_positions
 
 
 @pytest.fixture
@@ -59,6 +60,28 @@ def sample_asteroid(sample_orbital_elements):
     )
 
 
+@pytest.fixture
+def sample_vesta(sample_asteroid):
+    """Create a second asteroid target (Vesta), brighter than the Ceres sample."""
+    return sample_asteroid.model_copy(
+        update={
+            "designation": "(4) Vesta",
+            "name": "Vesta",
+            "number": 4,
+            "absolute_magnitude": 3.2,
+            "orbital_elements": AsteroidOrbitalElements(
+                epoch_jd=2460000.5,
+                semi_major_axis_au=2.3615,
+                eccentricity=0.0887,
+                inclination_deg=7.14,
+                arg_perihelion_deg=151.2,
+                ascending_node_deg=103.8,
+                mean_anomaly_deg=7.0,
+            ),
+        }
+    )
+
+
 @pytest.fixture
 def sample_location():
     """Create sample observer location."""
@@ -235,6 +258,17 @@ class TestAsteroidEphemeris:
 
         assert result.magnitude is None
 
+    def test_compute_positions_matches_reference_values(self, sample_asteroid, sample_vesta):
+        """Test vectorized positions against reference values from the scalar Kepler solution."""
+        asteroids = [sample_asteroid, sample_vesta]
+        elements = {f: np.array([getattr(a.orbital_elements, f) for a in asteroids]) for f in ORBITAL_ELEMENT_FIELDS}
+
+        ra_hours, dec_degrees, r = compute_positions(elements, 2460477.0)  # 2024-06-15 12:00 UTC
+
+        np.testing.assert_allclose(ra_hours, [22.587684682, 2.520489903], atol=1e-8)
+        np.testing.assert_allclose(dec_degrees, [-19.812671840, 8.018673412], atol=1e-8)
+        np.testing.assert_allclose(r, [2.979537640, 2.521257240], atol=1e-8)
+
 
 class TestAsteroidVisibility:
     """Test visibility computation."""
@@ -314,6 +348,31 @@ class TestGetVisibleAsteroids:
         # Should be empty because asteroid is too faint
         assert result == []
 
+    def test_get_visible_asteroids_at_night(self, asteroid_service, sample_asteroid, sample_vesta, sample_location):
+        """Test the vectorized pass reports alt/az per asteroid, sorts brightest first and skips invalid elements."""
+        broken = sample_asteroid.model_copy(
+            update={
+                "designation": "(99942) Broken",
+                "orbital_elements": sample_asteroid.orbital_elements.model_copy(update={"eccentricity": 1.5}),
+            }
+        )
+        asteroid_service.get_all_asteroids = Mock(return_value=[sample_asteroid, broken, sample_vesta])
+        time_utc = datetime(2024, 11, 11, 5, 0, 0)  # Local night, Sun far below -18 degrees
+
+        result = asteroid_service.get_visible_asteroids(sample_location, time_utc, min_altitude=20.0)
+
+        assert [v.asteroid.designation for v in result] == ["(4) Vesta", "(1) Ceres"]
+        assert result[0].ephemeris.magnitude < result[1].ephemeris.magnitude
+        assert result[0].altitude_deg == pytest.approx(36.4, abs=1.0)
+        assert result[0].azimuth_deg == pytest.approx(100.2, abs=1.0)
+        assert result[1].altitude_deg == pytest.approx(35.2, abs=1.0)
+        assert result[1].azimuth_deg == pytest.approx(191.8, abs=1.0)
+        for visibility in result:
+            scalar = asteroid_service.compute_visibility(visibility.asteroid, sample_location, time_utc)
+            assert visibility.altitude_deg == pytest.approx(scalar.altitude_deg, abs=1e-6)
+            assert visibility.azimuth_deg == pytest.approx(scalar.azimuth_deg, abs=1e-6)
+            assert visibility.is_dark_enough and visibility.is_visible
+
 
 class TestAsteroidOrbitalElements:
     """Test orbital elements model."""
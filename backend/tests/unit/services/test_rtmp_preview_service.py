@@ -0,0 +1,42 @@
+"""Tests for RTSP preview service frame caching."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from app.services import rtmp_preview_service
+from app.services.rtmp_preview_service import RTMPPreviewService
+
+
+def test_get_latest_frame_jpeg_memoizes_per_quality():
+    """Test the capture-time encode is returned as-is and other qualities are encoded once per frame."""
+    service = RTMPPreviewService()
+    assert service.get_latest_frame_jpeg() is None
+
+    service._latest_preview = np.zeros((54, 96, 3), dtype=np.uint8)
+    service._jpeg_by_quality = {RTMPPreviewService.JPEG_QUALITY: b"capture-encode"}
+
+    assert service.get_latest_frame_jpeg() == b"capture-encode"
+    jpeg = service.get_latest_frame_jpeg(quality=95)
+    assert jpeg.startswith(b"\xff\xd8")
+    assert service.get_latest_frame_jpeg(quality=95) is jpeg
+
+
+def test_stream_pyav_treats_mid_stream_error_as_dropped_connection(monkeypatch):
+    """Test a decode error after connecting reports the stream as read, so it doesn't use up connect retries."""
+    ffmpeg_error = type("FFmpegError", (Exception,), {})
+    container = MagicMock()
+    container.decode.side_effect = ffmpeg_error("Connection reset by peer")
+    monkeypatch.setattr(
+        rtmp_preview_service,
+        "av",
+        SimpleNamespace(FFmpegError=ffmpeg_error, open=MagicMock(return_value=container)),
+        raising=False,
+    )
+
+    service = RTMPPreviewService()
+    service.is_running = True
+
+    assert service._stream_pyav() is True
+    container.__exit__.assert_called_once()
@@ -0,0 +1,35 @@
+"""Tests for settings service helpers."""
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.settings_models import DEFAULT_SETTINGS, AppSetting
+from app.services.settings_service import seed_default_settings
+
+
+def test_seed_default_settings_skips_existing_keys():
+    """Test seeding inserts only missing defaults and is idempotent."""
+    engine = create_engine("sqlite://")
+    AppSetting.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+
+    try:
+        db.add(AppSetting(key="ui.theme", value="light", value_type="string"))
+        db.commit()
+
+        created = seed_default_settings(db)
+        db.commit()
+
+        assert "ui.theme" not in created
+        assert len(created) == len(DEFAULT_SETTINGS) - 1
+        assert db.query(AppSetting).filter_by(key="ui.theme").one().value == "light"
+        assert seed_default_settings(db) == []
+    finally:
+        db.close()
+
+
+def test_app_setting_typed_value():
+    """Test typed_value converts according to value_type."""
+    assert AppSetting(value="True", value_type="bool").typed_value is True
+    assert AppSetting(value="12", value_type="int").typed_value == 12
+    assert AppSetting(value="dark", value_type="string").typed_value == "dark"
@@ -0,0 +1,43 @@
+"""Tests for database helpers."""
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import bulk_insert, insert_ignoring_duplicates
+from app.models.catalog_models import DSOCatalog, StarCatalog
+
+
+def test_bulk_insert_commits_in_chunks():
+    """Test bulk_insert inserts every row across several chunks."""
+    engine = create_engine("sqlite://")
+    DSOCatalog.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+
+    rows = (
+        {"catalog_name": "NGC", "catalog_number": n, "ra_hours": 0.7, "dec_degrees": 41.3, "object_type": "galaxy"}
+        for n in range(1, 6)
+    )
+    try:
+        assert bulk_insert(db, DSOCatalog, rows, chunk_size=2) == 5
+        assert db.query(DSOCatalog).count() == 5
+        assert db.query(DSOCatalog).filter_by(catalog_number=3).one().created_at is not None
+    finally:
+        db.close()
+
+
+def test_insert_ignoring_duplicates_skips_existing_rows():
+    """Test rows colliding on the unique catalog name/number index are skipped."""
+    engine = create_engine("sqlite://")
+    StarCatalog.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+
+    def star(number):
+        return {"catalog_name": "HIP", "catalog_number": number, "ra_hours": 6.75, "dec_degrees": -16.7}
+
+    try:
+        assert insert_ignoring_duplicates(db, StarCatalog, [star("32349")], ["catalog_name", "catalog_number"]) == 1
+        rows = [star("32349"), star("30438")]
+        assert insert_ignoring_duplicates(db, StarCatalog, rows, ["catalog_name", "catalog_number"]) == 1
+        assert db.query(StarCatalog).count() == 2
+    finally:
+        db.close()
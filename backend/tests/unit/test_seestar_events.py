@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
@@ -99,6 +100,16 @@ class TestSeestarEventSystem:
         assert event.data["operation"] == "autofocus"
         assert event.data["success"] is True
 
+    def test_parse_event_with_non_dict_result(self, client):
+        """Test that scalar results parse as unknown events instead of raising."""
+        message = {"jsonrpc": "2.0", "method": "pi_status", "result": 0, "code": 0}
+
+        event = client._parse_event(message)
+
+        assert event is not None
+        assert event.event_type == EventType.UNKNOWN
+        assert event.data == {}
+
     def test_subscribe_event(self, client):
         """Test subscribing to specific event type."""
         callback_called = []
@@ -143,6 +154,18 @@ class TestSeestarEventSystem:
 
         assert callback in client._progress_callbacks
 
+    def test_handle_message_skips_parse_without_subscribers(self, client):
+        """Test that unsolicited messages are not parsed when nothing is subscribed."""
+        message = {"jsonrpc": "2.0", "method": "state_update", "result": {"state": "tracking"}}
+
+        with patch.object(client, "_parse_event", return_value=None) as parse_event:
+            client._handle_message(message)
+            parse_event.assert_not_called()
+
+            client.subscribe_progress(lambda percent, details: None)
+            client._handle_message(message)
+            parse_event.assert_called_once_with(message, None)
+
     @pytest.mark.asyncio
     async def test_dispatch_event_to_type_callback(self, client):
         """Test that events are dispatched to type-specific callbacks."""
@@ -158,7 +181,8 @@ class TestSeestarEventSystem:
             event_type=EventType.PROGRESS_UPDATE, timestamp=datetime.now(), data={"percent": 50}, source_command="test"
         )
 
-        await client._dispatch_event(event)
+        client._dispatch_event(event)
+        await asyncio.sleep(0)
 
         assert len(events_received) == 1
         assert events_received[0] == event
@@ -177,8 +201,9 @@ class TestSeestarEventSystem:
         event1 = SeestarEvent(event_type=EventType.PROGRESS_UPDATE, timestamp=datetime.now(), data={})
         event2 = SeestarEvent(event_type=EventType.STATE_CHANGE, timestamp=datetime.now(), data={})
 
-        await client._dispatch_event(event1)
-        await client._dispatch_event(event2)
+        client._dispatch_event(event1)
+        client._dispatch_event(event2)
+        await asyncio.sleep(0)
 
         assert len(events_received) == 2
 
@@ -199,12 +224,51 @@ class TestSeestarEventSystem:
             data={"percent": 75, "frame": 15, "total_frames": 20},
         )
 
-        await client._dispatch_event(event)
+        client._dispatch_event(event)
+        await asyncio.sleep(0)
 
         assert len(progress_updates) == 1
         assert progress_updates[0][0] == 75
         assert progress_updates[0][1]["frame"] == 15
 
+    @pytest.mark.asyncio
+    async def test_dispatch_is_deferred_and_ordered(self, client):
+        """Test that callbacks run after dispatch returns, in arrival order."""
+        frames_received = []
+
+        def callback(event):
+            frames_received.append(event.data["frame"])
+
+        client.subscribe_event(EventType.PROGRESS_UPDATE, callback)
+
+        for frame in range(3):
+            client._dispatch_event(
+                SeestarEvent(event_type=EventType.PROGRESS_UPDATE, timestamp=datetime.now(), data={"frame": frame})
+            )
+
+        assert frames_received == []
+        await asyncio.sleep(0)
+        assert frames_received == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_skips_unsubscribed_callback(self, client):
+        """Test that unsubscribed callbacks no longer receive events."""
+        events_received = []
+
+        def callback(event):
+            events_received.append(event)
+
+        client.subscribe_event(EventType.STATE_CHANGE, callback)
+        client.subscribe_all_events(callback)
+        client.unsubscribe_event(EventType.STATE_CHANGE, callback)
+        client.unsubscribe_all_events(callback)
+
+        event = SeestarEvent(event_type=EventType.STATE_CHANGE, timestamp=datetime.now(), data={})
+        client._dispatch_event(event)
+        await asyncio.sleep(0)
+
+        assert events_received == []
+
     @pytest.mark.asyncio
     async def test_dispatch_handles_callback_exceptions(self, client):
         """Test that callback exceptions don't break event dispatch."""
@@ -223,7 +287,8 @@ class TestSeestarEventSystem:
         event = SeestarEvent(event_type=EventType.PROGRESS_UPDATE, timestamp=datetime.now(), data={})
 
         # Should not raise exception
-        await client._dispatch_event(event)
+        client._dispatch_event(event)
+        await asyncio.sleep(0)
 
         # Good callback should still be called
         assert good_callback.called is True
@@ -241,7 +306,7 @@ class TestSeestarEventSystem:
                 data={"state": "tracking"},
                 source_command="goto_target",
             )
-            await client._dispatch_event(event)
+            client._dispatch_event(event)
 
         # Start sending event in background
         asyncio.create_task(send_tracking_event())
@@ -259,6 +324,20 @@ class TestSeestarEventSystem:
 
         assert success is False
 
+    @pytest.mark.asyncio
+    async def test_wait_for_goto_complete_unsubscribes_on_cancel(self, client):
+        """Test that cancelling a wait removes its temporary callback."""
+        task = asyncio.create_task(client.wait_for_goto_complete(timeout=5.0))
+        await asyncio.sleep(0)
+        assert len(client._event_callbacks[EventType.STATE_CHANGE]) == 1
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert client._event_callbacks[EventType.STATE_CHANGE] == []
+        assert client._any_subscribers is False
+
     @pytest.mark.asyncio
     async def test_wait_for_focus_complete_success(self, client):
         """Test wait_for_focus_complete with successful focus."""
@@ -271,7 +350,7 @@ class TestSeestarEventSystem:
                 data={"operation": "autofocus", "success": True, "position": 1234.5},
                 source_command="auto_focus",
             )
-            await client._dispatch_event(event)
+            client._dispatch_event(event)
 
         asyncio.create_task(send_focus_complete_event())
 
@@ -296,7 +375,7 @@ class TestSeestarEventSystem:
                     timestamp=datetime.now(),
                     data={"frame": i, "total_frames": 5, "percent": i * 20},
                 )
-                await client._dispatch_event(event)
+                client._dispatch_event(event)
 
         asyncio.create_task(send_frame_events())
 